@@ -28,6 +28,10 @@ Ordinance Survery Grid Reference) grid references, see:
  - U{http://www.movable-type.co.uk/scripts/latlong-utm-mgrs.html}
  - U{http://www.movable-type.co.uk/scripts/latlong-os-gridref.html}
 
+Class I{LatLonArray} keeps many points compactly in arrays of lat-,
+longitudes and heights.  Function I{distanceMatrix} computes the distances between all pairs
+of I{LatLon} points, in blocks and optionally using multiple processes.
+
 An additional module provides Lambert conformal conic projections
 and positions, transcribed from:
 
@@ -41,6 +45,10 @@ and Visvalingam-Whyatt algorithms and modified versions of both:
  - U{http://hydra.hull.ac.uk/resources/hull:8338}
  - U{http://bost.ocks.org/mike/simplify/}
 
+With Python 3.7 and later, setting environment variable
+C{PYGEODESY_LAZY_IMPORT} to a non-empty value defers importing the
+sub-modules until any of their public names is first accessed.
+
 All modules have been statically checked* with
 U{PyChecker<https://pypi.python.org/pypi/pychecker>},
 U{PyFlakes<https://pypi.python.org/pypi/pyflakes>},
@@ -108,16 +116,6 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(__file__))  # XXX __path__[0]
     del os, sys
 
-# keep ellipsoidal and spherical modules as modules
-import ellipsoidalNvector  # PYCHOK false
-import ellipsoidalVincenty  # PYCHOK false
-import sphericalNvector  # PYCHOK false
-import sphericalTrigonometry  # PYCHOK false
-import nvector  # PYCHOK false
-import vector3d  # PYCHOK false
-
-VincentyError = ellipsoidalVincenty.VincentyError
-
 # all public contants, classes and functions
 __all__ = ('ellipsoidalNvector', 'ellipsoidalVincenty',
            'sphericalNvector', 'sphericalTrigonometry',
@@ -129,33 +127,122 @@ __version__ = '17.04.15'
 # see setup.py for similar logic
 version = '.'.join(map(str, map(int, __version__.split('.'))))
 
-# lift all public classes, constants, functions, etc. but
-# only from the following sub-modules ... (see also David
-# Beazley's <http://dabeaz.com/modulepackage/index.html>)
-from bases    import isclockwise  # PYCHOK expected
-from datum    import *  # PYCHOK __all__
-from dms      import *  # PYCHOK __all__
-from lcc      import *  # PYCHOK __all__
-from mgrs     import *  # PYCHOK __all__
-from osgr     import *  # PYCHOK __all__
-from simplify import *  # PYCHOK __all__
-from utils    import *  # PYCHOK __all__
-from utm      import *  # PYCHOK __all__
-
-import datum     # PYCHOK expected
-import dms       # PYCHOK expected
-import lcc       # PYCHOK expected
-import mgrs      # PYCHOK expected
-import osgr      # PYCHOK expected
-import simplify  # PYCHOK expected
-import utils     # PYCHOK expected
-import utm       # PYCHOK expected
-
-# concat __all__ with the public classes, constants,
-# functions, etc. from the sub-modules mentioned above
-for m in (datum, dms, lcc, mgrs, osgr, simplify, utils, utm):
-    __all__ += tuple(m.__all__)
-del m
+# (INTERNAL) Public names lifted from each sub-module, in order,
+# to import lazily (must match the __all__ of each sub-module)
+_lazy_lifted = (
+    ('datum',      ('R_KM', 'R_M', 'R_NM', 'R_SM', 'Datum', 'Ellipsoid', 'Transform',
+                    'Datums', 'Ellipsoids', 'Transforms',
+                    'convertDatum_many', 'to3llh_many', 'to3xyz_many')),
+    ('distmatrix', ('distanceMatrix',)),
+    ('dms',        ('F_D', 'F_DM', 'F_DMS', 'F_RAD', 'S_DEG', 'S_MIN', 'S_SEC', 'S_SEP',
+                    'bearingDMS', 'compassDMS', 'compassPoint', 'latDMS', 'lonDMS',
+                    'normDMS', 'parseDMS', 'parseDMS_many', 'parse3llh', 'parse3llh_many',
+                    'precision', 'toDMS', 'toDMS_many')),
+    ('lcc',        ('Conic', 'Conics', 'Lcc', 'toLatLonGrid', 'toLcc')),
+    ('mgrs',       ('Mgrs', 'cellChildren', 'cellMgrs', 'cellNeighbours', 'cellParent',
+                    'cellStr', 'parseMGRS', 'parseMGRS_many', 'toMgrs', 'toMgrs_many',
+                    'toMgrsCells')),
+    ('osgr',       ('Osgr', 'osgr_toLatLon_many', 'osgr_toStr_many', 'parseOSGR',
+                    'parseOSGR_many', 'toOsgr', 'toOsgr_many')),
+    ('points',     ('LatLon_', 'LatLonArray')),
+    ('simplify',   ('isimplify1', 'isimplify2', 'isimplifyRDP', 'simplify1', 'simplify2',
+                    'simplifyRDP', 'simplifyRDPm', 'simplifyVW', 'simplifyVWm')),
+    ('utils',      ('EPS', 'EPS1', 'EPS2', 'PI', 'PI2', 'PI_2', 'cbrt', 'cbrt2', 'degrees',
+                    'degrees90', 'degrees180', 'degrees360', 'false2f', 'favg', 'fdot',
+                    'fdot3', 'fStr', 'fsum', 'halfs', 'hsin', 'hypot1', 'hypot3', 'isint',
+                    'isscalar', 'len2', 'map1', 'map2', 'radians', 'radiansPI',
+                    'radiansPI2', 'radiansPI_2', 'tanPI_2_2', 'wrap90', 'wrap180',
+                    'wrap360', 'wrapPI', 'wrapPI2', 'wrapPI_2')),
+    ('utm',        ('Utm', 'UtmProjector', 'parseUTM', 'toUtm', 'toUtm_many',
+                    'utm_toLatLon_many')))
+
+
+def _lazy_import():
+    '''(INTERNAL) Use lazy imports if env variable PYGEODESY_LAZY_IMPORT
+       is set and supported, see U{PEP 562<https://www.python.org/dev/peps/pep-0562>}.
+
+       @return: True if lazy (bool).
+    '''
+    import os, sys  # PYCHOK expected
+    return bool(os.environ.get('PYGEODESY_LAZY_IMPORT', '')) and \
+                sys.version_info[:2] >= (3, 7)
+
+
+if _lazy_import():
+    # import sub-modules and lift public names on first access,
+    # such that the Datums, Conics, etc. registries and the
+    # ellipsoidal and spherical LatLon classes are only
+    # created once needed
+    _lazy_attrs = dict(VincentyError='ellipsoidalVincenty',
+                       isclockwise='bases')
+    for _m, _ns in _lazy_lifted:
+        __all__ += _ns
+        _lazy_attrs.update((_n, _m) for _n in _ns)
+    _lazy_modules = frozenset(__all__[:4] + ('nvector', 'vector3d', 'bases') +
+                              tuple(_m for _m, _ in _lazy_lifted))
+    del _m, _ns
+
+    def __getattr__(name):
+        '''(INTERNAL) Import a sub-module or public name lazily.
+        '''
+        from importlib import import_module
+
+        if name in _lazy_attrs:
+            v = getattr(import_module(_lazy_attrs[name]), name)
+        elif name in _lazy_modules:
+            v = import_module(name)
+        else:
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+        globals()[name] = v  # once
+        return v
+
+    def __dir__():
+        '''(INTERNAL) Include all lazily imported names.
+        '''
+        return sorted(set(globals()).union(__all__, _lazy_modules))
+
+else:
+    # keep ellipsoidal and spherical modules as modules
+    import ellipsoidalNvector  # PYCHOK false
+    import ellipsoidalVincenty  # PYCHOK false
+    import sphericalNvector  # PYCHOK false
+    import sphericalTrigonometry  # PYCHOK false
+    import nvector  # PYCHOK false
+    import vector3d  # PYCHOK false
+
+    VincentyError = ellipsoidalVincenty.VincentyError
+
+    # lift all public classes, constants, functions, etc. but
+    # only from the following sub-modules ... (see also David
+    # Beazley's <http://dabeaz.com/modulepackage/index.html>)
+    from bases    import isclockwise  # PYCHOK expected
+    from datum    import *  # PYCHOK __all__
+    from distmatrix import *  # PYCHOK __all__
+    from dms      import *  # PYCHOK __all__
+    from lcc      import *  # PYCHOK __all__
+    from mgrs     import *  # PYCHOK __all__
+    from osgr     import *  # PYCHOK __all__
+    from points   import *  # PYCHOK __all__
+    from simplify import *  # PYCHOK __all__
+    from utils    import *  # PYCHOK __all__
+    from utm      import *  # PYCHOK __all__
+
+    import datum     # PYCHOK expected
+    import distmatrix  # PYCHOK expected
+    import dms       # PYCHOK expected
+    import lcc       # PYCHOK expected
+    import mgrs      # PYCHOK expected
+    import osgr      # PYCHOK expected
+    import points    # PYCHOK expected
+    import simplify  # PYCHOK expected
+    import utils     # PYCHOK expected
+    import utm       # PYCHOK expected
+
+    # concat __all__ with the public classes, constants,
+    # functions, etc. from the sub-modules mentioned above
+    for m in (datum, distmatrix, dms, lcc, mgrs, osgr, points, simplify, utils, utm):
+        __all__ += tuple(m.__all__)
+    del m
 
 # try:  # remove private, INTERNAL modules
 #     del bases, ellipsoidalBase, sphericalBase  # PYCHOK expected
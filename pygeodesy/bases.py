@@ -25,6 +25,8 @@ __version__ = '17.04.09'
 class Base(object):
     '''(INTERNAL) Base class.
     '''
+    __slots__ = ()
+
     def __repr__(self):
         return self.toStr2()
 
@@ -103,10 +105,10 @@ class LatLonHeightBase(Base):
     '''(INTERNAL) Base class for LatLon points on
        spherical or ellipsiodal earth models.
     '''
-    _ab     = ()  #: (INTERNAL) Cache (lat, lon) radians (2-tuple)
-    _height = 0   #: (INTERNAL) Height (meter)
-    _lat    = 0   #: (INTERNAL) Latitude (degrees)
-    _lon    = 0   #: (INTERNAL) Longitude (degrees)
+    __slots__ = ('_ab',      # (INTERNAL) Cache (lat, lon) radians (2-tuple)
+                 '_height',  # (INTERNAL) Height (meter)
+                 '_lat',     # (INTERNAL) Latitude (degrees)
+                 '_lon')     # (INTERNAL) Longitude (degrees)
 
     def __init__(self, lat, lon, height=0):
         '''New LatLon.
@@ -126,8 +128,8 @@ class LatLonHeightBase(Base):
         '''
         self._lat = parseDMS(lat, suffix='NS')
         self._lon = parseDMS(lon, suffix='EW')
-        if height:  # elevation
-            self._height = float(height)
+        self._height = float(height) if height else 0  # elevation
+        self._ab = None
 
     def __eq__(self, other):
         return self.equals(other)
@@ -36,7 +36,8 @@ if not 1/2:  # PYCHOK 1/2 == 0
     raise ImportError('1/2 == %d' % (1/2,))
 
 from bases import Base, Named
-from utils import cbrt, cbrt2, fdot, fStr, radians
+from utils import _broadcast, cbrt, cbrt2, degrees90, degrees180, \
+                  fdot, fStr, radians
 
 from math import atanh, sqrt
 
@@ -49,7 +50,8 @@ R_SM = R_KM * 0.62137  #: Mean, spherical earth radius (statute miles).
 # all public contants, classes and functions
 __all__ = ('R_KM', 'R_M', 'R_NM', 'R_SM',  # constants
            'Datum',  'Ellipsoid',  'Transform',  # classes
-           'Datums', 'Ellipsoids', 'Transforms')  # enum-like
+           'Datums', 'Ellipsoids', 'Transforms',  # enum-like
+           'convertDatum_many', 'to3llh_many', 'to3xyz_many')  # functions
 __version__ = '17.04.14'
 
 
@@ -451,6 +453,25 @@ class Transform(_Based):
                          tx=-self.tx, ty=-self.ty, tz=-self.tz,
                          sx=-self.sx, sy=-self.sy, sz=-self.sz, s=-self.s)
 
+    def _m12(self, inverse=False):
+        '''(INTERNAL) Get this transform as translation plus 3x3 matrix.
+
+           @keyword inverse: Direction, forward or inverse (bool).
+
+           @return: 12-Tuple (tx, m00, m01, m02, ty, m10, m11, m12,
+                    tz, m20, m21, m22), by row.
+        '''
+        if inverse:  # see transform
+            s1 = 2 - self.s1  # 1 - s * 1.e-6
+            return (-self.tx,       s1,  self.rz, -self.ry,
+                    -self.ty, -self.rz,       s1,  self.rx,
+                    -self.tz,  self.ry, -self.rx,       s1)
+        else:
+            s1 = self.s1
+            return (self.tx,       s1, -self.rz,  self.ry,
+                    self.ty,  self.rz,       s1, -self.rx,
+                    self.tz, -self.ry,  self.rx,       s1)
+
     def toStr(self, prec=4):  # PYCHOK expected
         '''Return this transform as a string.
 
@@ -485,6 +506,44 @@ class Transform(_Based):
                 fdot(xyz, self.ty,  self.rz,      _s1, -self.rx),
                 fdot(xyz, self.tz, -self.ry,  self.rx,      _s1))
 
+    def transform_many(self, xyz, inverse=False, inplace=False):
+        '''Transform many (geocentric) Cartesian points, forward or inverse.
+
+           The translation, rotation and scale are applied as one 3x3
+           matrix multiply plus offset for each point, in a single pass.
+           Unlike L{transform}, the products are summed in plain floating
+           point, not with C{fsum}.
+
+           @param xyz: Points as x, y, z (sequence of 3-sequences).
+           @keyword inverse: Direction, forward or inverse (bool).
+           @keyword inplace: Store the results back into each point,
+                             which must be mutable like a list or
+                             array (bool).
+
+           @return: The transformed points as 3-tuples (x, y, z) (list)
+                    or if I{inplace}, the I{xyz} points.
+
+           @example:
+
+           >>> xyz = [[3980581.21, -111.159, 4966824.522]]
+           >>> Transforms.OSGB36.transform_many(xyz, inplace=True)
+        '''
+        tx, m00, m01, m02, \
+        ty, m10, m11, m12, \
+        tz, m20, m21, m22 = self._m12(inverse)
+
+        if inplace:
+            for p in xyz:
+                x, y, z = p[0], p[1], p[2]
+                p[0] = tx + m00 * x + m01 * y + m02 * z
+                p[1] = ty + m10 * x + m11 * y + m12 * z
+                p[2] = tz + m20 * x + m21 * y + m22 * z
+            return xyz
+        else:
+            return [(tx + m00 * x + m01 * y + m02 * z,
+                     ty + m10 * x + m11 * y + m12 * z,
+                     tz + m20 * x + m21 * y + m22 * z) for x, y, z in xyz]
+
 
 # <https://en.wikipedia.org/wiki/Helmert_transformation> from WGS84
 Transforms._assert(
@@ -631,6 +690,156 @@ Datums._assert(
 )
 
 
+_LRU = 16  #: (INTERNAL) Number of cached transforms.
+_Helmert12s = []  #: (INTERNAL) Transform cache, most recent first.
+
+
+def _helmert12(datum1, datum2):
+    '''(INTERNAL) Get the Helmert transform to convert from one datum
+       to an other as translation plus 3x3 matrix, see L{Transform._m12}.
+
+       Conversions between two datums other than WGS84 compose the
+       inverse transform to WGS84 and the transform from WGS84 into
+       a single one.  The results for the most recently used datum
+       pairs are cached.
+
+       @param datum1: Datum to convert from (L{Datum}).
+       @param datum2: Datum to convert to (L{Datum}).
+
+       @return: 12-Tuple (tx, m00, m01, m02, ty, m10, ..., m22)
+                or None if both datums are equal.
+    '''
+    Ms = _Helmert12s
+    for i, (d1, d2, m) in enumerate(Ms):  # Datums aren't hashable
+        if d1 is datum1 and d2 is datum2:
+            if i:  # move to front
+                Ms.insert(0, Ms.pop(i))
+            return m
+
+    if datum1 == datum2:
+        m = None
+    elif datum1 == Datums.WGS84:
+        m = datum2.transform._m12()
+    elif datum2 == Datums.WGS84:  # inverse
+        m = datum1.transform._m12(True)
+    else:  # to WGS84 and from WGS84 in one
+        a, b = datum2.transform._m12(), datum1.transform._m12(True)
+        m = []
+        for r in (0, 4, 8):  # a * b
+            t, a0, a1, a2 = a[r:r + 4]
+            m.append(t + a0 * b[0] + a1 * b[4] + a2 * b[8])
+            for c in (1, 2, 3):
+                m.append(a0 * b[c] + a1 * b[4 + c] + a2 * b[8 + c])
+        m = tuple(m)
+
+    Ms.insert(0, (datum1, datum2, m))
+    del Ms[_LRU:]
+    return m
+
+
+def _xyz12(m, x, y, z):
+    '''(INTERNAL) Apply a L{_helmert12} transform to one point.
+    '''
+    return (m[0] + m[1] * x + m[2]  * y + m[3]  * z,
+            m[4] + m[5] * x + m[6]  * y + m[7]  * z,
+            m[8] + m[9] * x + m[10] * y + m[11] * z)
+
+
+def convertDatum_many(lats, lons, toDatum, datum=Datums.WGS84, heights=0):
+    '''Convert many lat-/longitudes from one datum to an other.
+
+       Each point is converted as by L{LatLonEllipsoidalBase.convertDatum},
+       but without creating any L{LatLon} or L{Cartesian} instances and
+       with a single, composed Helmert transform for each datum pair.
+
+       @param lats: Latitudes (degrees[] or degrees).
+       @param lons: Longitudes (degrees[] or degrees).
+       @param toDatum: Datum to convert to (L{Datum}).
+       @keyword datum: Datum to convert from (L{Datum}).
+       @keyword heights: Heights (meter[] or meter).
+
+       @return: 3-Tuple (lats, lons, heights) with lists of lat-,
+                longitudes and heights (degrees90, degrees180, meter).
+
+       @raise ValueError: Unequal number of lat-, longitudes or heights.
+
+       @example:
+
+       >>> lats, lons, hs = convertDatum_many((51.4778,), (-0.0016,), Datums.OSGB36)
+    '''
+    from ellipsoidalBase import _llh2xyz, _xyz2llh  # PYCHOK recursive import
+
+    n, abhs = _broadcast(lats, lons, heights)
+    as_, bs, hs = [0] * n, [0] * n, [0] * n
+
+    m = _helmert12(datum, toDatum)
+    E1, E2 = datum.ellipsoid, toDatum.ellipsoid
+    for i, (a, b, h) in enumerate(abhs):
+        if m:
+            x, y, z = _llh2xyz(radians(a), radians(b), h, E1)
+            a, b, h = _xyz2llh(*_xyz12(m, x, y, z), E=E2)
+            a, b = degrees90(a), degrees180(b)
+        as_[i], bs[i], hs[i] = a, b, h
+
+    return as_, bs, hs
+
+
+def to3llh_many(xyz, datum=Datums.WGS84):
+    '''Convert many (geocentric) Cartesian x/y/z points to
+       (ellipsoidal geodetic) lat-, longitude and height.
+
+       Each point is converted as by L{CartesianBase.to3llh} using
+       Bowring's formulation, but without creating any L{Cartesian}
+       instances.
+
+       @param xyz: Points as x, y, z (sequence of 3-sequences).
+       @keyword datum: Datum to use (L{Datum}).
+
+       @return: 3-Tuple (lats, lons, heights) with lists of lat-,
+                longitudes and heights (degrees90, degrees180, meter).
+
+       @example:
+
+       >>> lats, lons, hs = to3llh_many([(4027893.924, 307041.993, 4919474.294)])
+    '''
+    from ellipsoidalBase import _xyz2llh  # PYCHOK recursive import
+
+    n, E = len(xyz), datum.ellipsoid
+    as_, bs, hs = [0] * n, [0] * n, [0] * n
+    for i, (x, y, z) in enumerate(xyz):
+        a, b, h = _xyz2llh(x, y, z, E)
+        as_[i], bs[i], hs[i] = degrees90(a), degrees180(b), h
+
+    return as_, bs, hs
+
+
+def to3xyz_many(lats, lons, datum=Datums.WGS84, heights=0):
+    '''Convert many (ellipsoidal geodetic) lat-, longitudes and
+       heights to (geocentric) Cartesian x/y/z points.
+
+       Each point is converted as by L{LatLonEllipsoidalBase.to3xyz},
+       but without creating any L{LatLon} instances.
+
+       @param lats: Latitudes (degrees[] or degrees).
+       @param lons: Longitudes (degrees[] or degrees).
+       @keyword datum: Datum to use (L{Datum}).
+       @keyword heights: Heights (meter[] or meter).
+
+       @return: The points as 3-tuples (x, y, z) in (meter) (list).
+
+       @raise ValueError: Unequal number of lat-, longitudes or heights.
+
+       @example:
+
+       >>> xyz = to3xyz_many((50.7978, 51.4778), (4.3592, -0.0016))
+    '''
+    from ellipsoidalBase import _llh2xyz  # PYCHOK recursive import
+
+    E = datum.ellipsoid
+    n, abhs = _broadcast(lats, lons, heights)
+    return [_llh2xyz(radians(a), radians(b), h, E) for a, b, h in abhs]
+
+
 if __name__ == '__main__':
 
     # print all
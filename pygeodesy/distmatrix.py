@@ -0,0 +1,245 @@
+
+# -*- coding: utf-8 -*-
+
+'''Function L{distanceMatrix} to compute the distances between all
+pairs of LatLon points of one or between two lists, sequences or
+tuples of LatLon points.
+
+The distances are computed in square blocks of at most I{chunk} by
+I{chunk} pairs, using the I{haversine} formula, the angle between
+I{nvector}s or Vincenty's inverse method on an ellipsoidal earth
+model.  The trigonometric terms of each point are computed only
+once and not for every pair.  Optionally, the blocks are distributed
+over a pool of I{processes}.
+
+The distance matrix is returned as a list of rows, each a list of
+distances, or stored into any given, pre-allocated I{out} matrix
+which supports C{out[i][j] = distance} item assignment, like a list
+of lists, a C{list} of C{array.array}s or a 2-dimensional NumPy array
+or memmap.  For all-pairs distances, only the upper triangle blocks
+are computed and copied into the lower triangle.
+
+Pairs of points for which Vincenty's method fails to converge, like
+nearly antipodal ones, don't abort the matrix.  Their distance is
+C{NAN} and the L{VincentyError} is optionally reported, by row and
+column index.
+
+@newfield example: Example, Examples
+'''
+
+from datum import Datums, R_M
+from points import LatLonArray
+from utils import EPS, PI, hsin, len2
+
+from math import atan2, cos, hypot, radians, sin, sqrt
+
+NAN = float('nan')  #: (INTERNAL) Distance of failed pairs (float).
+
+__all__ = ('distanceMatrix',)
+__version__ = '17.04.15'
+
+
+def _haversine(ps, qs, radius):
+    '''(INTERNAL) Haversine distances block.
+    '''
+    ds = []
+    for a1, b1, c1 in ps:
+        d = []
+        for a2, b2, c2 in qs:
+            h = hsin(a2 - a1) + c1 * c2 * hsin(b2 - b1)  # haversine
+            try:
+                r = atan2(sqrt(h), sqrt(1 - h)) * 2
+            except ValueError:
+                r = 0 if h < 0.5 else PI
+            d.append(r * radius)
+        ds.append(d)
+    return ds, {}
+
+
+def _nvector(ps, qs, radius):
+    '''(INTERNAL) N-vector angle distances block.
+    '''
+    ds = []
+    for x1, y1, z1 in ps:
+        d = []
+        for x2, y2, z2 in qs:
+            x = y1 * z2 - z1 * y2  # cross product
+            y = z1 * x2 - x1 * z2
+            z = x1 * y2 - y1 * x2
+            d.append(atan2(hypot(hypot(x, y), z),
+                           x1 * x2 + y1 * y2 + z1 * z2) * radius)
+        ds.append(d)
+    return ds, {}
+
+
+def _vincenty(ps, qs, datum):
+    '''(INTERNAL) Vincenty distances block and errors by
+       block row and column index.
+    '''
+    from ellipsoidalVincenty import distances, \
+                                   VincentyError  # PYCHOK recursive import
+
+    lats, lons = zip(*qs)
+    ds, xs = [], {}
+    for i, (a, b) in enumerate(ps):
+        d, _, _, es = distances(a, b, lats, lons, datum=datum)
+        if es:
+            a1, c1 = radians(a), cos(radians(a))
+            for j in es.keys():
+                a2 = radians(lats[j])
+                h = hsin(a2 - a1) + c1 * cos(a2) * hsin(radians(lons[j] - b))
+                # Vincenty also flags (nearly) antipodal
+                # points coincident, hence the haversine
+                if h < EPS:
+                    d[j] = 0.0  # coincident
+                else:
+                    d[j] = NAN
+                    xs[i, j] = VincentyError('no convergence (%s, %s) to (%s, %s)' %
+                                             (a, b, lats[j], lons[j]))
+        ds.append(d)
+    return ds, xs
+
+
+_Methods = {'haversine': _haversine,
+            'nvector':   _nvector,
+            'vincenty':  _vincenty}
+
+
+def _block(args):
+    '''(INTERNAL) Compute one block, picklable for multiprocessing.
+    '''
+    m, i, ps, j, qs, r = args
+    return (i, j) + _Methods[m](ps, qs, r)
+
+
+def _prep(points, method):
+    '''(INTERNAL) Pre-compute the terms of all points.
+    '''
+    if isinstance(points, LatLonArray):  # use arrays as-is
+        ps = zip(points.lats, points.lons)
+    else:
+        _, ps = len2(points)
+        ps = ((p.lat, p.lon) for p in ps)
+    if method == 'haversine':
+        ps = [(a, radians(b), cos(a)) for a, b in
+              ((radians(a), b) for a, b in ps)]
+    elif method == 'nvector':  # see LatLonHeightBase.to3xyz
+        ps = [(ca * cos(b), ca * sin(b), sin(a)) for a, b, ca in
+              ((radians(a), radians(b), cos(radians(a))) for a, b in ps)]
+    else:
+        ps = list(ps)
+    return ps
+
+
+def distanceMatrix(points1, points2=None, method='haversine', radius=R_M,
+                   datum=Datums.WGS84, chunk=256, processes=0, out=None,
+                   errors=None):
+    '''Compute the distances between all points of one or between
+       the points of two lists, sequences or tuples of LatLon points.
+
+       @param points1: The first points (LatLon[] or L{LatLonArray}).
+       @keyword points2: The second points (LatLon[] or L{LatLonArray}) or None for
+                         the distances between all I{points1}.
+       @keyword method: The distance formula, 'haversine', 'nvector'
+                        or 'vincenty' (string).
+       @keyword radius: Mean earth radius for methods 'haversine'
+                        and 'nvector' (meter).
+       @keyword datum: Datum for method 'vincenty' (L{Datum}).
+       @keyword chunk: Maximum block size, rows and columns (int).
+       @keyword processes: Number of worker processes or 0 for
+                           none (int).
+       @keyword out: Optional, pre-allocated N by M matrix, where
+                     N = len(points1) and M = len(points2).
+       @keyword errors: Optional dict to receive the L{VincentyError}
+                        of each pair failing to converge, keyed by
+                        2-tuple (row, column) index (dict).
+
+       @return: Distance matrix I{out} or a list of N rows, each a
+                list of M distances (in the same units as radius
+                respectively the datum's axes), C{NAN} for pairs
+                failing to converge.
+
+       @raise ValueError: Invalid method or chunk.
+
+       @example:
+
+       >>> from pygeodesy import distanceMatrix
+       >>> ds = distanceMatrix(stores, customers, method='vincenty')
+       >>> ds[0][1]  # distance between stores[0] and customers[1]
+    '''
+    if method not in _Methods:
+        raise ValueError('%s invalid: %r' % ('method', method))
+    if chunk < 1:
+        raise ValueError('%s invalid: %r' % ('chunk', chunk))
+
+    r = datum if method == 'vincenty' else float(radius)
+    ps = _prep(points1, method)
+    if points2 is None:  # all pairs
+        qs = ps
+    else:
+        qs = _prep(points2, method)
+    n, m = len(ps), len(qs)
+
+    if out is None:
+        out = [[0.0] * m for _ in range(n)]
+
+    # upper triangle blocks only if all pairs
+    args = ((method, i, ps[i:i + chunk],
+                     j, qs[j:j + chunk], r)
+            for i in range(0, n, chunk)
+            for j in range(i if qs is ps else 0, m, chunk))
+
+    if processes > 0 and n * m > chunk * chunk:
+        from multiprocessing import Pool
+        p = Pool(processes)
+        try:
+            _out(out, p.imap_unordered(_block, args), qs is ps, errors)
+            p.close()
+        finally:
+            p.terminate()
+            p.join()
+    else:
+        _out(out, map(_block, args), qs is ps, errors)
+    return out
+
+
+def _out(out, ijdxs, tri, errors):
+    '''(INTERNAL) Store blocks into the distance matrix
+       and any errors into the errors dict.
+    '''
+    for i, j, ds, xs in ijdxs:
+        for k, d in enumerate(ds, i):
+            r = out[k]
+            for t, d in enumerate(d, j):
+                r[t] = d
+        if tri and j != i:  # copy into lower triangle
+            for k, d in enumerate(ds, i):
+                for t, d in enumerate(d, j):
+                    out[t][k] = d
+        if xs and errors is not None:
+            for (k, t), x in xs.items():
+                errors[i + k, j + t] = x
+                if tri and j != i:
+                    errors[j + t, i + k] = x
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
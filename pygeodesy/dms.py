@@ -12,6 +12,7 @@ and <http://www.movable-type.co.uk/scripts/latlong-vectors.html>
 '''
 
 from math import radians
+import re
 try:
     from string import letters as LETTERS
 except ImportError:  # Python 3+
@@ -22,7 +23,8 @@ __all__ = ('F_D', 'F_DM', 'F_DMS', 'F_RAD',  # format contants
            'S_DEG', 'S_MIN', 'S_SEC', 'S_SEP',  # symbols
            'bearingDMS', 'compassDMS', 'compassPoint',  # functions
            'latDMS', 'lonDMS', 'normDMS',
-           'parseDMS', 'parse3llh', 'precision', 'toDMS')
+           'parseDMS', 'parseDMS_many', 'parse3llh', 'parse3llh_many',
+           'precision', 'toDMS', 'toDMS_many')
 __version__ = '17.03.20'
 
 F_D   = 'd'    #: Format degrees as deg° (string).
@@ -42,6 +44,36 @@ _S_norm = {'^': S_DEG, '˚': S_DEG,  #: (INTERNAL) normalized DMS.
            '"': S_SEC, '″': S_SEC, '”': S_SEC}
 _S_ALL  = (S_DEG, S_MIN, S_SEC) + tuple(_S_norm.keys())  #: (INTERNAL) alternates.
 
+# (INTERNAL) Precompiled, single-pass DMS matcher for the common
+# forms: optional sign, up to 3 unsigned numbers separated by any
+# symbol(s) or space(s) and an optional compass letter.  Other
+# forms are left to the general parser, see function parseDMS.
+_S_RE   = r'(?:\s|%s)' % ('|'.join(map(re.escape, _S_ALL)),)
+_N_RE   = r'(\d+(?:\.\d*)?|\.\d+)'
+_DMS_RE = re.compile(r'^\s*([-+]?)\s*%s(?:%s+%s(?:%s+%s)?)?%s*([A-Z]?)\s*$' %
+                     (_N_RE, _S_RE, _N_RE, _S_RE, _N_RE, _S_RE))
+
+
+def _dms(strDMS, suffix):
+    '''(INTERNAL) Parse DMS in one of the common forms, see L{parseDMS}.
+
+       @return: Degrees (float) or None if not a common form.
+    '''
+    r = None if S_SEP else _DMS_RE.match(strDMS)
+    if r:
+        s, d, m, x, S = r.groups()
+        if S in suffix.upper():
+            d = float(d)
+            if m:
+                m = float(m)
+                if x:
+                    m += float(x) / 60.0
+                d += m / 60.0
+            if s == '-' or S in ('S', 'W'):
+                d = -d
+            return d
+    return None
+
 
 def _toDMS(deg, form, prec, ddd):
     '''(INTERNAL) Converts degrees to string, without sign or suffix.
@@ -233,7 +265,7 @@ def parse3llh(strll, height=0, sep=','):
     else:
         h = height
     if len(ll) != 2:
-        return ValueError('parsing %r failed' % (strll,))
+        raise ValueError('parsing %r failed' % (strll,))
 
     a, b = [_.strip() for _ in ll]
     if a[-1:] in 'EW' or b[-1:] in 'NS':
@@ -241,6 +273,36 @@ def parse3llh(strll, height=0, sep=','):
     return parseDMS(a, suffix='NS'), parseDMS(b, suffix='EW'), h
 
 
+def parse3llh_many(strlls, height=0, sep=','):
+    '''Parse many strings, each representing a lat-, longitude
+       and height point.
+
+       Each string is parsed like L{parse3llh}.
+
+       @param strlls: Lat, lon[, height] (string[]).
+       @keyword height: Default for missing heights (meter).
+       @keyword sep: Optional, separator (string).
+
+       @return: 4-Tuple (lats, lons, heights, errors) with lists
+                of lat-, longitudes and heights (scalars), None
+                for invalid strings and a dict of the ValueError
+                of each invalid string, by index.
+
+       @example:
+
+       >>> lats, lons, hs, xs = parse3llh_many(('51.4778N, 0.0015W',
+                                               '50°03′59″N, 005°42′53″W, 10'))
+    '''
+    n = len(strlls)
+    as_, bs, hs, xs = [None] * n, [None] * n, [None] * n, {}
+    for i, s in enumerate(strlls):
+        try:
+            as_[i], bs[i], hs[i] = parse3llh(s, height=height, sep=sep)
+        except (AttributeError, TypeError, ValueError):
+            xs[i] = ValueError('parsing %r failed' % (s,))
+    return as_, bs, hs, xs
+
+
 def parseDMS(strDMS, suffix='NSEW'):
     '''Parse a string representing deg° min' sec" into degrees.
 
@@ -263,6 +325,10 @@ def parseDMS(strDMS, suffix='NSEW'):
     except ValueError:
         pass
 
+    d = _dms(strDMS, suffix)  # common forms, like 51°28′40″N
+    if d is not None:
+        return d
+
     try:
         strDMS = strDMS.strip()
 
@@ -285,6 +351,34 @@ def parseDMS(strDMS, suffix='NSEW'):
     return d
 
 
+def parseDMS_many(strDMSs, suffix='NSEW'):
+    '''Parse many strings representing deg° min' sec" into degrees.
+
+       Each string is parsed like L{parseDMS}.
+
+       @param strDMSs: Degrees in any of several forms (string[]).
+       @keyword suffix: Optional, valid compass directions (NEWS).
+
+       @return: 2-Tuple (degs, errors) with a list of degrees (float),
+                None for invalid strings and a dict of the ValueError
+                of each invalid string, by index.
+
+       @example:
+
+       >>> ds, xs = parseDMS_many(('51.4778', '51°28′40.12″N', "3° 37' 09\"W"))
+    '''
+    n = len(strDMSs)
+    ds, xs = [None] * n, {}
+    for i, s in enumerate(strDMSs):
+        try:
+            ds[i] = parseDMS(s, suffix=suffix)
+        except ValueError as x:
+            xs[i] = x
+        except (AttributeError, TypeError):  # None, etc.
+            xs[i] = ValueError('parsing %r failed' % (s,))
+    return ds, xs
+
+
 def precision(form, prec=None):
     '''Sets the default precison for a given F_ form.
 
@@ -322,6 +416,104 @@ def toDMS(deg, form=F_DMS, prec=2, ddd=2, neg='-', pos=''):
     s = neg if deg < 0 else pos
     return s + t
 
+
+def toDMS_many(degs, form=F_DMS, prec=2, ddd=2, neg='-', pos='',
+                     suffix='', file=None, sep='\n'):
+    '''Converts many signed degrees to strings.
+
+       Each value is formatted like L{toDMS}, with identical rounding,
+       but with the format set up only once and one format operation
+       per value, except when trailing decimal zeros are stripped.
+
+       @param degs: Degrees to be formatted (scalar[]).
+       @keyword form: F_D, F_DM, F_DMS or F_RAD for deg°, deg°min′, deg°min′sec″ or radians.
+       @keyword prec: Optional, number of decimal digits (0..9 or None).
+       @keyword ddd: Optional, number of digits for deg° (2 or 3).
+       @keyword neg: Optional, sign for negative degrees ('-').
+       @keyword pos: Optional, sign for positive degrees ('').
+       @keyword suffix: Optional, 2-letter suffix for positive and
+                        negative degrees, like 'NS' or 'EW' (string).
+       @keyword file: Optional, file-like object to write the strings
+                      to instead of returning them (with write method).
+       @keyword sep: Terminator written after each string (string).
+
+       @return: Degrees per the specified form (string[]) or the
+                number of strings written to I{file} (int).
+
+       @raise ValueError: Invalid degrees or suffix.
+
+       @example:
+
+       >>> ts = toDMS_many((45.7626, -0.0015), neg='', suffix='NS')  # ['45°45′45.36″N', '00°00′05.4″S']
+       >>> n = toDMS_many(lons, F_D, prec=4, ddd=3, neg='', suffix='EW', file=sys.stdout)
+    '''
+    if suffix:
+        if len(suffix) != 2:
+            raise ValueError('%s invalid: %r' % ('suffix', suffix))
+        P, N = suffix
+    else:
+        P = N = ''
+
+    z = _F_prec.get(form, 6) if prec is None else int(prec)
+    p = abs(z)
+    w = p + (1 if p else 0)
+
+    f, r = form.lower(), None
+    if f in (F_D, 'deg'):
+        t, s, n = '%%0%d.%df' % (ddd + w, p), S_DEG, 0
+    elif f in (F_RAD, 'radians'):
+        t, s, n, r = '%%.%df' % (p,), '', 0, radians
+    elif f in (F_DM, 'deg+min'):
+        t, s, n = '%%0%dd%s%s%%0%d.%df' % (ddd, S_DEG, S_SEP, w + 2, p), S_MIN, 60
+    else:  # F_DMS, 'deg+min+sec'
+        t, s, n = '%%0%dd%s%s%%02d%s%s%%0%d.%df' % (ddd, S_DEG, S_SEP,
+                                                    S_MIN, S_SEP, w + 2, p), S_SEC, 3600
+
+    z = (z - 1) if z > 1 else 0  # decimal zeros to strip, except one
+    if z:  # strip, then add sign, symbol and suffix
+        fmts = t, t
+    else:  # sign, symbol and suffix in the format
+        fmts = pos + t + s + P, neg + t + s + N
+
+    c = 0  # number of strings written
+    ts = []
+    for deg in degs:
+        try:
+            d = float(deg)
+        except (TypeError, ValueError):
+            raise ValueError('%s invalid: %r' % ('deg', deg))
+        m = d < 0
+        d = abs(d)
+        if n == 0:
+            if r:
+                d = r(d)
+            t = fmts[m] % (d,)
+        elif n == 60:
+            d, x = divmod(d * 60, 60)
+            t = fmts[m] % (int(d), x)
+        else:
+            d, x = divmod(d * 3600, 3600)
+            x, y = divmod(x, 60)
+            t = fmts[m] % (int(d), int(x), y)
+
+        if z:
+            if t.endswith('0'):
+                t = t[:-z] + t[-z:].rstrip('0')
+            t = (neg + t + s + N) if m else (pos + t + s + P)
+        ts.append(t)
+
+        if file is not None and len(ts) > 1023:
+            file.write(sep.join(ts) + sep)
+            c += len(ts)
+            ts = []
+
+    if file is None:
+        return ts
+    if ts:
+        file.write(sep.join(ts) + sep)
+        c += len(ts)
+    return c
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
@@ -12,9 +12,9 @@ U{http://www.movable-type.co.uk/scripts/geodesy/docs/latlon-ellipsoidal.js.html}
 '''
 
 from bases import LatLonHeightBase
-from datum import Datum, Datums
+from datum import Datum, Datums, _helmert12, _xyz12
 from dms import parse3llh
-from utils import EPS, degrees90, degrees180, hypot1
+from utils import EPS, PI_2, degrees90, degrees180, hypot1
 from vector3d import Vector3d
 
 from math import atan2, copysign, cos, hypot, sin, sqrt
@@ -24,22 +24,13 @@ from math import atan2, copysign, cos, hypot, sin, sqrt
 __all__ = ('CartesianBase', 'LatLonEllipsoidalBase')
 __version__ = '17.04.09'
 
+_WGS84 = Datums.WGS84  #: (INTERNAL) Default datum (L{Datum}).
+
 
 class CartesianBase(Vector3d):
     '''(INTERNAL) Base class for ellipsoidal Cartesians.
     '''
-
-    def _applyHelmert(self, transform, inverse=False):
-        '''(INTERNAL) Return a new (geocentric) Cartesian point
-           by applying a Helmert transform to this point.
-
-           @param transform: Transform to apply (L{Transform}).
-           @keyword inverse: Apply inverse Helmert transform (bool).
-
-           @return: The transformed point (L{Cartesian}).
-        '''
-        x, y, z = self.to3xyz()
-        return self.topsub(*transform.transform(x, y, z, inverse))
+    __slots__ = ()
 
     def to3llh(self, datum=Datums.WGS84):
         '''Converts this (geocentric) Cartesian (x/y/z) point to
@@ -64,38 +55,9 @@ class CartesianBase(Vector3d):
            @return: 3-Tuple (lat, lon, heigth) in (degrees90,
                     degrees180, meter).
         '''
-        E = datum.ellipsoid
         x, y, z = self.to3xyz()
-
-        p = hypot(x, y)  # distance from minor axis
-        r = hypot(p, z)  # polar radius
-
-        if min(p, r) > EPS:
-            # parametric latitude (Bowring eqn 17, replaced)
-            t = (E.b * z) / (E.a * p) * (1 + E.e22 * E.b / r)
-            c = 1 / hypot1(t)
-            s = t * c
-
-            # geodetic latitude (Bowring eqn 18)
-            a = atan2(z + E.e22 * E.b * s * s * s,
-                      p - E.e2  * E.a * c * c * c)
-            b = atan2(y, x)  # ... and longitude
-
-            # height above ellipsoid (Bowring eqn 7)
-            ca, sa = cos(a), sin(a)
-#           r = E.a / E.e2s2(sa)  # length of normal terminated by minor axis
-#           h = p * ca + z * sa - (E.a * E.a / r)
-            h = p * ca + z * sa - (E.a * E.e2s2(sa))
-
-            a, b = degrees90(a), degrees180(b)
-
-        # see <http://GIS.StackExchange.com/questions/28446/>
-        elif p > EPS:  # latitude arbitrarily zero
-            a, b, h = 0.0, degrees180(atan2(y, x)), p - E.a
-        else:  # polar latitude, longitude arbitrarily zero
-            a, b, h = copysign(90.0, z), 0.0, abs(z) - E.b
-
-        return a, b, h
+        a, b, h = _xyz2llh(x, y, z, datum.ellipsoid)
+        return degrees90(a), degrees180(b), h
 
     def toStr(self, prec=3, fmt='[%s]', sep=', '):  # PYCHOK expected
         '''String representation of this cartesion.
@@ -112,9 +74,9 @@ class CartesianBase(Vector3d):
 class LatLonEllipsoidalBase(LatLonHeightBase):
     '''(INTERNAL) Base class for ellipsoidal LatLons.
     '''
-    _datum = Datums.WGS84  #: (INTERNAL) Datum (L{Datum}).
-    _osgr  = None  #: (INTERNAL) cache toOsgr ({Osgr}).
-    _utm   = None  #: (INTERNAL) cache toUtm (L{Utm}).
+    __slots__ = ('_datum',  # (INTERNAL) Datum (L{Datum}).
+                 '_osgr',   # (INTERNAL) cache toOsgr ({Osgr}).
+                 '_utm')    # (INTERNAL) cache toUtm (L{Utm}).
 
     def __init__(self, lat, lon, height=0, datum=None):
         '''Create an (ellipsoidal) LatLon point frome the given
@@ -130,6 +92,8 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
 
            >>> p = LatLon(51.4778, -0.0016)  # height=0, datum=Datums.WGS84
         '''
+        self._datum = _WGS84
+        self._osgr = self._utm = None
         LatLonHeightBase.__init__(self, lat, lon, height=height)
         if datum:  # check datum
             self.datum = datum
@@ -151,21 +115,15 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
            >>> pWGS84 = LatLon(51.4778, -0.0016)  # default Datums.WGS84
            >>> pOSGB  = pWGS84.convertDatum(Datums.OSGB36)  # 51.477284°N, 000.00002°E
         '''
-        if self.datum == toDatum:
+        m = _helmert12(self.datum, toDatum)
+        if m is None:
             return self.copy()
 
-        elif self.datum == Datums.WGS84:
-            # converting from WGS 84
-            ll, t, i = self, toDatum.transform, False
-
-        elif toDatum == Datums.WGS84:
-            # converting to WGS84, use inverse transform
-            ll, t, i = self, self.datum.transform, True
-
-        else:  # neither self.datum nor toDatum is WGS84, convert to WGS84 first
-            ll, t, i = self.convertDatum(Datums.WGS84), toDatum.transform, False
-
-        return ll.toCartesian()._applyHelmert(t, i).toLatLon(datum=toDatum)
+        # neither self.datum nor toDatum WGS84 converts via
+        # WGS84 by a single, composed and cached transform
+        c = self.toCartesian()
+        c = c.topsub(*_xyz12(m, *c.to3xyz()))
+        return c.toLatLon(datum=toDatum)
 
     toDatum = convertDatum  # alternate name
 
@@ -270,17 +228,7 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
            @return: 3-Tuple (x, y, z) in (meter).
         '''
         a, b = self.to2ab()
-        sa = sin(a)
-
-        E = self.ellipsoid()
-        # radius of curvature in prime vertical
-        r = E.a / sqrt(1 - E.e2 * sa * sa)
-
-        h = self.height
-        t = (h + r) * cos(a)
-        return (t * cos(b),
-                t * sin(b),
-               (h + r * E.e12) * sa)
+        return _llh2xyz(a, b, self.height, self.ellipsoid())
 
     def toOsgr(self):
         '''Convert this lat-/longitude to an OSGR coordinate.
@@ -308,6 +256,67 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
             self._utm._latlon = self
         return self._utm
 
+
+def _llh2xyz(a, b, h, E):
+    '''(INTERNAL) Convert geodetic lat-, longitude and height to
+       geocentric x, y and z, see L{LatLonEllipsoidalBase.to3xyz}.
+
+       @param a: Latitude (radians).
+       @param b: Longitude (radians).
+       @param h: Height (meter).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: 3-Tuple (x, y, z) in (meter).
+    '''
+    sa = sin(a)
+    # radius of curvature in prime vertical
+    r = E.a / sqrt(1 - E.e2 * sa * sa)
+
+    t = (h + r) * cos(a)
+    return (t * cos(b),
+            t * sin(b),
+           (h + r * E.e12) * sa)
+
+
+def _xyz2llh(x, y, z, E):
+    '''(INTERNAL) Convert geocentric x, y and z to geodetic lat-,
+       longitude and height, see L{CartesianBase.to3llh}.
+
+       @param x: X coordinate (meter).
+       @param y: Y coordinate (meter).
+       @param z: Z coordinate (meter).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: 3-Tuple (lat, lon, height) in (radians, radians, meter).
+    '''
+    p = hypot(x, y)  # distance from minor axis
+    r = hypot(p, z)  # polar radius
+
+    if min(p, r) > EPS:
+        # parametric latitude (Bowring eqn 17, replaced)
+        t = (E.b * z) / (E.a * p) * (1 + E.e22 * E.b / r)
+        c = 1 / hypot1(t)
+        s = t * c
+
+        # geodetic latitude (Bowring eqn 18)
+        a = atan2(z + E.e22 * E.b * s * s * s,
+                  p - E.e2  * E.a * c * c * c)
+        b = atan2(y, x)  # ... and longitude
+
+        # height above ellipsoid (Bowring eqn 7)
+        ca, sa = cos(a), sin(a)
+#       r = E.a / E.e2s2(sa)  # length of normal terminated by minor axis
+#       h = p * ca + z * sa - (E.a * E.a / r)
+        h = p * ca + z * sa - (E.a * E.e2s2(sa))
+
+    # see <http://GIS.StackExchange.com/questions/28446/>
+    elif p > EPS:  # latitude arbitrarily zero
+        a, b, h = 0.0, atan2(y, x), p - E.a
+    else:  # polar latitude, longitude arbitrarily zero
+        a, b, h = copysign(PI_2, z), 0.0, abs(z) - E.b
+
+    return a, b, h
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
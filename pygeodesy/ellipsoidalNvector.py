@@ -23,7 +23,7 @@ U{http://www.navlab.net/Publications/A_Nonsingular_Horizontal_Position_Represent
 
 from datum import Datum, Datums
 from dms import F_D, toDMS
-from ellipsoidalBase import CartesianBase, LatLonEllipsoidalBase
+from ellipsoidalBase import _WGS84, CartesianBase, LatLonEllipsoidalBase
 from nvector import NorthPole, LatLonNvectorBase, \
                     Nvector as NvectorBase, sumOf
 from utils import EPS, EPS1, degrees90, degrees360, \
@@ -42,7 +42,7 @@ class Cartesian(CartesianBase):
     '''Extended to convert geocentric L{Cartesian} points to
        to L{Nvector} and n-vector-based ellipsoidal L{LatLon}.
     '''
-    _Nv = None  #: (INTERNAL) Cache toNvector (L{Nvector}).
+    __slots__ = ('_Nv',)  # (INTERNAL) Cache toNvector (L{Nvector}).
 
     def _update(self, updated):
         '''(INTERNAL) Clear caches if updated.
@@ -75,7 +75,7 @@ class Cartesian(CartesianBase):
            >>> c = Cartesian(3980581, 97, 4966825)
            >>> n = c.toNvector()  # (0.62282, 0.000002, 0.78237, +0.24)
         '''
-        if self._Nv is None or datum != self._Nv.datum:
+        if getattr(self, '_Nv', None) is None or datum != self._Nv.datum:
             E = datum.ellipsoid
             x, y, z = self.to3xyz()
 
@@ -110,15 +110,16 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
        >>> from ellipsoidalNvector import LatLon
        >>> p = LatLon(52.205, 0.119)  # height=0, datum=Datums.WGS84
     '''
-    _Nv  = None  #: (INTERNAL) Cache toNvector (L{Nvector}).
-#   _v3d = None  #: (INTERNAL) Cache toVector3d (L{Vector3d}).
-    _r3  = None  #: (INTERNAL) Cache _rotation3 (3-Tuple L{Nvector}s).
+    __slots__ = ('_Nv',  # (INTERNAL) Cache toNvector (L{Nvector}).
+#                '_v3d',  # (INTERNAL) Cache toVector3d (L{Vector3d}).
+                 '_r3',  # (INTERNAL) Cache _rotation3 (3-Tuple L{Nvector}s).
+                 '__dict__')  # other attributes, created lazily
 
     def _rotation3(self):
         '''(INTERNAL) Build rotation matrix from n-vector
            coordinate frame axes.
         '''
-        if self._r3 is None:
+        if getattr(self, '_r3', None) is None:
             nv = self.toNvector()  # local (n-vector) coordinate frame
 
             d = nv.negate()  # down (opposite to n-vector)
@@ -448,7 +449,7 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
            >>> n = p.toNvector()
            >>> n.toStr()  # [0.50000, 0.50000, 0.70710]
         '''
-        if self._Nv is None:
+        if getattr(self, '_Nv', None) is None:
             x, y, z, h = self.to4xyzh()  # nvector.LatLonNvectorBase
             self._Nv = Nvector(x, y, z, h=h, datum=self.datum)
         return self._Nv
@@ -581,7 +582,7 @@ class Nvector(NvectorBase):
 
        Note commonality with L{sphericalNvector.Nvector}.
     '''
-    _datum = Datums.WGS84  #: (INTERNAL) Datum (L{Datum}).
+    __slots__ = ('_datum',)  # (INTERNAL) Datum (L{Datum}).
 
     def __init__(self, x, y, z, h=0, datum=None):
         '''New n-vector normal to the earth's surface.
@@ -606,6 +607,8 @@ class Nvector(NvectorBase):
             if not isinstance(datum, Datum):
                 raise TypeError('%s invalid: %r' % ('datum', datum))
             self._datum = datum
+        else:
+            self._datum = _WGS84
 
     def copy(self):
         '''Copy this vector.
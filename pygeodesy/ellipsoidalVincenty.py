@@ -47,17 +47,31 @@ or by converting to anothor datum:
 
     >>> p = p.convertDatum(Datums.OSGB36)
 
+Function L{distances} applies Vincenty's inverse method to many pairs
+of lat-/longitudes at once, without creating any L{LatLon} instances:
+
+    >>> from pygeodesy.ellipsoidalVincenty import distances
+    >>> ds, fs, rs, xs = distances(lats1, lons1, lats2, lons2)
+
+and function L{destinations} applies Vincenty's direct method to many start
+points, distances and bearings:
+
+    >>> from pygeodesy.ellipsoidalVincenty import destinations
+    >>> lats2, lons2, rs, xs = destinations(lats, lons, dists, bearings)
+
 @newfield example: Example, Examples
 '''
 
 from datum import Datums
 from ellipsoidalBase import CartesianBase, LatLonEllipsoidalBase
-from utils import EPS, degrees90, degrees180, degrees360, radians
+from utils import EPS, _broadcast, degrees90, degrees180, degrees360, \
+                  radians
 
 from math import atan2, cos, hypot, sin, tan
 
 # all public contants, classes and functions
-__all__ = ('Cartesian', 'LatLon', 'VincentyError')  # classes
+__all__ = ('Cartesian', 'LatLon', 'VincentyError',  # classes
+           'destinations', 'distances')  # functions
 __version__ = '17.04.07'
 
 
@@ -72,6 +86,8 @@ class Cartesian(CartesianBase):
     '''Extended to convert geocentric L{Cartesian} points to
        Vincenty-based ellipsoidal L{LatLon}.
     '''
+    __slots__ = ()
+
     def toLatLon(self, datum=Datums.WGS84):  # PYCHOK XXX
         '''Converts this (geocentric) Cartesian (x/y/z) point to
            an (ellipsoidal geodetic) point on the specified datum.
@@ -100,6 +116,9 @@ class LatLon(LatLonEllipsoidalBase):
        and/or the iteration limit, see properties L{LatLon.epsilon}
        and L{LatLon.iterations}.
     '''
+    __slots__ = ('__dict__',)  # other attributes, like Utm.toLatLon's
+                               # convergence and scale, created lazily
+
     _epsilon    = 1.0e-12  # about 0.006 mm
     _iterations = 50
 
@@ -373,11 +392,12 @@ class LatLon(LatLonEllipsoidalBase):
         else:  # e22 == (a / b) ** 2 - 1
             A, B = _p2(c2a, E.e22)
 
+        e = self._epsilon
         s = d = distance / (E.b * A)
         for _ in range(self._iterations):
             cs, ss, c2sm = cos(s), sin(s), cos(s12 + s)
             s_, s = s, d + _ds(B, cs, ss, c2sm)
-            if abs(s - s_) < self._epsilon:
+            if abs(s - s_) < e:
                 break
         else:
             raise VincentyError('no convergence %r' % (self,))
@@ -416,6 +436,7 @@ class LatLon(LatLonEllipsoidalBase):
         c1c2, s1s2 = c1 * c2, s1 * s2
         c1s2, s1c2 = c1 * s2, s1 * c2
 
+        e = self._epsilon
         ll = dl = radians(other.lon - self.lon)
         for _ in range(self._iterations):
             cll, sll, ll_ = cos(ll), sin(ll), ll
@@ -435,7 +456,7 @@ class LatLon(LatLonEllipsoidalBase):
                 c2sm = cs - 2 * s1s2 / c2a
                 ll = dl + _dl(E.f, c2a, sa, s, cs, ss, c2sm)
 
-            if abs(ll - ll_) < self._epsilon:
+            if abs(ll - ll_) < e:
                 break
         else:
             raise VincentyError('no convergence %r to %r' % (self, other))
@@ -457,6 +478,175 @@ class LatLon(LatLonEllipsoidalBase):
         return d
 
 
+def destinations(lats, lons, dists, bearings, datum=Datums.WGS84,
+                 epsilon=LatLon._epsilon, iterations=LatLon._iterations):
+    '''Compute the destination point and the final bearing after
+       having travelled for each of several distances from a start
+       point along a geodesic given by an initial bearing, using
+       Vincenty's direct method.
+
+       Each destination is iterated until converged, using the same
+       formulae as method L{LatLon.destination2} but without
+       instantiating any L{LatLon} points.  Destinations which fail
+       to converge do not raise an exception, instead the
+       L{VincentyError} is reported for that destination only.
+
+       @param lats: Latitudes of the start points (degrees[] or scalar).
+       @param lons: Longitudes of the start points (degrees[] or scalar).
+       @param dists: Distances in meter (scalar[] or scalar).
+       @param bearings: Initial bearings in compass degrees (degrees[]
+                        or scalar).
+       @keyword datum: Datum of all points (L{Datum}).
+       @keyword epsilon: Convergence epsilon (scalar).
+       @keyword iterations: Iteration limit (int).
+
+       @return: 4-Tuple (latitudes, longitudes, final bearings, errors)
+                as (degrees90[], degrees180[], degrees360[], dict).  For
+                failed destinations all three values are None and the
+                L{VincentyError} is in errors, keyed by index.
+
+       @raise ValueError: Unequal number of lat-, longitudes, distances
+                          and bearings or datum is not ellipsoidal.
+
+       @example:
+
+       >>> bs = range(0, 360, 10)  # ring of 36 points, 1 Km radius
+       >>> as_, bs_, rs, xs = destinations(-37.95103, 144.42487, 1000, bs)
+    '''
+    E = datum.ellipsoid
+    if not E.isellipsoidal():
+        raise ValueError('%r not %s: %r' % ('datum', 'ellipsoidal', datum))
+    b, f, e22 = E.b, E.f, E.e22
+
+    n, abdi = _broadcast(lats, lons, dists, bearings)
+    as_, bs, rs, xs = [None] * n, [None] * n, [None] * n, {}
+
+    for j, (a1, b1, d, i) in enumerate(abdi):
+        c1, s1, t1 = _r3(a1, f)
+
+        i = radians(i)  # initial bearing (forward azimuth)
+        ci, si = cos(i), sin(i)
+        s12 = atan2(t1, ci) * 2
+
+        sa = c1 * si
+        c2a = 1 - (sa * sa)
+        if c2a < EPS:
+            c2a = 0
+            A, B = 1, 0
+        else:  # e22 == (a / b) ** 2 - 1
+            A, B = _p2(c2a, e22)
+
+        s = d = d / (b * A)
+        for _ in range(iterations):
+            cs, ss, c2sm = cos(s), sin(s), cos(s12 + s)
+            s_, s = s, d + _ds(B, cs, ss, c2sm)
+            if abs(s - s_) < epsilon:
+                break
+        else:
+            xs[j] = VincentyError('%s no convergence' % (j,))
+            continue
+
+        t = s1 * ss - c1 * cs * ci
+        # final bearing (reverse azimuth +/- 180)
+        rs[j] = degrees360(atan2(sa, -t))
+        # destination latitude in [-270, 90)
+        as_[j] = degrees90(atan2(s1 * cs + c1 * ss * ci,
+                                 (1 - f) * hypot(sa, t)))
+        # destination longitude in [-180, 180)
+        bs[j] = degrees180(atan2(ss * si, c1 * cs - s1 * ss * ci) -
+                          _dl(f, c2a, sa, s, cs, ss, c2sm) + radians(b1))
+
+    return as_, bs, rs, xs
+
+
+def distances(lats1, lons1, lats2, lons2, datum=Datums.WGS84,
+              epsilon=LatLon._epsilon, iterations=LatLon._iterations):
+    '''Compute the distance and the initial and final bearing along
+       the geodesic between each of several pairs of points, using
+       Vincenty's inverse method.
+
+       Each pair is iterated until converged, using the same formulae
+       as method L{LatLon.distanceTo3} but without instantiating any
+       L{LatLon} points.  Pairs which coincide or fail to converge do
+       not raise an exception, instead the L{VincentyError} is
+       reported for that pair only.
+
+       @param lats1: Latitudes of the start points (degrees[] or scalar).
+       @param lons1: Longitudes of the start points (degrees[] or scalar).
+       @param lats2: Latitudes of the end points (degrees[] or scalar).
+       @param lons2: Longitudes of the end points (degrees[] or scalar).
+       @keyword datum: Datum of all points (L{Datum}).
+       @keyword epsilon: Convergence epsilon (scalar).
+       @keyword iterations: Iteration limit (int).
+
+       @return: 4-Tuple (distances, initial bearings, final bearings,
+                errors) as (meter[], degrees360[], degrees360[], dict).
+                For failed pairs all three values are None and the
+                L{VincentyError} is in errors, keyed by pair index.
+
+       @raise ValueError: Unequal number of lat- and longitudes or
+                          datum is not ellipsoidal.
+
+       @example:
+
+       >>> ds, fs, rs, xs = distances((50.06632, 52.205), (-5.71475, 0.119),
+                                      (58.64402, 48.857), (-3.07009, 2.351))
+       >>> ds  # [969954.166314, 404607.805988]
+       >>> fs  # [9.141877, 156.11064]
+    '''
+    E = datum.ellipsoid
+    if not E.isellipsoidal():
+        raise ValueError('%r not %s: %r' % ('datum', 'ellipsoidal', datum))
+    b, f, e22 = E.b, E.f, E.e22
+
+    n, abab = _broadcast(lats1, lons1, lats2, lons2)
+    ds, fs, rs, xs = [None] * n, [None] * n, [None] * n, {}
+
+    for i, (a1, b1, a2, b2) in enumerate(abab):
+        c1, s1, _ = _r3(a1, f)
+        c2, s2, _ = _r3(a2, f)
+
+        c1c2, s1s2 = c1 * c2, s1 * s2
+        c1s2, s1c2 = c1 * s2, s1 * c2
+
+        ll = dl = radians(b2 - b1)
+        for _ in range(iterations):
+            cll, sll, ll_ = cos(ll), sin(ll), ll
+
+            ss = hypot(c2 * sll, c1s2 - s1c2 * cll)
+            if ss < EPS:
+                xs[i] = VincentyError('%s coincident' % (i,))
+                break
+            cs = s1s2 + c1c2 * cll
+            s = atan2(ss, cs)
+
+            sa = c1c2 * sll / ss
+            c2a = 1 - (sa * sa)
+            if abs(c2a) < EPS:
+                c2a = 0  # equatorial line
+                ll = dl + f * sa * s
+            else:
+                c2sm = cs - 2 * s1s2 / c2a
+                ll = dl + _dl(f, c2a, sa, s, cs, ss, c2sm)
+
+            if abs(ll - ll_) < epsilon:
+                break
+        else:
+            xs[i] = VincentyError('%s no convergence' % (i,))
+
+        if i not in xs:
+            if c2a:
+                A, B = _p2(c2a, e22)
+                s = A * (s - _ds(B, cs, ss, c2sm))
+            ds[i] = b * s
+
+            cll, sll = cos(ll), sin(ll)
+            fs[i] = degrees360(atan2(c2 * sll,  c1s2 - s1c2 * cll))
+            rs[i] = degrees360(atan2(c1 * sll, -s1c2 + c1s2 * cll))
+
+    return ds, fs, rs, xs
+
+
 def _p2(c2a, ab2):
     '''(INTERNAL) Compute A, B polynomials.
     '''
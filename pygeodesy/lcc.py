@@ -2,7 +2,12 @@
 # -*- coding: utf-8 -*-
 
 '''Lambert conformal conic projection for 1 or 2 Standard Parallels
-class L{Conic} and position class L{Lcc}.
+class L{Conic}, position class L{Lcc} and functions L{toLatLonGrid}
+and L{toLcc}.
+
+Function L{toLatLonGrid} unprojects a regular grid of east- and
+northings on a conic once and caches the resulting lat-/longitudes
+in memory and optionally in a file, to be re-used by later calls.
 
 U{http://wikipedia.org/wiki/Lambert_conformal_conic_projection},
 U{http://www.linz.govt.nz/data/geodetic-system/coordinate-conversion/
@@ -15,14 +20,18 @@ U{http://mathworld.wolfram.com/LambertConformalConicProjection.html}.
 
 from ellipsoidalBase import LatLonEllipsoidalBase as _LL
 from datum import _Based, Datums, _Enum
-from utils import EPS, PI_2, \
+from points import LatLonArray
+from utils import EPS, PI_2, _broadcast, \
                   degrees90, degrees180, false2f, fStr, radians
 
+from array import array
+from hashlib import md5
 from math import atan, copysign, cos, hypot, log, sin, sqrt, tan
+import os
 
 # all public constants, classes and functions
 __all__ = ('Conic', 'Conics', 'Lcc',
-           'toLcc')  # functions
+           'toLatLonGrid', 'toLcc')  # functions
 __version__ = '17.04.10'
 
 
@@ -128,6 +137,43 @@ class Conic(_Based):
         '''
         return self._E0
 
+    def forward(self, lats, lons):
+        '''Project many lat-/longitudes with this conic.
+
+           Each lat-/longitude is projected as by L{toLcc}, but
+           without creating any L{Lcc} instances and with all
+           terms of this conic evaluated only once.
+
+           @param lats: Latitudes on this conic's datum (degrees[]
+                        or degrees).
+           @param lons: Longitudes on this conic's datum (degrees[]
+                        or degrees).
+
+           @return: 2-Tuple (eastings, northings) with lists of
+                    east- and northings (meter).
+
+           @raise ValueError: Unequal number of lat- and longitudes.
+
+           @example:
+
+           >>> es, ns = Conics.Fr93Lb.forward((46.5, 48.8582), (3, 2.2945))
+        '''
+        e, e_2 = self._e, self._e / 2
+        n, aF, E0, N0 = self._n, self._aF, self._E0, self._N0 + self._r0
+        b0 = self._lon0 + self._opt3 / n
+
+        m, abs_ = _broadcast(lats, lons)
+        es, ns = [0] * m, [0] * m
+        for i, (a, b) in enumerate(abs_):
+            a = radians(a)
+            s = e * sin(a)  # see _tdef, _pdef and _rdef
+            t = max(0, tan((PI_2 - a) / 2) / pow((1 - s) / (1 + s), e_2))
+            r = aF * pow(t, n)
+            t = n * (radians(b) - b0)
+            es[i] = E0 + r * sin(t)
+            ns[i] = N0 - r * cos(t)
+        return es, ns
+
     @property
     def k0(self):
         '''Get scale factor (scalar).
@@ -188,6 +234,60 @@ class Conic(_Based):
         '''
         return degrees180(self._opt3)
 
+    def reverse(self, eastings, northings):
+        '''Unproject many east- and northings with this conic.
+
+           Each east- and northing is unprojected as by L{Lcc.toLatLon},
+           but without creating any L{Lcc} or L{LatLon} instances.  The
+           latitudes of all points are iterated together, until each
+           has converged.
+
+           @param eastings: Eastings (meter[] or meter).
+           @param northings: Northings (meter[] or meter).
+
+           @return: 2-Tuple (lats, lons) with lists of lat- and
+                    longitudes on this conic's datum (degrees90,
+                    degrees180).
+
+           @raise ValueError: Unequal number of east- and northings.
+
+           @example:
+
+           >>> lats, lons = Conics.Fr93Lb.reverse((700000,), (6600000,))
+        '''
+        e, e_2 = self._e, self._e / 2
+        n, n_, aF = self._n, self._n_, self._aF
+        E0, N0 = self._E0, self._N0 + self._r0
+        b0 = self._lon0 + self._opt3 * n_
+
+        m, ens = _broadcast(eastings, northings)
+        xs, ys, ts = [0] * m, [0] * m, [0] * m
+        for i, (x, y) in enumerate(ens):
+            x = x - E0
+            y = N0 - y
+
+            t = pow(copysign(hypot(x, y), n) / aF, n_)
+            ts[i] = t
+            xs[i] = PI_2 - 2 * atan(t)  # see _xdef
+            if y:
+                ys[i] = atan(x / y) * n_ + b0
+            else:  # atan(x / +0)
+                ys[i] = copysign(PI_2, x) * n_ + b0
+
+        js = range(m)
+        while js:  # see _pdef and _xdef
+            cs = []
+            for i in js:
+                p = xs[i]
+                s = e * sin(p)
+                x = PI_2 - 2 * atan(ts[i] * pow((1 - s) / (1 + s), e_2))
+                xs[i] = x
+                if abs(x - p) >= 1e-9:  # XXX EPS too small?
+                    cs.append(i)
+            js = cs  # not converged
+
+        return list(map(degrees90, xs)), list(map(degrees180, ys))
+
     @property
     def SP(self):
         '''Get the number of standard parallels (int).
@@ -478,6 +578,107 @@ def toLcc(latlon, conic=Conics.WRF_Lb):
                c._N0 + c._r0 - r * cos(t), h=latlon.height, conic=c)
 
 
+_LRU = 4  #: (INTERNAL) Number of cached grids.
+_Grids = []  #: (INTERNAL) Grid cache, most recent first.
+
+
+def toLatLonGrid(origin, spacing, shape, conic=Conics.WRF_Lb, cache=None):
+    '''Unproject a regular grid of east- and northings to lat-/longitudes.
+
+       The grid is unprojected once, the lat-/longitudes are cached
+       in memory, keyed by the conic's parameters and datum and the
+       grid's origin, spacing and shape.  Optionally, they are also
+       stored in a file of C doubles in a I{cache} directory, to be
+       loaded by later runs instead of being unprojected again.  Any
+       error writing the cache file is ignored.
+
+       @param origin: East- and northing of grid point [0, 0] (2-tuple
+                      of meter).
+       @param spacing: East- and northing step between grid columns
+                       respectively rows (2-tuple of meter).
+       @param shape: Number of rows and columns (2-tuple of int).
+       @keyword conic: The conic projection (L{Conic}).
+       @keyword cache: Optional directory for cache files (string).
+
+       @return: Grid points by row, the I{k}-th point is at row
+                I{k // columns} and column I{k % columns}, a copy
+                of the cached grid (L{LatLonArray}).
+
+       @raise ValueError: Invalid shape.
+
+       @example:
+
+       >>> g = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (267, 450))
+       >>> g.lats[451], g.lons[451]  # row 1, column 1
+    '''
+    e0, n0 = map(float, origin)
+    de, dn = map(float, spacing)
+    r, c = shape
+    if min(r, c) < 1:
+        raise ValueError('%s invalid: %r' % ('shape', shape))
+
+    T = conic._datum.transform  # grids carry the datum
+    k = (conic._datum.ellipsoid.a, conic._e, conic._lat0, conic._lon0,
+         conic._par1, conic._par2, conic._opt3, conic._E0, conic._N0,
+         conic._k0, T.tx, T.ty, T.tz, T.sx, T.sy, T.sz, T.s,
+         e0, n0, de, dn, r, c)
+
+    for i, (k_, g) in enumerate(_Grids):
+        if k_ == k:
+            if i:  # move to front
+                _Grids.insert(0, _Grids.pop(i))
+            return g[:]  # copy, keep the cached grid unchanged
+
+    f = None
+    if cache:
+        f = os.path.join(cache, 'lcc%s.grid' % (md5(repr(k).encode()).hexdigest(),))
+        g = _loadGrid(f, r * c, conic.datum)
+    if f is None or g is None:
+        es = [e0 + j * de for j in range(c)] * r
+        ns = [n0 + i * dn for i in range(r) for _ in range(c)]
+        lats, lons = conic.reverse(es, ns)
+        g = LatLonArray(lats, lons, datum=conic.datum)
+        if f:
+            try:
+                _saveGrid(f, g)
+            except (IOError, OSError):  # file cache is best-effort
+                pass
+
+    _Grids.insert(0, (k, g))
+    del _Grids[_LRU:]
+    return g[:]
+
+
+def _loadGrid(f, n, datum):
+    '''(INTERNAL) Load a cached grid, None if missing or invalid.
+    '''
+    try:
+        with open(f, 'rb') as b:
+            a = array('d')
+            a.fromfile(b, n * 2)
+            if b.read(1):
+                return None
+    except (EOFError, IOError, OSError):
+        return None
+    return LatLonArray(a[:n], a[n:], datum=datum)
+
+
+_replace = getattr(os, 'replace', os.rename)  #: (INTERNAL) Python 3.3+.
+
+
+def _saveGrid(f, g):
+    '''(INTERNAL) Store a grid into a cache file, lats then lons.
+    '''
+    t = f + '.tmp%s' % (os.getpid(),)
+    with open(t, 'wb') as b:
+        g.lats.tofile(b)
+        g.lons.tofile(b)
+    try:  # os.replace overwrites atomically, also on Windows
+        _replace(t, f)
+    except OSError:  # Python 2 on Windows and f already
+        os.remove(t)  # saved by another process, keep f
+
+
 if __name__ == '__main__':
 
     # print all
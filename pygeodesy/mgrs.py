@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 
 '''Military Grid Reference System (MGRS/NATO) class L{Mgrs} and
-functions L{parseMGRS} and L{toMgrs}.
+functions L{parseMGRS}, L{parseMGRS_many}, L{toMgrs} and L{toMgrs_many}
+and MGRS cell functions L{cellChildren}, L{cellMgrs}, L{cellNeighbours},
+L{cellParent}, L{cellStr} and L{toMgrsCells}.
 
 Pure Python implementation of MGRS / UTM conversion functions using
 an ellipsoidal earth model.  Transcribed from JavaScript originals
@@ -19,6 +21,26 @@ identification, and an easting and northing (in metres).
 Depending on requirements, some parts of the reference may be omitted
 (implied), and easting/northing may be given to varying resolution.
 
+Functions L{toMgrs_many} and L{parseMGRS_many} convert many lat-/
+longitudes to MGRS strings respectively back, using lookup tables
+for the 100 km grid letters and without creating an L{Mgrs}, L{Utm}
+or L{LatLon} instance for each reference:
+
+    >>> from pygeodesy.mgrs import parseMGRS_many, toMgrs_many
+    >>> ms, xs = toMgrs_many(lats, lons, prec=8)
+    >>> lats, lons, xs = parseMGRS_many(ms)
+
+An MGRS I{cell} is the grid square of a reference at a given precision,
+encoded as a single, non-negative int of at most 57 bits, suitable as
+int64 key for grouping and aggregation.  The zone, band, 100 km grid
+letters and the easting and northing digits occupy the higher bits,
+the number of digits the lowest 3 bits.  Cells can be navigated to
+their parent, children and neighbours without any string handling:
+
+    >>> from pygeodesy.mgrs import cellParent, cellStr, toMgrsCells
+    >>> cs, xs = toMgrsCells(lats, lons, prec=6)  # 100 m cells
+    >>> cellStr(cellParent(cs[0]))  # '31U DQ 48 11'
+
 Qv U{http://www.fgdc.gov/standards/projects/FGDC-standards-projects/usng/fgdc_std_011_2001_usng.pdf}
 and U{https://en.wikipedia.org/wiki/Military_grid_reference_system}.
 
@@ -28,14 +50,18 @@ and U{https://en.wikipedia.org/wiki/Military_grid_reference_system}.
 from bases import Base
 from datum import Datums
 from utils import halfs
-from utm   import toUtm, Utm, _toZBL
+from utm   import toUtm, toUtm_many, Utm, utm_toLatLon_many, \
+                  _Bands, _FalseNorthing, _projector, _toZB, _toZBL
 
 from math import log10
 import re  # PYCHOK warning locale.Error
 
 # all public contants, classes and functions
 __all__ = ('Mgrs',  # classes
-           'parseMGRS', 'toMgrs')  # functions
+           'cellChildren', 'cellMgrs', 'cellNeighbours',  # functions
+           'cellParent', 'cellStr',
+           'parseMGRS', 'parseMGRS_many',
+           'toMgrs', 'toMgrs_many', 'toMgrsCells')
 __version__ = '17.03.07'
 
 _100km  =  100e3  #: (INTERNAL) 100 km in meter.
@@ -46,6 +72,21 @@ _Le100k = 'ABCDEFGH', 'JKLMNPQR', 'STUVWXYZ'  #: (INTERNAL) Grid E colums.
 # 100 km grid square row (‘n’) letters repeat every other zone
 _Ln100k = 'ABCDEFGHJKLMNPQRSTUV', 'FGHJKLMNPQRSTUVABCDE'  #: (INTERNAL) Grid N rows.
 
+# lookup tables for the bulk functions, EN digraph by (zone - 1) % 6,
+# 100 km column 1..8 and row 0..19 and the reverse, meter by letter
+_EN100k = tuple(tuple(tuple(_Le100k[z % 3][E - 1] + _Ln100k[z % 2][N]
+                            for N in range(len(_Ln100k[0])))
+                      for E in range(9))  # column 0 unused
+                for z in range(6))  #: (INTERNAL) Grid EN digraphs.
+_Le2m = tuple(dict((e, (i + 1) * _100km) for i, e in enumerate(Le))
+              for Le in _Le100k)  #: (INTERNAL) Grid E meter.
+_Ln2m = tuple(dict((n, i * _100km) for i, n in enumerate(Ln))
+              for Ln in _Ln100k)  #: (INTERNAL) Grid N meter.
+
+# cell bits, from high to low: zone 6, band 5, 100 km column 4 and
+# row 5, easting 17 and northing 17 and the number of digits 3 bits
+_Dmask = 0x1FFFF  #: (INTERNAL) Digits mask, 17 bits.
+
 # split an MGRS string "12ABC1235..." into 3 parts
 _MGRSre = re.compile('(\d{1,2}[C-X]{1})([A-Z]{2})(\d+)', re.IGNORECASE)  #: (INTERNAL) Regex.
 _GZDre  = re.compile('(\d{1,2}[C-X]{1})', re.IGNORECASE)  #: (INTERNAL) Regex.
@@ -90,7 +131,7 @@ class Mgrs(Base):
             self._en100k = en
             self._en100k2m()
         except IndexError:
-            raise ValueError('%s invalid: %r' ('en100k', en100k))
+            raise ValueError('%s invalid: %r' % ('en100k', en100k))
 
         self._easting, self._northing = float(easting), float(northing)
 
@@ -154,6 +195,28 @@ class Mgrs(Base):
         '''
         return parseMGRS(strMGRS, datum=self.datum)
 
+    def toCell(self, prec=10):
+        '''Encode the grid square of this MGRS reference as a cell.
+
+           @keyword prec: Number of digits, 0:100 km, 4:km, 10:m (int).
+
+           @return: The cell (int).
+
+           @raise ValueError: Invalid prec.
+
+           @example:
+
+           >>> m = Mgrs('31U', 'DQ', 48251, 11932)
+           >>> c = m.toCell(prec=6)
+           >>> cellStr(c)  # '31U DQ 482 119'
+        '''
+        w, p = _prec2(prec, 0)
+        z = self._zone - 1
+        E = _Le100k[z % 3].index(self._en100k[0]) + 1
+        N = _Ln100k[z % 2].index(self._en100k[1])
+        return _cell(self._zone, _Bands.find(self._band), E, N,
+                     int(self._easting * p), int(self._northing * p), w)
+
     def toStr(self, prec=10, sep=' '):  # PYCHOK expected
         '''Returns a string representation of this MGRS grid reference.
 
@@ -170,10 +233,7 @@ class Mgrs(Base):
            >>> m = Mgrs(31, 'DQ', 48251, 11932, band='U')
            >>> m.toStr()  # '31U DQ 48251 11932'
         '''
-        w = prec // 2
-        if 1 > w or w > 5:
-            raise ValueError('%s invalid: %r' % ('prec', prec))
-        p = (0, 1e-4, 1e-3, 1e-2, 1e-1, 1)[w]  # 10 ** (5 - w)
+        w, p = _prec2(prec, 1)
 
         t = ['%02d%s' % (self._zone, self._band), self._en100k,
              '%0*d' % (w, int(self._easting * p)),
@@ -226,6 +286,213 @@ class Mgrs(Base):
         return self._zone
 
 
+def _cell(z, b, E, N, e, n, w):
+    '''(INTERNAL) Encode a cell from zone, band index, 100 km grid
+       column 1..8 and row 0..19, east- and northing digits and
+       the number of digits w.
+    '''
+    return ((((((z << 5 | b) << 4 | E) << 5 | N) << 17 | e) << 17 | n) << 3) | w
+
+
+def _cell7(cell):
+    '''(INTERNAL) Decode a cell into 7-tuple (z, b, E, N, e, n, w).
+
+       @raise ValueError: Invalid cell.
+    '''
+    try:
+        c = int(cell)
+        w = c & 7
+        c >>= 3
+        n = c & _Dmask
+        c >>= 17
+        e = c & _Dmask
+        c >>= 17
+        z, b, E, N = c >> 14, (c >> 9) & 31, (c >> 5) & 15, c & 31
+        m = 10**w
+        if 1 > z or z > 60 or b >= len(_Bands) or 1 > E or E > 8 \
+                 or N > 19 or w > 5 or e >= m or n >= m:
+            raise ValueError
+    except (TypeError, ValueError):
+        raise ValueError('%s invalid: %r' % ('cell', cell))
+    return z, b, E, N, e, n, w
+
+
+def _prec2(prec, p0):
+    '''(INTERNAL) Check prec, return the number of digits and
+       scale factor from meter to digits.
+    '''
+    w = prec // 2
+    if p0 > w or w > 5:
+        raise ValueError('%s invalid: %r' % ('prec', prec))
+    return w, (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1)[w]  # 10 ** (w - 5)
+
+
+def _s2m(g):
+    '''(INTERNAL) Convert an easting or northing string to meter.
+    '''
+    f = float(g)
+    if f > 0:
+        x = int(log10(f))
+        if 0 <= x < 4:  # at least 5 digits
+            f *= (10000, 1000, 100, 10)[x]
+    return f
+
+
+def _split4(strMGRS):
+    '''(INTERNAL) Split an MGRS string into 4 parts.
+
+       @param strMGRS: MGRS grid reference (string).
+
+       @return: 4-Tuple (zoneBand, en100k, easting, northing) strings.
+
+       @raise ValueError: Invalid strMGRS.
+    '''
+    def _mg(cre, s):  # return re.match groups
+        m = cre.match(s)
+        if not m:
+            raise ValueError
+        return m.groups()
+
+    m = tuple(strMGRS.strip().replace(',', ' ').split())
+    if len(m) == 1:  # 01ABC1234512345'
+        m = _mg(_MGRSre, m[0])
+        m = m[:2] + halfs(m[2])
+    elif len(m) == 2:  # 01ABC 1234512345'
+        m = _mg(_GZDre, m[0]) + halfs(m[1])
+    elif len(m) == 3:  # 01ABC 12345 12345'
+        m = _mg(_GZDre, m[0]) + m[1:]
+    if len(m) != 4:  # 01A BC 1234 12345
+        raise ValueError
+    return m
+
+
+def cellChildren(cell):
+    '''Get the 100 child cells of a cell, one more digit each
+       in easting and northing.
+
+       @param cell: The cell (int).
+
+       @return: Child cells (int[]), by northing then easting.
+
+       @raise ValueError: Invalid cell or cell at 1 meter.
+    '''
+    z, b, E, N, e, n, w = _cell7(cell)
+    if w > 4:
+        raise ValueError('%s no %s: %r' % ('cell', 'children', cell))
+    c = _cell(z, b, E, N, 0, 0, w + 1)
+    e, n = e * 10, n * 10
+    return [c | (e + i) << 20 | (n + j) << 3 for j in range(10)
+                                             for i in range(10)]
+
+
+def cellMgrs(cell, datum=Datums.WGS84):
+    '''Convert a cell to the MGRS reference of its south-west corner.
+
+       @param cell: The cell (int).
+       @keyword datum: The datum to use (L{Datum}).
+
+       @return: The MGRS grid reference (L{Mgrs}).
+
+       @raise ValueError: Invalid cell.
+    '''
+    z, b, E, N, e, n, w = _cell7(cell)
+    en = _EN100k[(z - 1) % 6][E][N]
+    r = 10**(5 - w)  # meter
+    return Mgrs(z, en, e * r, n * r, band=_Bands[b], datum=datum)
+
+
+def cellNeighbours(cell, datum=Datums.WGS84):
+    '''Get the 8 neighbouring cells of a cell, in the same zone.
+
+       Note, the band of each neighbour is the band of its
+       center, which may differ from the band of the cell.
+
+       @param cell: The cell (int).
+       @keyword datum: The datum to use (L{Datum}).
+
+       @return: Neighbour cells (int[]) clockwise from north, N,
+                NE, E, SE, S, SW, W and NW, None for a neighbour
+                outside the zone or outside UTM.
+
+       @raise ValueError: Invalid cell.
+    '''
+    z, b, E, N, e, n, w = _cell7(cell)
+    m, r = 10**w, 10**(5 - w)  # digits, meter
+
+    # signed northing of the band bottom, see Mgrs.toUtm
+    a = (b << 3) - 80
+    y = toUtm(a, 0, datum=datum).northing
+    y = int(y / _100km) * _100km
+    if a < 0:
+        y -= _FalseNorthing
+    # signed northing of this cell in digits, the first
+    # 2,000 km cycle of the grid rows above the band bottom
+    n += N * m
+    n -= ((n - int(y) // r) // (20 * m)) * 20 * m
+
+    P = _projector(z, datum)
+    e += E * m
+    r2 = r * 0.5
+    cs = []
+    for de, dn in ((0, 1), (1, 1), (1, 0), (1, -1),
+                   (0, -1), (-1, -1), (-1, 0), (-1, 1)):
+        E, x = divmod(e + de, m)
+        N, y = divmod(n + dn, m)
+        c = None
+        if 0 < E < 9:
+            try:  # band of the center
+                Y = (N * m + y) * r + r2
+                h = 'S' if Y < 0 else 'N'
+                if Y < 0:
+                    Y += _FalseNorthing
+                a, o, _, _ = P.reverse((E * m + x) * r + r2, Y, h)
+                B = _toZB(a, o)[1]
+                c = _cell(z, _Bands.find(B), E, N % 20, x, y, w)
+            except ValueError:
+                pass
+        cs.append(c)
+    return cs
+
+
+def cellParent(cell):
+    '''Get the parent cell of a cell, one digit less each in
+       easting and northing.
+
+       @param cell: The cell (int).
+
+       @return: Parent cell (int).
+
+       @raise ValueError: Invalid cell or cell at 100 km.
+    '''
+    z, b, E, N, e, n, w = _cell7(cell)
+    if w < 1:
+        raise ValueError('%s no %s: %r' % ('cell', 'parent', cell))
+    return _cell(z, b, E, N, e // 10, n // 10, w - 1)
+
+
+def cellStr(cell, sep=' '):
+    '''Return the MGRS reference string of a cell, at the
+       cell's precision.
+
+       @param cell: The cell (int).
+       @keyword sep: Separator to join (string).
+
+       @return: The cell as "00B EN easting northing" (string).
+
+       @raise ValueError: Invalid cell.
+
+       @example:
+
+       >>> cellStr(Mgrs('31U', 'DQ', 48251, 11932).toCell(prec=4))
+       '31U DQ 48 11'
+    '''
+    z, b, E, N, e, n, w = _cell7(cell)
+    t = ['%02d%s' % (z, _Bands[b]), _EN100k[(z - 1) % 6][E][N]]
+    if w:
+        t += ['%0*d' % (w, e), '%0*d' % (w, n)]
+    return sep.join(t)
+
+
 def parseMGRS(strMGRS, datum=Datums.WGS84):
     '''Parse a string representing a MGRS grid reference,
        consisting of zoneBand, grid, easting and northing.
@@ -244,31 +511,8 @@ def parseMGRS(strMGRS, datum=Datums.WGS84):
        >>> m = parseMGRS('31UDQ4825111932')
        >>> repr(m)  # [Z:31U, G:DQ, E:48251, N:11932]
     '''
-    def _mg(cre, s):  # return re.match groups
-        m = cre.match(s)
-        if not m:
-            raise ValueError
-        return m.groups()
-
-    def _s2m(g):  # e or n string to meter
-        f = float(g)
-        if f > 0:
-            x = int(log10(f))
-            if 0 <= x < 4:  # at least 5 digits
-                f *= (10000, 1000, 100, 10)[x]
-        return f
-
-    m = tuple(strMGRS.strip().replace(',', ' ').split())
     try:
-        if len(m) == 1:  # 01ABC1234512345'
-            m = _mg(_MGRSre, m[0])
-            m = m[:2] + halfs(m[2])
-        elif len(m) == 2:  # 01ABC 1234512345'
-            m = _mg(_GZDre, m[0]) + halfs(m[1])
-        elif len(m) == 3:  # 01ABC 12345 12345'
-            m = _mg(_GZDre, m[0]) + m[1:]
-        if len(m) != 4:  # 01A BC 1234 12345
-            raise ValueError
+        m = _split4(strMGRS)
         e, n = map(_s2m, m[2:])
     except ValueError:
         raise ValueError('%s invalid: %r' % ('strMGRS', strMGRS))
@@ -310,6 +554,178 @@ def toMgrs(utm):
 
     return Mgrs(utm.zone, en, e, n, band=utm.band, datum=utm.datum)
 
+
+def parseMGRS_many(strMGRSs, datum=Datums.WGS84):
+    '''Convert many MGRS grid reference strings to lat-/longitudes.
+
+       Each string is parsed like L{parseMGRS} and converted like
+       L{Mgrs.toUtm} and L{Utm.toLatLon}, but without creating any
+       L{Mgrs}, L{Utm} or L{LatLon} instances.
+
+       @param strMGRSs: MGRS grid references (string[]).
+       @keyword datum: The datum to use (L{Datum}).
+
+       @return: 3-Tuple (lats, lons, errors) with lists of lat- and
+                longitudes (degrees90, degrees180), None for invalid
+                references and a dict of the ValueError of each
+                invalid reference, by index.
+
+       @example:
+
+       >>> lats, lons, xs = parseMGRS_many(('31U DQ 48251 11932',
+                                            '31UDQ4825111932'))
+    '''
+    n = len(strMGRSs)
+    xs = {}
+
+    zs, hs, es, ns = [0] * n, ['N'] * n, [0] * n, [0] * n
+    ZBs, Nbs = {}, {}  # per zoneBand and band
+    for i, s in enumerate(strMGRSs):
+        try:
+            try:
+                zb, en, e, y = _split4(s)
+                e, y = _s2m(e), _s2m(y)
+            except (AttributeError, ValueError):
+                raise ValueError('%s invalid: %r' % ('strMGRS', s))
+
+            zb = zb.upper()
+            if zb not in ZBs:  # check zone and band once
+                ZBs[zb] = _toZBL(zb, '', True)
+            z, B, b = ZBs[zb]
+
+            en = en.upper()
+            try:  # 100 km grid square letters to meter
+                e += _Le2m[(z - 1) % 3][en[0]]
+                y += _Ln2m[(z - 1) % 2][en[1]]
+            except (IndexError, KeyError):
+                raise ValueError('%s invalid: %r' % ('en100k', en))
+
+            if B not in Nbs:  # band bottom, see Mgrs.toUtm
+                nb = toUtm(b, 0, datum=datum).northing
+                Nbs[B] = int(nb / _100km) * _100km
+            nb = Nbs[B]
+            while y < nb:
+                y += _2000km
+        except ValueError as x:
+            xs[i] = x
+            continue
+
+        zs[i], es[i], ns[i] = z, e, y
+        if b < 0:
+            hs[i] = 'S'
+
+    # dummy, valid UTM coordinates for invalid references
+    for i in xs.keys():
+        zs[i], es[i], ns[i] = 1, 500e3, 0
+
+    lats, lons, _, _, ys = utm_toLatLon_many(zs, hs, es, ns, datum=datum)
+    ys.update(xs)
+    for i in ys.keys():
+        lats[i] = lons[i] = None
+    return lats, lons, ys
+
+
+def toMgrs_many(lats, lons, prec=10, datum=Datums.WGS84, sep=' '):
+    '''Convert many lat-/longitudes to MGRS grid reference strings.
+
+       Each lat-/longitude is converted as by L{toUtm} and L{toMgrs}
+       and formatted like L{Mgrs.toStr}, but without creating any
+       L{Utm} or L{Mgrs} instances.
+
+       @param lats: Latitudes (degrees[] or degrees).
+       @param lons: Longitudes (degrees[] or degrees).
+       @keyword prec: Number of digits, 4:km, 10:m (int).
+       @keyword datum: The datum to use (L{Datum}).
+       @keyword sep: Separator to join (string).
+
+       @return: 2-Tuple (strs, errors) with a list of MGRS grid
+                references (string), None for each invalid point
+                and a dict of the ValueError of each invalid point,
+                by index.
+
+       @raise ValueError: Invalid prec or unequal number of lat- and
+                          longitudes.
+
+       @example:
+
+       >>> ms, xs = toMgrs_many((48.8582, 13.4125), (2.2945, 103.8667))
+       >>> ms  # ['31U DQ 48251 11932', '48P UV 77302 83034']
+    '''
+    w, p = _prec2(prec, 1)
+    f = sep.join(('%02d%s', '%s', '%0*d', '%0*d'))
+
+    zs, Bs, Es, Ns, es, ns, xs = _toMgrs_many(lats, lons, datum)
+
+    ms = [None] * len(zs)
+    for i, z in enumerate(zs):
+        if i not in xs:
+            en = _EN100k[(z - 1) % 6][Es[i]][Ns[i]]
+            ms[i] = f % (z, Bs[i], en, w, int(es[i] * p),
+                                    w, int(ns[i] * p))
+    return ms, xs
+
+
+def toMgrsCells(lats, lons, prec=10, datum=Datums.WGS84):
+    '''Convert many lat-/longitudes to MGRS cells.
+
+       Each lat-/longitude is converted as by L{toMgrs_many} and
+       encoded as by L{Mgrs.toCell}.
+
+       @param lats: Latitudes (degrees[] or degrees).
+       @param lons: Longitudes (degrees[] or degrees).
+       @keyword prec: Number of digits, 0:100 km, 4:km, 10:m (int).
+       @keyword datum: The datum to use (L{Datum}).
+
+       @return: 2-Tuple (cells, errors) with a list of cells (int),
+                None for each invalid point and a dict of the
+                ValueError of each invalid point, by index.
+
+       @raise ValueError: Invalid prec or unequal number of lat- and
+                          longitudes.
+
+       @example:
+
+       >>> cs, xs = toMgrsCells(lats, lons, prec=4)  # 1 km cells
+       >>> ns = {}
+       >>> for c in cs:
+       ...     ns[c] = ns.get(c, 0) + 1  # count by cell
+    '''
+    w, p = _prec2(prec, 0)
+
+    zs, Bs, Es, Ns, es, ns, xs = _toMgrs_many(lats, lons, datum)
+
+    cs, bs = [None] * len(zs), {}
+    for i, z in enumerate(zs):
+        if i not in xs:
+            B = Bs[i]
+            if B not in bs:
+                bs[B] = _Bands.find(B)
+            cs[i] = _cell(z, bs[B], Es[i], Ns[i], int(es[i] * p),
+                                                  int(ns[i] * p), w)
+    return cs, xs
+
+
+def _toMgrs_many(lats, lons, datum):
+    '''(INTERNAL) Zones, bands, 100 km grid columns 1..8 and
+       rows 0..19 and east- and northings within the 100 km
+       grid square of many lat-/longitudes, see L{toMgrs}.
+    '''
+    zs, _, Bs, es, ns, _, _, xs = toUtm_many(lats, lons, datum=datum)
+
+    Es, Ns = [0] * len(zs), [0] * len(zs)
+    for i in range(len(zs)):
+        if i in xs:
+            continue
+        # truncate east-/northing to within 100 km grid square
+        x = es[i]
+        E, es[i] = divmod(x, _100km)
+        N, ns[i] = divmod(ns[i], _100km)
+        E = int(E)
+        if 1 > E or E > 8:
+            xs[i] = ValueError('%s invalid: %r' % ('easting', x))
+        Es[i], Ns[i] = E, int(N) % 20
+    return zs, Bs, Es, Ns, es, ns, xs
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
@@ -27,7 +27,7 @@ __version__ = '17.04.07'
 class Nvector(Vector3d):  # XXX kept private
     '''Base class for ellipsoidal and spherical L{Nvector}.
     '''
-    _h = 0     #: (INTERNAL) Height (meter).
+    __slots__ = ('_h',)  # (INTERNAL) Height (meter).
 
     H = ''  #: Heigth prefix (string), '↑' in JS version
 
@@ -46,8 +46,7 @@ class Nvector(Vector3d):  # XXX kept private
            >>> v.toLatLon()  # 45.0°N, 045.0°E, +1.00m
         '''
         Vector3d.__init__(self, x, y, z)
-        if h:
-            self._h = float(h)
+        self._h = float(h) if h else 0
 
     def copy(self):
         '''Copy this vector.
@@ -132,6 +131,7 @@ class LatLonNvectorBase(LatLonHeightBase):
     '''(INTERNAL) Base class for n-vector-based ellipsoidal
         and spherical LatLon.
     '''
+    __slots__ = ()
 
     def others(self, other, name='other'):
         '''Refine class comparison.
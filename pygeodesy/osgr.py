@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 '''Ordinance Survey Grid References (OSGR) class L{Osgr} and functions
-L{parseOSGR} and L{toOsgr}.
+L{parseOSGR}, L{toOsgr} and bulk functions L{osgr_toLatLon_many},
+L{osgr_toStr_many}, L{parseOSGR_many} and L{toOsgr_many}.
 
 Pure Python implementation of OS Grid Reference functions using an
 ellipsoidal earth model.  Transcribed from JavaScript originals
@@ -18,6 +19,15 @@ U{https://www.OrdnanceSurvey.co.uk/blog/2014/09/proposed-changes-to-latitude-and
 U{http://www.OrdnanceSurvey.co.uk/blog/2014/12/confirmation-on-changes-to-latitude-and-longitude}
 and U{https://en.wikipedia.org/wiki/Ordnance_Survey_National_Grid}.
 
+The bulk functions convert many points at once, applying the datum
+shift and the Transverse Mercator series directly to each lat-,
+longitude or east-, northing, without creating any L{LatLon},
+L{Cartesian} or L{Osgr} instance:
+
+    >>> from pygeodesy.osgr import osgr_toLatLon_many, toOsgr_many
+    >>> es, ns, xs = toOsgr_many(lats, lons)
+    >>> lats, lons, xs = osgr_toLatLon_many(es, ns)
+
 See also Karney 2011 "Transverse Mercator with an accuracy of a few
 nanometers" and Krüger 1912 "Konforme Abbildung des Erdellipsoids in
 der Ebene", references U{https://arxiv.org/pdf/1002.1417v3.pdf},
@@ -29,16 +39,18 @@ U{https://en.wikipedia.org/wiki/Transverse_Mercator:_Redfearn_series}.
 '''
 
 from bases import Base
-from datum import Datums
-from ellipsoidalBase import LatLonEllipsoidalBase
-from utils import degrees90, degrees180, false2f, fdot, \
-                  halfs, isscalar, radians
+from datum import Datums, _helmert12, _xyz12
+from ellipsoidalBase import LatLonEllipsoidalBase, _llh2xyz, _xyz2llh
+from utils import _broadcast, degrees90, degrees180, false2f, \
+                  fdot, halfs, isscalar, radians
 
 from math import cos, sin, sqrt, tan
 
 # all public contants, classes and functions
 __all__ = ('Osgr',  # classes
-           'parseOSGR', 'toOsgr')  # functions
+           'osgr_toLatLon_many', 'osgr_toStr_many',  # functions
+           'parseOSGR', 'parseOSGR_many',
+           'toOsgr', 'toOsgr_many')
 __version__ = '17.04.07'
 
 _10um    = 1e-5    #: (INTERNAL) 0.01 millimeter (meter)
@@ -51,6 +63,30 @@ _F0      = 0.9996012717   #: (INTERNAL) NatGrid scale of central meridian
 _OSGB36  = Datums.OSGB36  #: (INTERNAL) Airy130 ellipsoid
 
 
+def _i2c(i):
+    '''(INTERNAL) Grid letter index to letter, skipping I.
+    '''
+    if i > 7:
+        i += 1
+    return chr(ord('A') + i)
+
+
+def _EN(E, N):
+    '''(INTERNAL) Grid letters of 100 km grid square E, N.
+    '''
+    N = 19 - N
+    return _i2c( N - (N % 5) + (E + 10) // 5) + \
+           _i2c((N * 5) % 25 + (E % 5))
+
+
+# lookup tables of the grid letters by 100 km grid square
+# column 0..6 and row 0..12 and the reverse, E, N by letters
+_EN100k = tuple(tuple(_EN(E, N) for N in range(13))
+                for E in range(7))  #: (INTERNAL) Grid letters.
+_EN2EN = dict((_EN100k[E][N], (E, N)) for N in range(13)
+                                      for E in range(7))  #: (INTERNAL) Grid squares.
+
+
 def _M(Mabcd, a):
     '''(INTERNAL) Compute meridional arc.
     '''
@@ -61,6 +97,107 @@ def _M(Mabcd, a):
                                  -sin(a_ * 3) * cos(_a * 3))
 
 
+def _ab2en(a, b):
+    '''(INTERNAL) Convert OSGB36 lat-/longitude to OSGR, see L{toOsgr}.
+
+       @param a: Latitude (radians).
+       @param b: Longitude (radians).
+
+       @return: 2-Tuple (easting, northing) in (meter).
+    '''
+    E = _OSGB36.ellipsoid  # Airy130
+
+    ca, sa, ta = cos(a), sin(a), tan(a)
+
+    s = 1 - E.e2 * sa * sa
+    v = E.a * _F0 / sqrt(s)
+    r = s / E.e12  # = v / r = v / (v * E.e12 / s)
+
+    ca3 = ca * ca * ca
+    ca5 = ca * ca * ca3
+
+    ta2 = ta  * ta
+    ta4 = ta2 * ta2
+
+    x2 = r - 1  # η
+
+    I4 = (E.b * _M(E.Mabcd, a) + _N0,
+         (v /   2) * sa * ca,
+         (v /  24) * sa * ca3 * (5 - ta2 + 9 * x2),
+         (v / 720) * sa * ca5 * (61 - 58 * ta2 + ta4))
+
+    V4 = (_E0,
+          v * ca,
+         (v /   6) * ca3 * (r - ta2),
+         (v / 120) * ca5 * (5 - 18 * ta2 + ta4 + 14 * x2 - 58 * ta2 * x2))
+
+    d = b - _B0
+    d2 = d  * d
+    d3 = d2 * d
+    d5 = d2 * d3
+
+    n = fdot(I4, 1, d2, d3 * d, d5 * d)
+    e = fdot(V4, 1, d,  d3,     d5)
+    return e, n
+
+
+def _en2ab(e, n):
+    '''(INTERNAL) Convert OSGR to OSGB36 lat-/longitude, see L{Osgr.toLatLon}.
+
+       @param e: Easting (meter).
+       @param n: Northing (meter).
+
+       @return: 2-Tuple (lat, lon) in (radians).
+    '''
+    E = _OSGB36.ellipsoid  # Airy130
+    Mabcd = E.Mabcd
+
+    a, M = _A0, 0
+    while True:
+        t = n - _N0 - M
+        if t < _10um:
+            break
+        a += t / (E.a * _F0)
+        M = E.b * _M(Mabcd, a)
+
+    ca, sa, ta = cos(a), sin(a), tan(a)
+
+    s = 1 - E.e2 * sa * sa
+    v = E.a * _F0 / sqrt(s)
+    r = v * E.e12 / s
+
+    x2 = v / r - 1  # η
+
+    v3 = v * v * v
+    v5 = v * v * v3
+    v7 = v * v * v5
+
+    ta2 = ta  * ta
+    ta4 = ta2 * ta2
+    ta6 = ta4 * ta2
+
+    V4 = (a,
+          ta / (  2 * r * v),
+          ta / ( 24 * r * v3) * fdot((5, 3, 1, -9), 1, ta2, x2, x2 * ta2),
+          ta / (720 * r * v5) * fdot((61, 90, 45), 1, ta2, ta4))
+
+    sca = 1 / ca
+    X5 = (_B0,
+          sca / v,
+          sca / (   6 * v3) * (v / r + 2 * ta),
+          sca / ( 120 * v5) * fdot((5, 28, 24), 1, ta2, ta4),
+          sca / (5040 * v7) * fdot((61, 662, 1320, 720), ta, ta2, ta4, ta6))
+
+    d  = e - _E0
+    d2 = d  * d
+    d4 = d2 * d2
+    d6 = d2 * d4
+
+    a = fdot(V4, 1,    -d2,     d4,     -d6)
+    b = fdot(X5, 1, d, -d2 * d, d4 * d, -d6 * d)
+    return a, b
+
+
 class Osgr(Base):
     '''OSGR coordinate.
     '''
@@ -141,54 +278,7 @@ class Osgr(Base):
         if not issubclass(LatLon, LatLonEllipsoidalBase):
             raise TypeError('%s not %s: %r' % ('LatLon', 'ellipsoidal', LatLon))
 
-        E = _OSGB36.ellipsoid  # Airy130
-        Mabcd = E.Mabcd
-
-        e, n = self._easting, self._northing
-
-        a, M = _A0, 0
-        while True:
-            t = n - _N0 - M
-            if t < _10um:
-                break
-            a += t / (E.a * _F0)
-            M = E.b * _M(Mabcd, a)
-
-        ca, sa, ta = cos(a), sin(a), tan(a)
-
-        s = 1 - E.e2 * sa * sa
-        v = E.a * _F0 / sqrt(s)
-        r = v * E.e12 / s
-
-        x2 = v / r - 1  # η
-
-        v3 = v * v * v
-        v5 = v * v * v3
-        v7 = v * v * v5
-
-        ta2 = ta  * ta
-        ta4 = ta2 * ta2
-        ta6 = ta4 * ta2
-
-        V4 = (a,
-              ta / (  2 * r * v),
-              ta / ( 24 * r * v3) * fdot((5, 3, 1, -9), 1, ta2, x2, x2 * ta2),
-              ta / (720 * r * v5) * fdot((61, 90, 45), 1, ta2, ta4))
-
-        sca = 1 / ca
-        X5 = (_B0,
-              sca / v,
-              sca / (   6 * v3) * (v / r + 2 * ta),
-              sca / ( 120 * v5) * fdot((5, 28, 24), 1, ta2, ta4),
-              sca / (5040 * v7) * fdot((61, 662, 1320, 720), ta, ta2, ta4, ta6))
-
-        d  = e - _E0
-        d2 = d  * d
-        d4 = d2 * d2
-        d6 = d2 * d4
-
-        a = fdot(V4, 1,    -d2,     d4,     -d6)
-        b = fdot(X5, 1, d, -d2 * d, d4 * d, -d6 * d)
+        a, b = _en2ab(self._easting, self._northing)
 
         ll = LatLon(degrees90(a), degrees180(b), datum=_OSGB36)
         if datum != _OSGB36:
@@ -216,11 +306,6 @@ class Osgr(Base):
            >>> str(r)  # TG 5140 1317
            >>> r.toStr(prec=0)  # 651409,313177
         '''
-        def _i2c(i):
-            if i > 7:
-                i += 1
-            return chr(ord('A') + i)
-
         e, n, s = self._easting, self._northing, ','
         if prec > 0:
             w = prec // 2
@@ -233,11 +318,8 @@ class Osgr(Base):
             E, N = int(E), int(N)
             if 0 > E or E > 6 or 0 > N or N > 12:
                 return ''
-            N = 19 - N
-            EN = _i2c( N - (N % 5) + (E + 10) // 5) + \
-                 _i2c((N * 5) % 25 + (E % 5))
 
-            t = [EN, '%0*d' % (w, int(e * p)),
+            t = [_EN100k[E][N], '%0*d' % (w, int(e * p)),
                      '%0*d' % (w, int(n * p))]
             s = sep
 
@@ -375,43 +457,196 @@ def toOsgr(latlon, lon=None, datum=Datums.WGS84):
     if latlon.datum != _OSGB36:
         latlon = latlon.convertDatum(_OSGB36)
 
-    E = _OSGB36.ellipsoid
+    e, n = _ab2en(radians(latlon.lat), radians(latlon.lon))
+    return Osgr(e, n)
 
-    a, b = radians(latlon.lat), radians(latlon.lon)
 
-    ca, sa, ta = cos(a), sin(a), tan(a)
+def osgr_toLatLon_many(eastings, northings, datum=Datums.WGS84):
+    '''Convert many OSGR coordinates to lat-/longitudes.
 
-    s = 1 - E.e2 * sa * sa
-    v = E.a * _F0 / sqrt(s)
-    r = s / E.e12  # = v / r = v / (v * E.e12 / s)
+       Each coordinate is converted as by L{Osgr.toLatLon}, but
+       without creating any L{Osgr}, L{LatLon} or L{Cartesian}
+       instances.
 
-    ca3 = ca * ca * ca
-    ca5 = ca * ca * ca3
+       @param eastings: Eastings from OS false easting (meter[] or meter).
+       @param northings: Northings from OS false northing (meter[] or meter).
+       @keyword datum: Datum to convert to (L{Datum}).
 
-    ta2 = ta  * ta
-    ta4 = ta2 * ta2
+       @return: 3-Tuple (lats, lons, errors) with lists of lat- and
+                longitudes (degrees90, degrees180), None for invalid
+                coordinates and a dict of the ValueError of each
+                invalid coordinate, by index.
 
-    x2 = r - 1  # η
+       @raise ValueError: Unequal number of east- and northings.
 
-    I4 = (E.b * _M(E.Mabcd, a) + _N0,
-         (v /   2) * sa * ca,
-         (v /  24) * sa * ca3 * (5 - ta2 + 9 * x2),
-         (v / 720) * sa * ca5 * (61 - 58 * ta2 + ta4))
+       @example:
 
-    V4 = (_E0,
-          v * ca,
-         (v /   6) * ca3 * (r - ta2),
-         (v / 120) * ca5 * (5 - 18 * ta2 + ta4 + 14 * x2 - 58 * ta2 * x2))
+       >>> lats, lons, xs = osgr_toLatLon_many((651409.903,), (313177.270,))
+    '''
+    n, ens = _broadcast(eastings, northings)
+    lats, lons, xs = [None] * n, [None] * n, {}
 
-    d = b - _B0
-    d2 = d  * d
-    d3 = d2 * d
-    d5 = d2 * d3
+    m = _helmert12(_OSGB36, datum)
+    E1, E2 = _OSGB36.ellipsoid, datum.ellipsoid
+    for i, (e, y) in enumerate(ens):
+        try:
+            a, b = _en2ab(false2f(e, 'easting'),
+                          false2f(y, 'northing'))
+        except ValueError as x:
+            xs[i] = x
+            continue
+        if m:  # fused convertDatum
+            x, y, z = _llh2xyz(a, b, 0, E1)
+            a, b, _ = _xyz2llh(*_xyz12(m, x, y, z), E=E2)
+        lats[i], lons[i] = degrees90(a), degrees180(b)
 
-    n = fdot(I4, 1, d2, d3 * d, d5 * d)
-    e = fdot(V4, 1, d,  d3,     d5)
+    return lats, lons, xs
 
-    return Osgr(e, n)
+
+def osgr_toStr_many(eastings, northings, prec=10, sep=' '):
+    '''Format many OSGR coordinates as grid letter references.
+
+       Each coordinate is formatted as by L{Osgr.toStr} with
+       positive prec, using a lookup table for the grid letters.
+
+       @param eastings: Eastings from OS false easting (meter[] or meter).
+       @param northings: Northings from OS false northing (meter[] or meter).
+       @keyword prec: Number of digits, 2..10 (int).
+       @keyword sep: Separator to join (string).
+
+       @return: 2-Tuple (strs, errors) with a list of references
+                "EN easting northing" (string), None for invalid
+                coordinates and a dict of the ValueError of each
+                invalid coordinate, by index.
+
+       @raise ValueError: Invalid prec or unequal number of east-
+                          and northings.
+
+       @example:
+
+       >>> ts, xs = osgr_toStr_many((651409.903,), (313177.270,))
+       >>> ts  # ['TG 51409 13177']
+    '''
+    w = prec // 2
+    if 1 > w or w > 5:
+        raise ValueError('%s invalid: %r' % ('prec', prec))
+    p = (0, 1e-4, 1e-3, 1e-2, 1e-1, 1)[w]  # 10 ** (5 - w)
+    f = sep.join(('%s', '%0*d', '%0*d'))
+
+    n, ens = _broadcast(eastings, northings)
+    ts, xs = [None] * n, {}
+    for i, (e, y) in enumerate(ens):
+        try:
+            E, e = divmod(false2f(e, 'easting'), _100km)
+            N, y = divmod(false2f(y, 'northing'), _100km)
+            E, N = int(E), int(N)
+            if E > 6 or N > 12:
+                raise ValueError('%s invalid: %r' % ('grid', (E, N)))
+        except ValueError as x:
+            xs[i] = x
+            continue
+        ts[i] = f % (_EN100k[E][N], w, int(e * p), w, int(y * p))
+
+    return ts, xs
+
+
+def parseOSGR_many(strOSGRs):
+    '''Parse many OSGR coordinate strings.
+
+       Each string is parsed as by L{parseOSGR}, using a lookup
+       table for the grid letters and without creating any L{Osgr}
+       instances.
+
+       @param strOSGRs: OSGR coordinates (string[]).
+
+       @return: 3-Tuple (eastings, northings, errors) with lists
+                of east- and northings (meter), None for invalid
+                strings and a dict of the ValueError of each invalid
+                string, by index.
+
+       @example:
+
+       >>> es, ns, xs = parseOSGR_many(('TG 51409 13177', '651409,313177'))
+    '''
+    def _s2m(E, g):  # digits to meter
+        if not g.isdigit():
+            raise ValueError
+        return E * _100km + int((g + '00000')[:5])
+
+    n = len(strOSGRs)
+    es, ns, xs = [None] * n, [None] * n, {}
+    for i, s in enumerate(strOSGRs):
+        try:
+            s = s.strip()
+            g = s.split(',')
+            if len(g) == 2:  # "easting,northing"
+                if len(s) < 13:
+                    raise ValueError
+                e, y = float(g[0]), float(g[1])
+
+            else:  # "GR easting northing"
+                E, N = _EN2EN[s[:2].upper()]
+
+                g = s[2:].split()
+                if len(g) == 1:  # no whitespace
+                    g = halfs(g[0])
+                elif len(g) != 2:
+                    raise ValueError
+
+                e, y = _s2m(E, g[0]), _s2m(N, g[1])
+
+            es[i], ns[i] = false2f(e, 'easting'), false2f(y, 'northing')
+        except (AttributeError, KeyError, ValueError):
+            xs[i] = ValueError('%s invalid: %r' % ('strOSGR', s))
+
+    return es, ns, xs
+
+
+def toOsgr_many(lats, lons, datum=Datums.WGS84):
+    '''Convert many lat-/longitudes to OSGR coordinates.
+
+       Each lat-/longitude is converted as by L{toOsgr}, but
+       without creating any L{LatLon}, L{Cartesian} or L{Osgr}
+       instances.  All heights are zero.
+
+       @param lats: Latitudes (degrees[] or degrees).
+       @param lons: Longitudes (degrees[] or degrees).
+       @keyword datum: Datum of the lat-/longitudes (L{Datum}).
+
+       @return: 3-Tuple (eastings, northings, errors) with lists
+                of east- and northings (meter), None for invalid
+                points and a dict of the ValueError of each invalid
+                point, by index.
+
+       @raise ValueError: Unequal number of lat- and longitudes.
+
+       @example:
+
+       >>> es, ns, xs = toOsgr_many((52.65798,), (1.71605,))
+       >>> es, ns  # [651409.902...], [313177.450...]
+    '''
+    n, abs_ = _broadcast(lats, lons)
+    es, ns, xs = [None] * n, [None] * n, {}
+
+    m = _helmert12(datum, _OSGB36)
+    E1, E2 = datum.ellipsoid, _OSGB36.ellipsoid
+    for i, (a, b) in enumerate(abs_):
+        try:
+            a, b = radians(a), radians(b)
+        except TypeError:
+            xs[i] = ValueError('%s invalid: %r' % ('lat, lon', (a, b)))
+            continue
+        if m:  # fused convertDatum
+            x, y, z = _llh2xyz(a, b, 0, E1)
+            a, b, _ = _xyz2llh(*_xyz12(m, x, y, z), E=E2)
+        e, y = _ab2en(a, b)
+        try:
+            es[i], ns[i] = false2f(e, 'easting'), false2f(y, 'northing')
+        except ValueError as x:
+            es[i] = ns[i] = None
+            xs[i] = x
+
+    return es, ns, xs
 
 # **) MIT License
 #
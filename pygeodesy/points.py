@@ -0,0 +1,209 @@
+
+# -*- coding: utf-8 -*-
+
+'''Compact, array-backed collection L{LatLonArray} of lat-/longitude
+points and the light-weight point class L{LatLon_}.
+
+A L{LatLonArray} keeps the lat-, longitudes and optional heights of
+all points in three C{array.array}s of C doubles, about 24 bytes per
+point instead of several hundred for each L{LatLon} instance.
+
+Indexing or iterating a L{LatLonArray} returns a L{LatLon_} for each
+point, created on demand.  Slicing returns a new L{LatLonArray}.  The
+C{lats}, C{lons} and C{heights} arrays can be passed as-is to batch
+functions like L{ellipsoidalVincenty.distances} and a L{LatLonArray}
+can be passed instead of a list of points to function L{distanceMatrix}
+and the L{simplify} functions, without creating a L{LatLon_} for each
+point.
+
+@newfield example: Example, Examples
+'''
+
+from bases import Base
+from datum import Datums
+from dms   import F_D, latDMS, lonDMS
+
+from array import array
+
+__all__ = ('LatLon_', 'LatLonArray')
+__version__ = '17.04.15'
+
+
+class LatLon_(object):
+    '''Light-weight lat-/longitude point, without methods.
+    '''
+    __slots__ = ('lat', 'lon', 'height')
+
+    def __init__(self, lat, lon, height=0):
+        '''New light-weight point.
+
+           @param lat: Latitude (degrees).
+           @param lon: Longitude (degrees).
+           @keyword height: Optional height (meter).
+        '''
+        self.lat = lat
+        self.lon = lon
+        self.height = height
+
+    def __eq__(self, other):
+        return isinstance(other, LatLon_) and \
+               other.lat == self.lat and \
+               other.lon == self.lon and \
+               other.height == self.height
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, self.toStr())
+
+    def __str__(self):
+        return self.toStr()
+
+    def toStr(self, form=F_D, prec=6, sep=', '):
+        '''String representation of this point.
+
+           @keyword form: Use F_D, F_DM, F_DMS for deg°, deg°min', deg°min'sec" (string).
+           @keyword prec: Number of decimal digits (0..8 or None).
+           @keyword sep: Separator to join (string).
+
+           @return: Point as "lat, lon" (string).
+        '''
+        return sep.join((latDMS(self.lat, form=form, prec=prec),
+                         lonDMS(self.lon, form=form, prec=prec)))
+
+
+class LatLonArray(Base):
+    '''Compact collection of lat-/longitude points, backed by arrays.
+    '''
+    _datum   = Datums.WGS84  #: (INTERNAL) Datum (L{Datum}).
+    _heights = None  #: (INTERNAL) Heights (array('d')).
+    _lats    = None  #: (INTERNAL) Latitudes (array('d')).
+    _lons    = None  #: (INTERNAL) Longitudes (array('d')).
+
+    def __init__(self, lats, lons, heights=None, datum=Datums.WGS84):
+        '''New array of points.
+
+           Any C{array.array('d')} argument is used as-is, without
+           copying, all other sequences or iterables are copied.
+
+           @param lats: Latitudes (degrees[]).
+           @param lons: Longitudes (degrees[]).
+           @keyword heights: Optional heights (meter[]).
+           @keyword datum: Datum of all points (L{Datum}).
+
+           @raise ValueError: Unequal number of lat-, longitudes
+                              and heights.
+
+           @example:
+
+           >>> a = LatLonArray((52.205, 48.857), (0.119, 2.351))
+           >>> a[1]  # LatLon_(48.857°N, 002.351°E)
+        '''
+        self._lats = _array(lats)
+        self._lons = _array(lons)
+        n = len(self._lats)
+        if len(self._lons) != n:
+            raise ValueError('unequal len: %s vs %s' % (n, len(self._lons)))
+        if heights is not None:
+            self._heights = _array(heights)
+            if len(self._heights) != n:
+                raise ValueError('unequal len: %s vs %s' % (n, len(self._heights)))
+        self._datum = datum
+
+    def __getitem__(self, index):
+        '''Get a point (L{LatLon_}) or a slice (L{LatLonArray}).
+        '''
+        if isinstance(index, slice):
+            hs = self._heights
+            if hs is not None:
+                hs = hs[index]
+            return LatLonArray(self._lats[index], self._lons[index],
+                               heights=hs, datum=self._datum)
+        h = 0 if self._heights is None else self._heights[index]
+        return LatLon_(self._lats[index], self._lons[index], h)
+
+    def __iter__(self):
+        '''Yield each point (L{LatLon_}).
+        '''
+        for i in range(len(self._lats)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self._lats)
+
+    @property
+    def datum(self):
+        '''Get the datum of all points (L{Datum}).
+        '''
+        return self._datum
+
+    @property
+    def heights(self):
+        '''Get the heights (array('d')) or None.
+        '''
+        return self._heights
+
+    @property
+    def lats(self):
+        '''Get the latitudes (array('d')).
+        '''
+        return self._lats
+
+    @property
+    def lons(self):
+        '''Get the longitudes (array('d')).
+        '''
+        return self._lons
+
+    def toLatLons(self, LatLon, **kwds):
+        '''Create a full-fledged instance for each point.
+
+           @param LatLon: LatLon class to use (L{LatLon}).
+           @keyword kwds: Optional, additional LatLon keyword
+                          arguments, like datum=self.datum.
+
+           @return: The points (LatLon[]).
+        '''
+        hs = self._heights
+        if hs is None:
+            hs = [0] * len(self)
+        return [LatLon(a, b, height=h, **kwds) for a, b, h in
+                zip(self._lats, self._lons, hs)]
+
+    def toStr(self, **unused):
+        '''String representation of this array.
+
+           @return: Number of points and datum (string).
+        '''
+        return 'len=%s, datum=%s' % (len(self), self._datum.name)
+
+
+def _array(xs):
+    '''(INTERNAL) Array of doubles, shared or copied.
+    '''
+    if isinstance(xs, array) and xs.typecode == 'd':
+        return xs
+    return array('d', xs)
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
@@ -32,6 +32,15 @@ a point and a path edge.  If True, use the shortest distance to the
 path edge or path end points, False use the perpendicular distance to
 the extended path edge line.
 
+Generator functions L{isimplify1}, L{isimplify2} and L{isimplifyRDP}
+consume an iterator of points, like an unbounded GPS feed, and yield
+the simplified points using a bounded amount of memory.  The first two
+produce the same points as L{simplify1} respectively L{simplify2},
+L{isimplifyRDP} applies L{simplifyRDP} to consecutive windows of points.
+
+Instead of a list of points, all functions accept a L{LatLonArray},
+except for keyword I{attr} of the VW functions.
+
 For all functions, keyword I{adjust} scales the longitudinal distance
 between two points by the cosine of the mean of the latitudes.
 
@@ -54,36 +63,19 @@ Tested with 64-bit Python 2.6.9, 2.7.13, 3.5.3 and 3.6.0 on macOS
 '''
 
 from datum import R_M
-from utils import EPS, len2, radiansPI, wrap180
+from points import LatLonArray
+from utils import EPS, PI, PI2, len2
 
+from heapq import heapify, heappop, heappush
 from math  import cos, degrees, radians
 
-__all__ = ('simplify1', 'simplify2',
+__all__ = ('isimplify1', 'isimplify2', 'isimplifyRDP',
+           'simplify1', 'simplify2',
            'simplifyRDP', 'simplifyRDPm',
            'simplifyVW', 'simplifyVWm')
 __version__ = '17.04.15'
 
 
-# try:
-#     from collections import namedtuple
-#     _T2 = namedtuple('_T2', 'ix, h2')
-# except ImportError:
-#    class _T2(object):
-#        ...
-# namedtuple not used because (a) values can not
-# be updated and (b) it produces PyChecker warning
-# "<string>:28: self is not first method argument"
-# which can not be suppressed by option --stdlib
-class _T2(object):
-    '''(INTERNAL) VW 2-tuple (index, area).
-    '''
-    __slots__ = 'ix', 'h2'
-
-    def __init__(self, ix, h2):
-        self.ix = ix
-        self.h2 = h2
-
-
 class _Sy(object):
     '''(INTERNAL) Simplify state.
     '''
@@ -91,16 +83,29 @@ class _Sy(object):
     d2i    = None  # d2iP or d2iS
     d2xyse = ()
     eps    = EPS  # system epsilon
+    h2     = []  # VW triangular areas
+    hq     = None  # VW priority queue
+    lats   = []  # points[].lat
+    lons   = []  # points[].lon
     n      = 0
+    nx     = []  # VW next indices
     pts    = []
+    pv     = []  # VW previous indices
     radius = R_M
-    r      = {}  # indices or 2-tuples
+    r      = {}  # indices
     s2     = EPS
 
     def __init__(self, points, tolerance, radius, adjust, shortest):
         '''New state.
         '''
-        n, self.pts = len2(points)
+        if isinstance(points, LatLonArray):  # use arrays as-is
+            n, self.pts = len(points), points
+            self.lats, self.lons = points.lats, points.lons
+        else:
+            n, self.pts = len2(points)
+            # lat- and longitudes as lists, once
+            self.lats = [p.lat for p in self.pts]
+            self.lons = [p.lon for p in self.pts]
         if n > 0:
             self.n = n
             self.r = {0: True, n-1: True}  # dict to avoid duplicates
@@ -111,9 +116,7 @@ class _Sy(object):
         self.radius = radius
 
         # tolerance converted to degrees squared
-        s2  = degrees(float(tolerance) / radius)
-        s2 *= s2
-        self.s2 = max(s2, EPS)
+        self.s2 = _s2(tolerance, radius)
 
         self.d2i = self.d2iS if shortest else self.d2iP  # PYCHOK false
 
@@ -130,12 +133,27 @@ class _Sy(object):
            to -[e] exceeding the tolerance.
         '''
         d21, x21, y21, s, _ = self.d2xyse
-        eps, d2xy = self.eps, self.d2xy
-        t2, t = self.s2, 0  # tallest
+        eps, t2, t = self.eps, self.s2, 0  # tallest
+        a1, b1 = self.lats[s], self.lons[s]
+        lats, lons = self.lats, self.lons
+        adjust = self.adjust
         for i in range(n, m):
-            d2, x01, y01 = d2xy(s, i)
-            if d2 > eps:
-                d2  = x01 * y21 + y01 * x21
+            # distance points[i] to -[s], _d2xy inlined
+            # for speed, keep the copies in sync
+            a2 = lats[i]
+            dx = (lons[i] - b1) % 360
+            if dx > 180:
+                dx -= 360
+            dy = (a2 - a1) % 360
+            if dy > 180:
+                dy -= 360
+            if adjust:
+                r = radians(a1 + a2) % PI2
+                if r > PI:
+                    r -= PI2
+                dx *= cos(r * 0.5)
+            if (dx * dx + dy * dy) > eps:
+                d2  = dx * y21 + dy * x21
                 d2 *= d2 / d21
                 if d2 > t2:
                     t2, t = d2, i
@@ -151,17 +169,33 @@ class _Sy(object):
         d21, x21, y21, s, e = self.d2xyse
         eps, d2xy = self.eps, self.d2xy
         t2, t = self.s2, 0  # tallest
+        a1, b1 = self.lats[s], self.lons[s]
+        lats, lons = self.lats, self.lons
+        adjust = self.adjust
         for i in range(n, m):
-            # distance points[i] to -[s]
-            d2, x01, y01 = d2xy(s, i)
+            # distance points[i] to -[s], _d2xy inlined
+            # for speed, keep the copies in sync
+            a2 = lats[i]
+            dx = (lons[i] - b1) % 360
+            if dx > 180:
+                dx -= 360
+            dy = (a2 - a1) % 360
+            if dy > 180:
+                dy -= 360
+            if adjust:
+                r = radians(a1 + a2) % PI2
+                if r > PI:
+                    r -= PI2
+                dx *= cos(r * 0.5)
+            d2 = dx * dx + dy * dy
             if d2 > eps:
-                x = x01 * x21 - y01 * y21
+                x = dx * x21 - dy * y21
                 if x > 0:
                     if (x * x) > d21:
                         # distance points[i] to -[e]
                         d2, _, _ = d2xy(e, i)
                     else:  # perpendicular distance
-                        d2  = x01 * y21 + y01 * x21
+                        d2  = dx * y21 + dy * x21
                         d2 *= d2 / d21
                 if d2 > t2:
                     t2, t = d2, i
@@ -172,17 +206,8 @@ class _Sy(object):
     def d2xy(self, i, j):
         '''Returns points[i] to [j] deltas.
         '''
-        p1 = self.pts[i]
-        p2 = self.pts[j]
-
-        dx = wrap180(p2.lon - p1.lon)
-        dy = wrap180(p2.lat - p1.lat)
-
-        if self.adjust:  # scale lon
-            dx *= cos(radiansPI(p1.lat + p2.lat) * 0.5)
-
-        d2 = dx * dx + dy * dy  # squared!
-        return d2, dx, dy
+        lats, lons = self.lats, self.lons
+        return _d2xy(lats[i], lons[i], lats[j], lons[j], self.adjust)
 
     def h2t(self, i1, i0, i2):
         '''Computes the Visvalingam-Whyatt triangular area,
@@ -204,77 +229,264 @@ class _Sy(object):
         '''
         return [self.pts[i] for i in sorted(r.keys())]
 
+    def rm0(self, i):
+        '''Unlinks Visvalingam-Whyatt point i.
+        '''
+        nx, pv = self.nx, self.pv
+        n, p = nx[i], pv[i]
+        nx[p], pv[n] = n, p
+        self.h2[i] = None
+        self.n -= 1
+        return n
+
     def rm1(self, m, tol):
         '''Eliminates one Visvalingam-Whyatt point and recomputes
            the trangular area of both neighboring points, but
            removes those too until its recomputed area exceeds
            the tolerance.
+
+           @return: The point following the left neighbor's
+                    position, that neighbor if not removed.
         '''
-        h2t, r = self.h2t, self.r
-
-        r.pop(m)
-        for n in (m, m - 1):
-            while 0 < n < (len(r) - 1):
-                h2 = h2t(r[n-1].ix, r[n].ix, r[n+1].ix)
-                if h2 > tol:
-                    r[n].h2 = h2
-                    break  # while
-                else:
-                    r.pop(n)
+        p = self.pv[m]
+        self.rm3(self.rm0(m), tol)
+        return self.rm3(p, tol)
 
     def rm2(self, tol):
         '''Eliminates all Visvalingam-Whyatt points with a
            triangular area not exceeding the tolerance.
         '''
-        r, rm1 = self.r, self.rm1
-
-        i = len(r) - 1
-        while i > 1:
-            i -= 1
-            if r[i].h2 <= tol:
-                rm1(i, tol)
-                i = min(i, len(r) - 1)
+        h2, pv, rm1 = self.h2, self.pv, self.rm1
+
+        e = len(h2) - 1
+        i = pv[e]
+        while i > 0:
+            if h2[i] <= tol:
+                i = rm1(i, tol)
+                if i == e:
+                    i = pv[i]
+            else:
+                i = pv[i]
+
+    def rm3(self, i, tol):
+        '''Recomputes the triangular area of point i and
+           removes it and any following points until the
+           recomputed area exceeds the tolerance.
+
+           @return: The last point recomputed or the end.
+        '''
+        h2, h2t, hq, nx, pv = self.h2, self.h2t, self.hq, self.nx, self.pv
+
+        e = len(h2) - 1
+        while 0 < i < e:
+            h = h2t(pv[i], i, nx[i])
+            if h > tol:
+                h2[i] = h
+                if hq is not None:
+                    heappush(hq, (h, i))
+                break
+            i = self.rm0(i)
+        return i
 
     def vw(self):
-        '''Initializes Visvalingam-Whyatt as list of 2-Tuples
-           (ix, h2) where ix is the points[] index and h2
-           the triangular area (times 2) of that point.
+        '''Initializes Visvalingam-Whyatt as linked list of the
+           points[] indices and the triangular area (times 2) of
+           each point.
         '''
         n, h2t, s2 = self.n, self.h2t, self.s2
 
-        if n > 2:
-            s2 *= 2
-            r = [_T2(0, s2 + 1)]
-            r.extend(_T2(i, h2t(i-1, i, i+1)) for i in range(1, n-1))
-            r.append(_T2(n-1, s2 + 1))
-        elif n > 0:
-            r = [_T2(i, 0) for i in range(0, n)]
-        else:
-            r = []
+        s2 *= 2
+        h2 = [s2 + 1] * n  # end points
+        for i in range(1, n-1):
+            h2[i] = h2t(i-1, i, i+1)
 
-        self.r, self.s2 = r, s2
-        return len(r), r
+        self.h2, self.s2 = h2, s2
+        self.nx = list(range(1, n+1))
+        self.pv = list(range(-1, n-1))
+        return n
+
+    def vwh(self):
+        '''Eliminates the Visvalingam-Whyatt point with the
+           smallest triangular area, repeatedly until that area
+           exceeds the tolerance, using a priority queue.
+        '''
+        h2, rm1, s2 = self.h2, self.rm1, self.s2
+
+        self.hq = hq = [(h2[i], i) for i in self.vwi() if 0 < i < len(h2) - 1]
+        heapify(hq)
+        while hq and self.n > 2:
+            h, i = heappop(hq)
+            if h2[i] == h:  # not removed or updated
+                if h > s2:
+                    break
+                rm1(i, 0)
+        self.hq = None
+
+    def vwi(self):
+        '''Yields the indices of all remaining points.
+        '''
+        i, n, nx = 0, len(self.h2), self.nx
+        while i < n:
+            yield i
+            i = nx[i]
 
     def vwr(self, attr):
         '''Returns Visvalingam-Whyatt results as dict,
            optionally including the triangular area
            (in meters) for each simplified point.
         '''
-        pts, r, radius, s2 = self.pts, self.r, self.radius, self.s2
+        h2, pts, radius, s2 = self.h2, self.pts, self.radius, self.s2
+        r = list(self.vwi())
 
         # double check the minimal triangular area
-        assert min(t2.h2 for t2 in r) > s2 > 0
+        assert min(h2[i] for i in r) > s2 > 0 if r else True
 
         if attr:  # return triangular area (times 2)
-            r[0].h2 = r[-1].h2 = 0
-            for t2 in r:  # convert back to meter
-                setattr(pts[t2.ix], attr, radians(t2.h2) * radius)
+            for i in r:  # convert back to meter
+                h = h2[i] if 0 < i < len(h2) - 1 else 0
+                setattr(pts[i], attr, radians(h) * radius)
+
+        return dict((i, True) for i in r)  # as dict
+
+
+def _d2xy(a1, b1, a2, b2, adjust):
+    '''(INTERNAL) Returns point 1 to 2 deltas.
+
+       Inlined in methods _Sy.d2iP and _Sy.d2iS for speed.
+    '''
+    # inlined wrap180(b2 - b1) and wrap180(a2 - a1)
+    dx = (b2 - b1) % 360
+    if dx > 180:
+        dx -= 360
+    dy = (a2 - a1) % 360
+    if dy > 180:
+        dy -= 360
+
+    if adjust:  # scale lon, inlined radiansPI
+        r = radians(a1 + a2) % PI2
+        if r > PI:
+            r -= PI2
+        dx *= cos(r * 0.5)
+
+    d2 = dx * dx + dy * dy  # squared!
+    return d2, dx, dy
+
+
+def _s2(tolerance, radius):
+    '''(INTERNAL) Tolerance converted to degrees squared.
+    '''
+    s2  = degrees(float(tolerance) / radius)
+    s2 *= s2
+    return max(s2, EPS)
+
+
+def isimplify1(points, distance, radius=R_M, adjust=True):
+    '''Basic simplification of a path of LatLon points, streaming.
+
+       Like function L{simplify1} but consuming any iterable of
+       points and yielding the simplified points as soon as known,
+       without keeping more than two points.
+
+       @param points: Path points (LatLons).
+       @param distance: Tolerance (meter, same units a radius).
+       @keyword radius: Earth radius (meter).
+       @keyword adjust: Adjust longitudes (bool).
+
+       @return: Generator of the simplified points (LatLons).
+
+       @example:
+
+       >>> for p in isimplify1(feed, 10):  # feed never ends
+       >>>     ...
+    '''
+    s2 = _s2(distance, radius)
+
+    i = q = None  # last yielded and last point
+    for q in points:
+        if i is None or _d2xy(i.lat, i.lon, q.lat, q.lon, adjust)[0] > s2:
+            i = q
+            yield q
+    if q is not i:
+        yield q
+
+
+def isimplify2(points, band2, radius=R_M, adjust=True, shortest=False):
+    '''Pipe simplification of a path of LatLon points, streaming.
+
+       Like function L{simplify2} but consuming any iterable of
+       points and yielding the simplified points as soon as known,
+       without keeping more than three points.
+
+       @param points: Path points (LatLons).
+       @param band2: Half band width (meter, same units a radius).
+       @keyword radius: Earth radius (meter).
+       @keyword adjust: Adjust longitudes (bool).
+       @keyword shortest: Shortest or perpendicular distance (bool).
 
-        # double check for duplicates
-        n = len(r)
-        r = dict((t2.ix, True) for t2 in r)
-        assert len(r) == n
-        return r  # as dict
+       @return: Generator of the simplified points (LatLons).
+    '''
+    s2 = _s2(band2, radius)
+
+    s = e = q = None  # start, end of edge and last point
+    for q in points:
+        if s is None:
+            s = q
+            yield q
+        elif e is None:  # set path edge, see _Sy.d21
+            d21, x21, y21 = _d2xy(s.lat, s.lon, q.lat, q.lon, adjust)
+            if d21 > EPS:
+                e = q
+        else:  # see _Sy.d2iP and -.d2iS
+            d2, x01, y01 = _d2xy(s.lat, s.lon, q.lat, q.lon, adjust)
+            if d2 > EPS:
+                x = x01 * x21 - y01 * y21
+                if not shortest or x > 0:
+                    if shortest and (x * x) > d21:
+                        d2, _, _ = _d2xy(e.lat, e.lon, q.lat, q.lon, adjust)
+                    else:  # perpendicular distance
+                        d2  = x01 * y21 + y01 * x21
+                        d2 *= d2 / d21
+                if d2 > s2:
+                    s, e = q, None
+                    yield q
+    if q is not s:
+        yield q
+
+
+def isimplifyRDP(points, distance, radius=R_M, adjust=True, shortest=False, window=1024):
+    '''Ramer-Douglas-Peucker (RDP) simplification of a path of LatLon
+       points, streaming.
+
+       Like function L{simplifyRDP} but consuming any iterable of
+       points in consecutive windows and yielding the simplified
+       points of each window.  The last point of a window is kept
+       and starts the next window.
+
+       @param points: Path points (LatLons).
+       @param distance: Tolerance (meter, same units a radius).
+       @keyword radius: Earth radius (meter).
+       @keyword adjust: Adjust longitudes (bool).
+       @keyword shortest: Shortest or perpendicular distance (bool).
+       @keyword window: Maximum number of points per window (int).
+
+       @return: Generator of the simplified points (LatLons).
+
+       @raise ValueError: Invalid window.
+    '''
+    if window < 2:
+        raise ValueError('%s invalid: %r' % ('window', window))
+
+    w = []
+    for p in points:
+        w.append(p)
+        if len(w) >= window:
+            w = simplifyRDP(w, distance, radius=radius, adjust=adjust, shortest=shortest)
+            for p in w[:-1]:
+                yield p
+            w = w[-1:]
+    if w:  # remaining points
+        for p in simplifyRDP(w, distance, radius=radius, adjust=adjust, shortest=shortest):
+            yield p
 
 
 def simplify1(points, distance, radius=R_M, adjust=True):
@@ -438,9 +650,10 @@ def simplifyVW(points, area2, radius=R_M, adjust=True, attr=None):
        Eliminate any points too close together or with a triangular
        area not exceeding the given area tolerance squared.
 
-       This VW method exhaustively searches for the single point
-       with the smallest triangular area, resulting in worst-case
-       complexity O(n**2) where n is the number of points.
+       This VW method repeatedly removes the single point with
+       the smallest triangular area, using a priority queue and
+       a linked list of neighboring points, resulting in worst-case
+       complexity O(n * log(n)) where n is the number of points.
 
        @param points: Path points (LatLons).
        @param area2: Tolerance (meter, same units a radius).
@@ -452,23 +665,14 @@ def simplifyVW(points, area2, radius=R_M, adjust=True, attr=None):
     '''
     S = _Sy(points, area2, radius, adjust, False)
 
-    n, r = S.vw()
-    if n > 2:
+    if S.vw() > 2:
         # remove any points too close or
         # with a zero triangular area
         S.rm2(0)
 
         # keep removing the point with the smallest
         # area until latter exceeds the tolerance
-        while len(r) > 2:
-            m, m2 = 0, S.s2 + 1
-            for i in range(1, len(r)-1):
-                h2 = r[i].h2
-                if h2 < m2:
-                    m, m2 = i, h2
-            if m2 > S.s2:
-                break
-            S.rm1(m, 0)
+        S.vwh()
 
     return S.points(S.vwr(attr))
 
@@ -495,8 +699,7 @@ def simplifyVWm(points, area2, radius=R_M, adjust=True, attr=None):
     '''
     S = _Sy(points, area2, radius, adjust, False)
 
-    n, _ = S.vw()
-    if n > 2:
+    if S.vw() > 2:
         # remove all points with an area
         # not exceeding the tolerance
         S.rm2(S.s2)
@@ -25,17 +25,19 @@ from math import acos, atan2, cos, hypot, log, sin
 __all__ = ('LatLonSphericalBase',)
 __version__ = '17.02.15'
 
+_Sphere = Datums.Sphere  #: (INTERNAL) Default datum (L{Datum}).
+
 
 class LatLonSphericalBase(LatLonHeightBase):
     '''(INTERNAL) Base class for spherical Latlons.
     '''
-    _datum = Datums.Sphere  #: (INTERNAL) XXX TBD
+    __slots__ = ('_datum',)  # (INTERNAL) XXX TBD, set only if not _Sphere
 
     @property
     def datum(self):
         '''Get this point's datum (L{Datum}).
         '''
-        return self._datum
+        return getattr(self, '_datum', _Sphere)
 
     @datum.setter  # PYCHOK setter!
     def datum(self, datum):
@@ -52,7 +54,7 @@ class LatLonSphericalBase(LatLonHeightBase):
         E = datum.ellipsoid
         if E.isellipsoidal():
             raise ValueError('%r not %s: %r' % ('datum', 'spherical', datum))
-        self._update(datum != self._datum)
+        self._update(datum != self.datum)
         self._datum = datum
 
     def finalBearingTo(self, other):
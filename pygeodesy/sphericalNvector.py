@@ -1,9 +1,9 @@
 
 # -*- coding: utf-8 -*-
 
-'''Vector-based spherical geodetic (lat-/longitude) classes L{LatLon}
-and L{Nvector} and functions L{areaOf}, L{intersection}, L{meanOf},
-L{triangulate} and L{trilaterate}.
+'''Vector-based spherical geodetic (lat-/longitude) classes L{LatLon},
+L{Nvector} and L{NvectorTree} and functions L{areaOf}, L{intersection},
+L{meanOf}, L{triangulate} and L{trilaterate}.
 
 Python implementation of vector-based spherical geodetic (lat-/longitude)
 methods.  Transcribed from JavaScript originals by I{(C) Chris Veness
@@ -33,12 +33,14 @@ from datum import R_M
 from nvector import NorthPole, LatLonNvectorBase, \
                     Nvector as NvectorBase, sumOf
 from sphericalBase import LatLonSphericalBase
-from utils import EPS, EPS1, PI, PI_2, degrees360, fsum, isscalar
+from utils import EPS, EPS1, PI, PI_2, degrees360, fsum, isscalar, len2
+from vector3d import _cross, _unit, angle_many, cross_many
 
-from math import atan2, cos, radians, sin
+from heapq import heappush, heapreplace
+from math import asin, atan2, cos, radians, sin, sqrt
 
 # all public contants, classes and functions
-__all__ = ('LatLon', 'Nvector',  # classes
+__all__ = ('LatLon', 'Nvector', 'NvectorTree',  # classes
            'areaOf', 'intersection', 'meanOf',  # functions
            'triangulate', 'trilaterate')
 __version__ = '17.03.21'
@@ -55,7 +57,8 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
        >>> from sphericalNvector import LatLon
        >>> p = LatLon(52.205, 0.119)
     '''
-    _Nv = None  #: (INTERNAL) cache _toNvector L{Nvector}).
+    __slots__ = ('_Nv',  # (INTERNAL) cache _toNvector L{Nvector}).
+                 '__dict__')  # other attributes, created lazily
 
     def _gc3(self, start, end, namend):
         '''(INTERNAL) Return great circle, start and end Nvectors.
@@ -349,11 +352,13 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
            @JSname: I{enclosedBy}.
         '''
         n, points = self.points(points)
-        v = self.toNvector()
+        v = self.toNvector().to3xyz()
+        x, y, z = v
         # get vectors from p to each point
-        vs = [v.minus(p.toNvector()) for p in points]
-        # close the polygon so that the last point equals the first
-        vs.append(vs[0])
+        vs = []
+        for p in points:
+            px, py, pz = p.toNvector().to3xyz()
+            vs.append((x - px, y - py, z - pz))
 
         # sum subtended angles of each edge (using v to determine sign)
 
@@ -364,7 +369,8 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
         # angles will be small but non-zero.
 
         # XXX are winding number optimisations applicable to spherical surface?
-        s = fsum(vs[i].angleTo(vs[i+1], vSign=v) for i in range(n))
+        # and close the polygon, pairing the last with the first vector
+        s = fsum(angle_many(vs, vs[1:] + vs[:1], vSign=v))
         return abs(s) > PI
 
     def isWithin(self, point1, point2):
@@ -457,9 +463,10 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
         if self.isWithin(point1, point2):
             # closer to segment than to its endpoints,
             # find the closest point on the segment
-            gc1 = point1.toNvector().cross(point2.toNvector())
-            gc2 = self.toNvector().cross(gc1)
-            p = gc1.cross(gc2).toLatLon()
+            gc1 = _cross(point1.toNvector().to3xyz(),
+                         point2.toNvector().to3xyz())
+            gc2 = _cross(self.toNvector().to3xyz(), gc1)
+            p = Nvector(*_cross(gc1, gc2)).toLatLon()
 
             # beyond segment extent, take closer endpoint
         elif self.distanceTo(point1) < self.distanceTo(point2):
@@ -481,7 +488,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
            >>> n = p.toNvector()
            >>> n.toStr()  # [0.50000, 0.50000, 0.70710]
         '''
-        if self._Nv is None:
+        if getattr(self, '_Nv', None) is None:
             x, y, z, h = self.to4xyzh()
             self._Nv = Nvector(x, y, z, h)
         return self._Nv
@@ -541,6 +548,7 @@ class Nvector(NvectorBase):
 
        Note commonality with L{ellipsoidalNvector.Nvector}.
     '''
+    __slots__ = ()
 
     def toLatLon(self, height=None):
         '''Converts this n-vector to a (sphericalNvector) point.
@@ -583,7 +591,158 @@ class Nvector(NvectorBase):
         return n.minus(e)
 
 
+class NvectorTree(object):
+    '''KD-tree of the n-vectors of several points for nearest
+       neighbour and radius queries on a spherical earth model.
+
+       The n-vectors are split along the x, y or z axis with the
+       largest spread.  Since the chord between two n-vectors
+       increases with the great-circle distance, the tree needs no
+       special handling of the poles or the antimeridian.
+    '''
+    _leafsize = 8
+
+    def __init__(self, points, leafsize=8):
+        '''New KD-tree of n-vectors.
+
+           @param points: The points to index (L{LatLon}[] or any
+                          other objects with lat and lon attributes
+                          or 2-tuples (lat, lon) in degrees).
+           @keyword leafsize: Maximum number of points per leaf (int).
+
+           @raise ValueError: Invalid leafsize.
+
+           @example:
+
+           >>> t = NvectorTree(zip(lats, lons))
+           >>> t.nearest(LatLon(52.205, 0.119), k=3)  # [(d, i), ...]
+        '''
+        if leafsize < 1:
+            raise ValueError('%s invalid: %r' % ('leafsize', leafsize))
+        self._leafsize = leafsize
+
+        _, ps = len2(points)
+        self._xyzs = [_xyz(p) for p in ps]
+        self._root = self._build(list(range(len(ps))))
+
+    def __len__(self):
+        return len(self._xyzs)
+
+    def _build(self, ixs):
+        '''(INTERNAL) Build a leaf, list of point indices or a
+           node, 4-tuple (axis, split, lower, upper).
+        '''
+        if len(ixs) > self._leafsize:
+            xyzs = self._xyzs
+            _, a = max((max(v) - min(v), a) for a, v in
+                       enumerate(zip(*[xyzs[i] for i in ixs])))
+            ixs.sort(key=lambda i: xyzs[i][a])
+            m = len(ixs) // 2
+            ixs = (a, xyzs[ixs[m]][a], self._build(ixs[:m]),
+                                       self._build(ixs[m:]))
+        return ixs
+
+    def nearest(self, point, k=1, radius=R_M):
+        '''Find the k points nearest to the given point.
+
+           @param point: The point (L{LatLon} or 2-tuple (lat, lon)).
+           @keyword k: Number of points to find (int).
+           @keyword radius: Mean earth radius (meter).
+
+           @return: List of k 2-tuples (distance, index), sorted by
+                    great-circle distance, in the same units as radius
+                    and the index of the point in this tree.
+        '''
+        xyzs, h = self._xyzs, []  # max-heap of (-c2, index)
+
+        def _knn(node):
+            if isinstance(node, list):  # leaf
+                for i in node:
+                    c2 = _c2(v, xyzs[i])
+                    if len(h) < k:
+                        heappush(h, (-c2, i))
+                    elif c2 < -h[0][0]:
+                        heapreplace(h, (-c2, i))
+            else:
+                a, s, lo, hi = node
+                d = v[a] - s
+                if d < 0:
+                    _knn(lo)
+                    if len(h) < k or d * d < -h[0][0]:
+                        _knn(hi)
+                else:
+                    _knn(hi)
+                    if len(h) < k or d * d < -h[0][0]:
+                        _knn(lo)
+
+        if k > 0 and self._xyzs:
+            v = _xyz(point)
+            _knn(self._root)
+        return [(_c2d(c2, radius), i) for c2, i in
+                sorted((-c2, i) for c2, i in h)]
+
+    def within(self, point, distance, radius=R_M):
+        '''Find all points within the given distance of the given point.
+
+           @param point: The point (L{LatLon} or 2-tuple (lat, lon)).
+           @param distance: Great-circle distance (same units as radius).
+           @keyword radius: Mean earth radius (meter).
+
+           @return: List of 2-tuples (distance, index), sorted by
+                    great-circle distance, in the same units as radius
+                    and the index of the point in this tree.
+        '''
+        xyzs, r = self._xyzs, []
+
+        def _in(node):
+            if isinstance(node, list):  # leaf
+                for i in node:
+                    c2 = _c2(v, xyzs[i])
+                    if c2 <= m:
+                        r.append((c2, i))
+            else:
+                a, s, lo, hi = node
+                d = v[a] - s
+                if d < 0 or d * d <= m:
+                    _in(lo)
+                if d >= 0 or d * d <= m:
+                    _in(hi)
+
+        if distance >= 0 and self._xyzs:
+            v = _xyz(point)
+            m = distance / float(radius)
+            m = 4.0 if m >= PI else (2 * sin(m * 0.5))**2
+            _in(self._root)
+        return [(_c2d(c2, radius), i) for c2, i in sorted(r)]
+
+
+def _c2(v1, v2):
+    '''(INTERNAL) Squared chord between two n-vectors.
+    '''
+    x, y, z = v1[0] - v2[0], v1[1] - v2[1], v1[2] - v2[2]
+    return x * x + y * y + z * z
+
+
+def _c2d(c2, radius):
+    '''(INTERNAL) Squared chord to great-circle distance.
+    '''
+    return asin(min(sqrt(c2) * 0.5, 1.0)) * 2 * radius
+
+
+def _xyz(p):
+    '''(INTERNAL) N-vector x/y/z components of a point or 2-tuple.
+    '''
+    try:
+        a, b = p.lat, p.lon
+    except AttributeError:
+        a, b = p
+    a, b = radians(a), radians(b)
+    ca = cos(a)
+    return ca * cos(b), ca * sin(b), sin(a)
+
+
 _Nvll = LatLon(0, 0)  #: (INTERNAL) Reference instance (L{LatLon}).
+_NP   = NorthPole.to3xyz()  #: (INTERNAL) North pole x/y/z (3-tuple).
 
 
 def areaOf(points, radius=R_M):
@@ -607,15 +766,11 @@ def areaOf(points, radius=R_M):
     n, points = _Nvll.points(points)
 
     # get great-circle vector for each edge
-    gc, v1 = [], points[n-1].toNvector()
-    for p in points:
-        v2 = p.toNvector()
-        gc.append(v1.cross(v2))  # PYCHOK false, does have .cross
-        v1 = v2
-    gc.append(gc[0])  # XXX needed?
+    vs = [p.toNvector().to3xyz() for p in points]
+    gc = cross_many(vs[-1:] + vs[:-1], vs)
 
     # sum interior angles
-    s = fsum(gc[i].angleTo(gc[i + 1]) for i in range(n))
+    s = fsum(angle_many(gc, gc[1:] + gc[:1]))
     # use Girard’s theorem: A = [Σθᵢ − (n−2)·π]·R²
     return abs(s - (n - 2) * PI) * radius * radius
 
@@ -667,15 +822,15 @@ def intersection(start1, end1, start2, end2):
         d = sumOf((s1, s2, e1, e2)).dot(i1)
     elif e1 and not e2:  # endpoint+bearing
         # gc2 x v2 . i1 +ve means v2 bearing points to i1
-        d = gc2.cross(s2).dot(i1)
+        d = i1.triple(gc2, s2)
     elif e2 and not e1:  # bearing+endpoint
         # gc1 x v1 . i1 +ve means v1 bearing points to i1
-        d = gc1.cross(s1).dot(i1)
+        d = i1.triple(gc1, s1)
     else:  # bearing+bearing
         # if gc x v . i1 is +ve, initial bearing is
         # towards i1, otherwise towards antipodal i2
-        d1 = gc1.cross(s1).dot(i1)  # +ve means p1 bearing points to i1
-        d2 = gc2.cross(s2).dot(i1)  # +ve means p2 bearing points to i1
+        d1 = i1.triple(gc1, s1)  # +ve means p1 bearing points to i1
+        d2 = i1.triple(gc2, s2)  # +ve means p2 bearing points to i1
         if d1 > 0 and d2 > 0:
             d = 1  # both point to i1
         elif d1 < 0 and d2 < 0:
@@ -730,20 +885,21 @@ def triangulate(point1, bearing1, point2, bearing2):
     _Nvll.others(point2, name='point2')
 
     def _gc(p, b):
-        n, t = p.toNvector(), radians(b)
-        de = NorthPole.cross(n).unit()  # east vector @ n
-        dn = n.cross(de)  # north vector @ n
-        dest = de.times(sin(t))
-        dnct = dn.times(cos(t))
-        d = dnct.plus(dest)  # direction vector @ n
-        return n.cross(d)  # great circle point + bearing
+        n, t = p.toNvector().to3xyz(), radians(b)
+        de = _unit(*_cross(_NP, n))  # east vector @ n
+        dn = _cross(n, de)  # north vector @ n
+        st, ct = sin(t), cos(t)
+        d = (dn[0] * ct + de[0] * st,  # direction vector @ n
+             dn[1] * ct + de[1] * st,
+             dn[2] * ct + de[2] * st)
+        return _cross(n, d)  # great circle point + bearing
 
     gc1 = _gc(point1, bearing1)  # great circle p1 + b1
     gc2 = _gc(point2, bearing2)  # great circle p2 + b2
 
     h = point1._alter(point2)
-    i = gc1.cross(gc2)  # n-vector of intersection point
-    return Nvector(i.x, i.y, i.z).toLatLon(height=h)
+    i = _cross(gc1, gc2)  # n-vector of intersection point
+    return Nvector(*i).toLatLon(height=h)
 
 
 def trilaterate(point1, distance1, point2, distance2, point3, distance3, radius=R_M):
@@ -1,8 +1,8 @@
 
 # -*- coding: utf-8 -*-
 
-'''Trigonometric spherical geodetic (lat-longitude) class L{LatLon}
-and functions L{intersection} and L{meanOf}.
+'''Trigonometric spherical geodetic (lat-longitude) classes L{LatLon}
+and L{PreparedPolygon} and functions L{intersection} and L{meanOf}.
 
 Python implementation of geodetic (lat-/longitude) methods using
 spherical trigonometry.  Transcribed from JavaScript originals by
@@ -16,13 +16,13 @@ from datum import R_M
 from sphericalBase import LatLonSphericalBase
 from utils import EPS, EPS1, PI, PI2, PI_2, \
                   degrees90, degrees180, degrees360, \
-                  favg, fsum, hsin, map1, radians, wrapPI
+                  favg, fsum, hsin, len2, map1, radians, wrap180, wrapPI
 from vector3d import Vector3d, sumOf
 
 from math import acos, asin, atan2, cos, hypot, sin, sqrt
 
 # all public contants, classes and functions
-__all__ = ('LatLon',  # classes
+__all__ = ('LatLon', 'PreparedPolygon',  # classes
            'intersection', 'meanOf')  # functions
 __version__ = '17.03.13'
 
@@ -35,7 +35,8 @@ class LatLon(LatLonSphericalBase):
        >>> p = LatLon(52.205, 0.119)  # height=0
     '''
 
-    _v3d = None  # cache Vector3d
+    __slots__ = ('_v3d',  # cache Vector3d
+                 '__dict__')  # other attributes, created lazily
 
     def _update(self, updated):
         '''(INTERNAL) Clear caches if updated.
@@ -295,7 +296,8 @@ class LatLon(LatLonSphericalBase):
         '''Tests whether this point is enclosed by the polygon
            defined by a list, sequence, set or tuple of points.
 
-           @param points: The points defining the polygon (L{LatLon}[]).
+           @param points: The points defining the polygon (L{LatLon}[]
+                          or L{PreparedPolygon}).
 
            @return: True if the polygon encloses this point (bool).
 
@@ -308,7 +310,12 @@ class LatLon(LatLonSphericalBase):
            >>> b = LatLon(45,1), LatLon(45,2), LatLon(46,2), LatLon(46,1)
            >>> p = LatLon(45,1, 1.1)
            >>> inside = p.isEnclosedBy(b)  # True
+
+           @see: Class L{PreparedPolygon} to test many points.
         '''
+        if isinstance(points, PreparedPolygon):
+            return points.contains(self.lat, self.lon)
+
         n, points = self.points(points)
 
         # get great-circle vector for each edge
@@ -406,7 +413,7 @@ class LatLon(LatLonSphericalBase):
 
            @return: Vector representing this point (L{Vector3d}).
         '''
-        if self._v3d is None:
+        if getattr(self, '_v3d', None) is None:
             x, y, z = self.to3xyz()
             self._v3d = Vector3d(x, y, z)  # .unit()
         return self._v3d
@@ -415,6 +422,153 @@ class LatLon(LatLonSphericalBase):
 _Trll = LatLon(0, 0)  #: (INTERNAL) Reference instance (L{LatLon}).
 
 
+class PreparedPolygon(object):
+    '''Convex polygon prepared for testing many points, see method
+       L{LatLon.isEnclosedBy}.
+
+       The great-circle vector of each edge, oriented towards the
+       inside, a bounding cap and a lat-/longitude bounding box are
+       computed once.  Points outside the bounding box are rejected
+       without any trigonometry, points outside the cap with a single
+       dot product and the remaining points are tested against each
+       edge.  Unlike method L{LatLon.isEnclosedBy}, the polygon may be
+       clockwise or anti-clockwise.
+    '''
+    def __init__(self, points):
+        '''New prepared polygon.
+
+           @param points: The points defining the polygon (L{LatLon}[]).
+
+           @raise TypeError: Some points are not L{LatLon}.
+
+           @raise ValueError: Too few points or non-convex polygon.
+
+           @example:
+
+           >>> b = LatLon(45,1), LatLon(45,2), LatLon(46,2), LatLon(46,1)
+           >>> pp = PreparedPolygon(b)
+           >>> pp.contains(45.1, 1.1)  # True
+        '''
+        n, points = _Trll.points(points)
+        vs = [p.to3xyz() for p in points]
+
+        # get great-circle vector for each edge
+        gc, v1 = [], vs[n-1]
+        for v2 in vs:
+            gc.append(_cross(v1, v2))
+            v1 = v2
+
+        # check for convex polygon and orientation, using
+        # the sign of the triple product of 3 consecutive
+        # points (positive if anti-clockwise)
+        ts, v1, v2 = set(), vs[n-2], vs[n-1]
+        for v3 in vs:
+            t = _dot(_cross(v1, v2), v3)
+            if abs(t) > EPS:
+                ts.add(t > 0)
+            v1, v2 = v2, v3
+        if len(ts) != 1:
+            raise ValueError('non-convex: %r' % (points[:3],))
+        if False in ts:  # clockwise, flip all edges
+            gc = [(-x, -y, -z) for x, y, z in gc]
+        self._gc = gc
+
+        # bounding cap around the vertices, which
+        # includes the edges if less than a hemisphere
+        c = _unit(map(fsum, zip(*vs)))
+        self._cap = c, min(_dot(c, v) for v in vs) - EPS
+
+        # bounding box, latitudes from the vertices or the
+        # apex of the edges or the pole inside the polygon
+        a = [p.lat for p in points]
+        v1 = vs[n-1]
+        for v2 in vs:
+            x, y, z = _cross(v1, v2)
+            h = hypot(x, y)
+            if h > EPS:  # not along the equator
+                g = x, y, z
+                # north apex of the great circle
+                x = _unit((-x * z, -y * z, h * h))
+                for x in (x, (-x[0], -x[1], -x[2])):  # north, south
+                    if _dot(_cross(v1, x), g) > 0 and \
+                       _dot(_cross(x, v2), g) > 0:
+                        a.append(degrees90(asin(x[2])))
+            v1 = v2
+        a = [min(a), max(a)]
+        if self._edges((0, 0, -1)):
+            a[0] = -90.0
+        if self._edges((0, 0, 1)):
+            a[1] = 90.0
+
+        # longitudes from the cap, centered at the cap
+        cz, r = c[2], acos(max(-1.0, min(1.0, self._cap[1] + EPS)))
+        ca = hypot(c[0], c[1])
+        if ca > EPS and asin(min(1.0, abs(cz))) + r < PI_2:
+            b = degrees90(asin(min(1.0, sin(r) / ca)))
+        else:  # cap includes a pole
+            b = 180.0
+        self._box = a[0], a[1], degrees180(atan2(c[1], c[0])), b
+
+    def __len__(self):
+        return len(self._gc)
+
+    def _edges(self, v):
+        '''(INTERNAL) Test n-vector v against all edges.
+        '''
+        for x, y, z in self._gc:
+            if (x * v[0] + y * v[1] + z * v[2]) < 0:
+                return False  # outside
+        return True
+
+    @property
+    def box(self):
+        '''Get the bounding box as 4-tuple (min lat, max lat,
+           center lon, lon half-width) in (degrees90, degrees90,
+           degrees180, degrees).
+        '''
+        return self._box
+
+    def contains(self, lat, lon):
+        '''Test whether the given point is enclosed by this polygon.
+
+           @param lat: Latitude (degrees).
+           @param lon: Longitude (degrees).
+
+           @return: True if the polygon encloses this point (bool).
+        '''
+        a0, a1, b, d = self._box
+        if not a0 <= lat <= a1:
+            return False
+        if d < 180 and abs(wrap180(lon - b)) > d:
+            return False
+
+        a, b = radians(lat), radians(lon)
+        ca = cos(a)
+        v = ca * cos(b), ca * sin(b), sin(a)
+
+        c, r = self._cap
+        if r > 0 and _dot(c, v) < r:
+            return False
+
+        return self._edges(v)
+
+    def contains_many(self, lats, lons):
+        '''Test whether each of several points is enclosed by this polygon.
+
+           @param lats: Latitudes (degrees[]).
+           @param lons: Longitudes (degrees[]).
+
+           @return: True or False for each point (bool[]).
+
+           @raise ValueError: Unequal number of lat- and longitudes.
+        '''
+        n, lats = len2(lats)
+        m, lons = len2(lons)
+        if n != m:
+            raise ValueError('unequal len: %s vs %s' % (n, m))
+        return list(map(self.contains, lats, lons))
+
+
 def intersection(start1, bearing1, start2, bearing2):
     '''Return the intersection point of two paths each defined
        by a start point and an initial bearing.
@@ -501,6 +655,14 @@ def meanOf(points, height=None):
     return LatLon(a, b, height=h)
 
 
+def _cross(v1, v2):
+    '''(INTERNAL) Cross product of two 3-tuples.
+    '''
+    return (v1[1] * v2[2] - v1[2] * v2[1],
+            v1[2] * v2[0] - v1[0] * v2[2],
+            v1[0] * v2[1] - v1[1] * v2[0])
+
+
 def _destination2(a, b, r, t, h=0):
     '''(INTERNAL) Compute destination.
 
@@ -520,6 +682,12 @@ def _destination2(a, b, r, t, h=0):
     return LatLon(degrees90(a), degrees180(b), height=h)
 
 
+def _dot(v1, v2):
+    '''(INTERNAL) Dot product of two 3-tuples.
+    '''
+    return v1[0] * v2[0] + v1[1] * v2[1] + v1[2] * v2[2]
+
+
 def _haversine3(a2, a1, b21):
     '''(INTERNAL) Compute the angular distance.
 
@@ -541,6 +709,14 @@ def _haversine3(a2, a1, b21):
         r = 0 if h < 0.5 else PI
     return r, ca2, ca1
 
+
+def _unit(v):
+    '''(INTERNAL) Normalize a 3-tuple.
+    '''
+    x, y, z = v
+    h = hypot(hypot(x, y), z)
+    return x / h, y / h, z / h
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
@@ -17,6 +17,7 @@ except ImportError:
     fsum = sum  # use standard, built-in sum (or Kahan's summation
     # <https://en.wikipedia.org/wiki/Kahan_summation_algorithm> or
     # Hettinger's <https://code.activestate.com/recipes/393090/>)
+from itertools import repeat
 from operator import mul
 import sys
 
@@ -36,9 +37,11 @@ __version__ = '17.04.10'
 try:
     _Ints = int, long  #: (INTERNAL) Int objects (tuple)
     _Scalars = int, long, float  #: (INTERNAL) Scalar objects (tuple)
+    _Strs = basestring  #: (INTERNAL) String objects (tuple)
 except NameError:  # Python 3+
     _Ints = int  #: (INTERNAL) Int objects (tuple)
     _Scalars = int, float  #: (INTERNAL) Scalar objects (tuple)
+    _Strs = str  #: (INTERNAL) String objects (tuple)
 
 try:
     EPS = sys.float_info.epsilon  #: System's epsilon (float)
@@ -54,6 +57,33 @@ _1_3rd = 1.0 / 3.0  #: (INTERNAL) One third (float)
 _2_3rd = 2.0 / 3.0  #: (INTERNAL) Two third (float)
 
 
+def _broadcast(*args):
+    '''(INTERNAL) Broadcast scalar arguments against sequences.
+
+       @param args: Scalars, strings and/or sequences, all
+                    sequences of the same length.
+
+       @return: 2-Tuple (number, iterator) of tuples (int, zip).
+
+       @raise ValueError: Unequal sequence lengths.
+    '''
+    n, ss = None, []
+    for a in args:
+        if isinstance(a, _Scalars) or isinstance(a, _Strs):
+            ss.append(a)
+        else:
+            m, a = len2(a)
+            if n is None:
+                n = m
+            elif n != m:
+                raise ValueError('unequal len: %s vs %s' % (n, m))
+            ss.append(a)
+    if n is None:
+        n = 1
+    return n, zip(*[repeat(a, n) if isinstance(a, _Scalars) or
+                                    isinstance(a, _Strs) else a for a in ss])
+
+
 def cbrt(x):
     '''Computes the cubic root M{x**(1/3)}.
 
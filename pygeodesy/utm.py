@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 '''Universal Transverse Mercator (UTM) class L{Utm} and functions
-L{parseUTM} and L{toUtm}.
+L{parseUTM}, L{toUtm}, L{toUtm_many} and L{utm_toLatLon_many}.
 
 Pure Python implementation of UTM / WGS-84 conversion functions using
 an ellipsoidal earth model.  Transcribed from JavaScript originals
@@ -21,6 +21,15 @@ This method based on Karney 2011 'Transverse Mercator with an
 accuracy of a few nanometers', building on Krüger 1912 'Konforme
 Abbildung des Erdellipsoids in der Ebene'.
 
+Class L{UtmProjector} holds all constants of one zone and datum and
+functions L{toUtm_many} and L{utm_toLatLon_many} convert many lat-/
+longitudes respectively UTM coordinates at once, without creating a
+L{Utm} or L{LatLon} instance for each point:
+
+    >>> from pygeodesy.utm import toUtm_many, utm_toLatLon_many
+    >>> zs, hs, Bs, es, ns, cs, ks, xs = toUtm_many(lats, lons)
+    >>> lats, lons, cs, ks, xs = utm_toLatLon_many(zs, hs, es, ns)
+
 References U{https://arxiv.org/pdf/1002.1417v3.pdf},
 U{http://bib.gfz-potsdam.de/pub/digi/krueger2.pdf},
 U{http://henrik-seidel.gmxhome.de/gausskrueger.pdf} and
@@ -33,17 +42,17 @@ from bases import Base
 from datum import Datums
 from dms import S_DEG
 from ellipsoidalBase import LatLonEllipsoidalBase
-from utils import EPS, degrees, degrees90, degrees180, \
-                  fdot3, fStr, hypot1, isscalar, len2, map2, \
-                  radians, wrap90, wrap180
+from utils import EPS, _broadcast, degrees, degrees90, degrees180, \
+                  fStr, hypot1, isscalar, radians, wrap90, wrap180
 
-from math import asinh, atan, atanh, atan2, cos, cosh, \
-                 hypot, sin, sinh, tan, tanh
-from operator import mul
+from cmath import cos as ccos, sin as csin
+from math import asinh, atan, atanh, atan2, cos, hypot, \
+                 sin, sinh, tan, tanh
 
 # all public contants, classes and functions
-__all__ = ('Utm',  # classes
-           'parseUTM', 'toUtm')  # functions
+__all__ = ('Utm', 'UtmProjector',  # classes
+           'parseUTM', 'toUtm', 'toUtm_many',  # functions
+           'utm_toLatLon_many')
 __version__ = '17.04.07'
 
 # Latitude bands C..X of 8° each, covering 80°S to 84°N with X repeated
@@ -54,58 +63,6 @@ _FalseNorthing = 10000e3  #: (INTERNAL) False (meter).
 _K0            = 0.9996   #: (INTERNAL) UTM scale central meridian.
 
 
-class _Ks(object):
-    '''(INTERNAL) Alpha or Beta Krüger series summations for
-       eta, ksi, p and q while caching the cos, sin, cosh and
-       sinh for the given eta and ksi angles (in radians).
-    '''
-    def __init__(self, AB, x, y):
-        '''(INTERNAL) New Alpha or Beta Krüger series
-
-           @param AB: 6th-order Krüger Alpha or Beta series (1-origin).
-           @param x: Eta angle (radians).
-           @param y: Ksi angle (radians).
-        '''
-        n, j2 = len2(range(2, len(AB) * 2, 2))
-
-        self._ab = AB[1:]  # 0-origin
-        self._pq = map2(mul, j2, self._ab)
-
-        assert len(self._ab) == len(self._pq) == n
-
-        x2 = map2(mul, j2, (x,) * n)
-        self._chx = map2(cosh, x2)
-        self._shx = map2(sinh, x2)
-
-        assert len(x2) == len(self._chx) == len(self._shx) == n
-
-        y2 = map2(mul, j2, (y,) * n)
-        self._cy = map2(cos, y2)
-        self._sy = map2(sin, y2)
-
-        assert len(y2) == len(self._cy) == len(self._sy) == n
-
-    def xs(self, x):
-        '''(INTERNAL) Eta summations (float).
-        '''
-        return fdot3(self._ab, self._cy, self._shx, start=x)
-
-    def ys(self, y):
-        '''(INTERNAL) Ksi summations (float).
-        '''
-        return fdot3(self._ab, self._sy, self._chx, start=y)
-
-    def ps(self, p):
-        '''(INTERNAL) P summations (float).
-        '''
-        return fdot3(self._pq, self._cy, self._chx, start=p)
-
-    def qs(self, q):
-        '''(INTERNAL) Q summations (float).
-        '''
-        return fdot3(self._pq, self._sy, self._shx, start=q)
-
-
 def _toZBL(zone, band, mgrs=False):  # used by mgrs.Mgrs
     '''(INTERNAL) Check and return zone, Band and band latitude.
 
@@ -139,16 +96,47 @@ def _toZBL(zone, band, mgrs=False):  # used by mgrs.Mgrs
     return z, B, b
 
 
-def _toZBll(lat, lon):
-    '''(INTERNAL) Return zone, Band and central lat- and longitude.
+def _Kz(K6, z):
+    '''(INTERNAL) Sum a Krüger series at a complex angle, using
+       Clenshaw summation.
+
+       @param K6: Krüger series coefficients and their 2j multiples,
+                  highest order first (2-tuple[], see L{_K6}).
+       @param z: Complex angle ksi + eta * 1j (radians).
+
+       @return: 2-Tuple (sum(a[j] * sin(2j * z)), sum(2j * a[j] *
+                cos(2j * z))) for j = 1..6 (complex, complex).
+    '''
+    s, c = csin(z * 2), ccos(z * 2)
+    y = c * 2
+    b1 = b2 = d1 = d2 = 0
+    for a, a2j in K6:
+        b1, b2 = y * b1 - b2 + a, b1
+        d1, d2 = y * d1 - d2 + a2j, d1
+    return b1 * s, d1 * c - d2
+
+
+def _K6(AB):
+    '''(INTERNAL) Krüger series coefficients for L{_Kz}.
+
+       @param AB: 6th-order Krüger Alpha or Beta series (1-origin).
+
+       @return: 2-Tuples (a[j], 2j * a[j]) for j = 6..1 (tuple).
+    '''
+    return tuple((AB[j], AB[j] * j * 2) for j in range(len(AB) - 1, 0, -1))
+
+
+def _toZB(lat, lon):
+    '''(INTERNAL) Return zone, Band and wrapped lat- and longitude.
 
        @param lat: Latitude (degrees).
        @param lon: Longitude (degrees).
 
-       @return: 4-Tuple (zone, Band, lat, lon).
+       @return: 4-Tuple (zone, Band, lat, lon) in (int, string,
+                degrees90, degrees180).
+
+       @raise ValueError: Latitude outside UTM.
     '''
-    # return zone, Band and central
-    # lat- and longitude (in radians)
     lat = wrap90(lat)
     if -80 > lat or lat > 84:
         raise ValueError('%s outside UTM: %s' % ('lat', lat))
@@ -165,10 +153,7 @@ def _toZBll(lat, lon):
                 z -= 1
     elif B == 'V' and z == 31 and lon >=3:
         z += 1  # southern Norway
-
-    b = radians(lon - (z * 6) + 183)  # lon off central meridian
-    a = radians(lat)  # lat off equator
-    return z, B, a, b
+    return z, B, lat, lon
 
 
 class Utm(Base):
@@ -302,57 +287,18 @@ class Utm(Base):
            >>> from pygeodesy import ellipsoidalVincenty as eV
            >>> ll = g.toLatLon(eV.LatLon)  # 48°51′29.52″N, 002°17′40.20″E
         '''
-        if self._latlon and self._latlon.__class__ is LatLon \
-                        and self._latlon.datum == self._datum:
-            return self._latlon  # set below
-
         if not issubclass(LatLon, LatLonEllipsoidalBase):
             raise TypeError('%s not ellipsoidal: %r' % ('LatLon', LatLon))
 
-        E = self._datum.ellipsoid  # XXX vs LatLon.datum.ellipsoid
-
-        x = self._easting - _FalseEasting  # relative to central meridian
-        y = self._northing
-        if self._hemi == 'S':  # relative to equator
-            y -= _FalseNorthing
-
-        # from Karney 2011 Eq 15-22, 36
-        A0 = _K0 * E.A
-        x /= A0  # η eta
-        y /= A0  # ξ ksi
-
-        B6 = _Ks(E.Beta6, x, y)  # 6th-order Krüger series, 1-origin
-        y = -B6.ys(-y)  # ξ'
-        x = -B6.xs(-x)  # η'
-
-        shx = sinh(x)
-        cy, sy = cos(y), sin(y)
-
-        H = hypot(shx, cy)
-
-        T = t0 = sy / H
-        q = 1.0 / E.e12
-        d = 1
-        # note, a relatively large convergence test as d
-        # toggles on +/-1.12e-16 eg. 31 N 400000 5000000
-        while abs(d) > EPS:  # 1e-12
-            h = hypot1(T)
-            s = sinh(E.e * atanh(E.e * T / h))
-            t = T * hypot1(s) - s * h
-            d = (t0 - t) / hypot1(t) * (q + T * T) / h
-            T += d
-
-        a = atan(T)  # lat
-        b = atan2(shx, cy) + radians(self._zone * 6 - 183)  # lon of central meridian
-        ll = LatLon(degrees90(a), degrees180(b), datum=self._datum)
-
-        # convergence: Karney 2011 Eq 26, 27
-        p = -B6.ps(-1)
-        q =  B6.qs(0)
-        ll.convergence = degrees(atan(tan(y) * tanh(x)) + atan2(q, p))
+        if self._latlon and self._latlon.__class__ is LatLon \
+                        and self._latlon.datum == self._datum:
+            return self._latlon  # set below
 
-        # scale: Karney 2011 Eq 28
-        ll.scale = E.e2s2(sin(a)) * hypot1(T) * H * (A0 / E.a / hypot(p, q))
+        a, b, c, k = _projector(self._zone, self._datum).reverse(
+                                self._easting, self._northing, self._hemi)
+        ll = LatLon(a, b, datum=self._datum)
+        ll.convergence = c
+        ll.scale = k
 
         self._latlon = ll
         return ll
@@ -432,6 +378,200 @@ class Utm(Base):
         return self._zone
 
 
+class UtmProjector(Base):
+    '''Transverse Mercator projection for one UTM zone and datum.
+
+       All constants independent of the point, like the Krüger Alpha
+       and Beta series, their multiples and the central meridian are
+       set up once, to be re-used by L{forward} and L{reverse} for
+       any number of points.
+    '''
+    def __init__(self, zone, datum=Datums.WGS84):
+        '''New UTM projector.
+
+           @param zone: UTM 6° longitudinal zone (int 1..60 or '00B'
+                        zone and band letter string).
+           @keyword datum: The datum (L{Datum}).
+
+           @raise ValueError: Invalid zone.
+
+           @example:
+
+           >>> P = UtmProjector(31)
+           >>> e, n, c, k = P.forward(48.8582, 2.2945)
+           >>> lat, lon, c, k = P.reverse(e, n, 'N')
+        '''
+        self._zone, _, _ = _toZBL(zone, '')
+        self._datum = datum
+
+        E = datum.ellipsoid
+        self._E  = E
+        self._e  = E.e
+        self._q  = 1.0 / E.e12
+        self._A0 = _K0 * E.A
+        self._Ae = self._A0 / E.a
+        self._KA = _K6(E.Alpha6)  # 6th-order Krüger series
+        self._KB = _K6(E.Beta6)
+        self._b0 = self._zone * 6 - 183  # central meridian
+        self._r0 = radians(self._b0)
+
+    def _dT(self, T, t0):
+        '''(INTERNAL) Newton step for latitude tangent T.
+        '''
+        e, h = self._e, hypot1(T)
+        s = sinh(e * atanh(e * T / h))
+        t = T * hypot1(s) - s * h
+        return (t0 - t) / hypot1(t) * (self._q + T * T) / h
+
+    def _llck(self, r, T):
+        '''(INTERNAL) Lat-, longitude, convergence and scale
+           from the L{_zeta} 8-tuple and latitude tangent T.
+        '''
+        x, y, shx, cy, H, _, p, q = r
+
+        a = atan(T)  # lat
+        b = atan2(shx, cy) + self._r0  # lon
+
+        # convergence: Karney 2011 Eq 26, 27
+        c = degrees(atan(tan(y) * tanh(x)) + atan2(q, p))
+        # scale: Karney 2011 Eq 28
+        k = self._E.e2s2(sin(a)) * hypot1(T) * H * (self._Ae / hypot(p, q))
+        return degrees90(a), degrees180(b), c, k
+
+    def _zeta(self, easting, northing, hemisphere):
+        '''(INTERNAL) Reverse Krüger series and initial latitude
+           tangent t0, as 8-tuple (x, y, shx, cy, H, t0, p, q).
+        '''
+        x = easting - _FalseEasting  # relative to central meridian
+        y = northing
+        if hemisphere in ('S', 's'):  # relative to equator
+            y -= _FalseNorthing
+
+        # from Karney 2011 Eq 15-22, 36
+        A0 = self._A0
+        w = complex(y / A0, x / A0)  # ξ + η i
+        s, c = _Kz(self._KB, w)
+        w -= s  # ξ' + η' i
+        x, y = w.imag, w.real
+
+        shx = sinh(x)
+        cy, sy = cos(y), sin(y)
+        H = hypot(shx, cy)
+        return x, y, shx, cy, H, sy / H, 1 - c.real, -c.imag
+
+    @property
+    def datum(self):
+        '''Get the datum (L{Datum}).
+        '''
+        return self._datum
+
+    def forward(self, lat, lon):
+        '''Project a lat-/longitude into this zone.
+
+           @param lat: Latitude (degrees).
+           @param lon: Longitude (degrees), preferably inside or
+                       near this zone.
+
+           @return: 4-Tuple (easting, northing, convergence, scale)
+                    in (meter, meter, degrees, scalar), the northing
+                    from the false northing for negative latitudes.
+        '''
+        b = lon - self._b0  # lon off central meridian
+        if abs(b) > 180:
+            b = wrap180(b)
+        a, b = radians(lat), radians(b)
+
+        # easting, northing: Karney 2011 Eq 7-14, 29, 35
+        cb, sb, tb = cos(b), sin(b), tan(b)
+
+        e = self._e
+        T = tan(a)
+        T12 = hypot1(T)
+        S = sinh(e * atanh(e * T / T12))
+
+        T_ = T * hypot1(S) - S * T12
+        H = hypot(T_, cb)
+
+        w = complex(atan2(T_, cb), asinh(sb / H))  # ξ' + η' i
+        s, c = _Kz(self._KA, w)
+        w += s  # ξ + η i
+
+        A0 = self._A0
+        x = w.imag * A0 + _FalseEasting  # relative to false easting
+        y = w.real * A0
+        if y < 0:
+            y += _FalseNorthing  # relative to false northing in S
+
+        # convergence: Karney 2011 Eq 23, 24
+        p, q = 1 + c.real, -c.imag
+        c = degrees(atan(T_ / hypot1(T_) * tb) + atan2(q, p))
+        # scale: Karney 2011 Eq 25
+        k = self._E.e2s2(sin(a)) * T12 / H * (self._Ae * hypot(p, q))
+        return x, y, c, k
+
+    def reverse(self, easting, northing, hemisphere='N'):
+        '''Unproject a UTM coordinate of this zone.
+
+           @param easting: Easting from false easting (meter).
+           @param northing: Northing from equator N or from false
+                            northing S (meter).
+           @keyword hemisphere: N or S hemisphere (string).
+
+           @return: 4-Tuple (lat, lon, convergence, scale) in
+                    (degrees90, degrees180, degrees, scalar).
+        '''
+        r = self._zeta(easting, northing, hemisphere)
+
+        T = t0 = r[5]
+        d = 1
+        # note, a relatively large convergence test as d
+        # toggles on +/-1.12e-16 eg. 31 N 400000 5000000
+        # and relative to T, since d toggles on +/-ulp(T)
+        # for |T| > 1 eg. 53 S 744904.8125121482 2949134.2139229923
+        while abs(d) > EPS * max(1, abs(T)):
+            d = self._dT(T, t0)
+            T += d
+
+        return self._llck(r, T)
+
+    def toStr(self, **unused):  # PYCHOK expected
+        '''Return this projector as a string.
+
+           @return: Zone and datum name (string).
+        '''
+        return 'zone=%02d, datum=%s' % (self._zone, self._datum.name)
+
+    @property
+    def zone(self):
+        '''Get the longitudinal zone (1..60).
+        '''
+        return self._zone
+
+
+_LRU = 16  #: (INTERNAL) Number of cached projectors.
+_UtmProjectors = []  #: (INTERNAL) Projector cache, most recent first.
+
+
+def _projector(zone, datum):
+    '''(INTERNAL) Get a cached or new L{UtmProjector}.
+
+       @param zone: UTM zone (int 1..60).
+       @param datum: The datum (L{Datum}).
+
+       @return: The projector (L{UtmProjector}).
+    '''
+    Ps = _UtmProjectors
+    for i, P in enumerate(Ps):  # Datums aren't hashable
+        if P._zone == zone and P._datum is datum:
+            if i:  # move to front
+                Ps.insert(0, Ps.pop(i))
+            return P
+    P = UtmProjector(zone, datum)
+    Ps.insert(0, P)
+    del Ps[_LRU:]
+    return P
+
+
 def parseUTM(strUTM, datum=Datums.WGS84):
     '''Parse a string representing a UTM coordinate, consisting of
        zone, hemisphere, easting and northing.
@@ -507,43 +647,157 @@ def toUtm(latlon, lon=None, datum=None):
             raise ValueError('%s invalid: %r' % ('lat', lat))
         d = datum or Datums.WGS84
 
-    E = d.ellipsoid
+    z, B, lat, lon = _toZB(lat, lon)
+    x, y, c, k = _projector(z, d).forward(lat, lon)
+    h = 'S' if lat < 0 else 'N'  # hemisphere
+
+    return Utm(z, h, x, y, band=B, datum=d, convergence=c, scale=k)
 
-    z, B, a, b = _toZBll(lat, lon)
-    h = 'S' if a < 0 else 'N'  # hemisphere
 
-    # easting, northing: Karney 2011 Eq 7-14, 29, 35
-    cb, sb, tb = cos(b), sin(b), tan(b)
+def toUtm_many(lats, lons, datum=Datums.WGS84, utms=False):
+    '''Convert many lat-/longitudes to UTM coordinates.
 
-    T = tan(a)
-    T12 = hypot1(T)
-    S = sinh(E.e * atanh(E.e * T / T12))
+       Zone and band of each point are determined as in L{toUtm},
+       including the Norway and Svalbard exceptions.  The points are
+       grouped by zone, handling each zone's central meridian once.
+       The Krüger series coefficients are set up once for all points
+       and summed by Clenshaw's method for complex angles.  Points
+       outside the UTM bands do not raise an exception, instead the
+       ValueError is reported for that point only.
 
-    T_ = T * hypot1(S) - S * T12
-    H = hypot(T_, cb)
+       @param lats: Latitudes (degrees[] or scalar).
+       @param lons: Longitudes (degrees[] or scalar).
+       @keyword datum: Datum of all points (L{Datum}).
+       @keyword utms: Optionally, return a L{Utm} instance for each
+                      point (bool).
 
-    y = atan2(T_, cb)  # ξ' ksi
-    x = asinh(sb / H)  # η' eta
+       @return: 8-Tuple (zones, hemispheres, bands, eastings, northings,
+                convergences, scales, errors) as (int[], string[],
+                string[], meter[], meter[], degrees[], scalar[], dict)
+                or if I{utms} is True, 2-Tuple (utms, errors) as
+                (L{Utm}[], dict).  For failed points all values are
+                None and the ValueError is in errors, keyed by index.
 
-    A0 = _K0 * E.A
+       @raise ValueError: Unequal number of lat- and longitudes.
 
-    A6 = _Ks(E.Alpha6, x, y)  # 6th-order Krüger series, 1-origin
-    y = A6.ys(y) * A0  # ξ
-    x = A6.xs(x) * A0  # η
+       @example:
 
-    x += _FalseEasting  # make x relative to false easting
-    if y < 0:
-        y += _FalseNorthing  # y relative to false northing in S
+       >>> zs, hs, Bs, es, ns, cs, ks, xs = toUtm_many((48.8582, 13.4125),
+                                                       (2.2945, 103.8667))
+       >>> zs  # [31, 48]
+       >>> es  # [448251.795205746, 377302.354182663]
+    '''
+    n, abs_ = _broadcast(lats, lons)
+    zs, hs, Bs, es, ns, cs, ks = [None] * n, [None] * n, [None] * n, \
+                                 [None] * n, [None] * n, [None] * n, [None] * n
+    xs, Zs = {}, {}
+    for i, (a, b) in enumerate(abs_):
+        try:
+            z, B, a, b = _toZB(a, b)
+        except ValueError as x:
+            xs[i] = x
+            continue
+        zs[i], hs[i], Bs[i] = z, ('S' if a < 0 else 'N'), B
+        Zs.setdefault(z, []).append((i, a, b))
+
+    for z, iabs in Zs.items():
+        P = _projector(z, datum)  # once per zone
+        for i, a, b in iabs:
+            es[i], ns[i], cs[i], ks[i] = P.forward(a, b)
+
+    if utms:
+        us = [None] * n
+        for i in range(n):
+            if i not in xs:
+                us[i] = Utm(zs[i], hs[i], es[i], ns[i], band=Bs[i], datum=datum,
+                                                convergence=cs[i], scale=ks[i])
+        return us, xs
+
+    return zs, hs, Bs, es, ns, cs, ks, xs
+
+
+def utm_toLatLon_many(zones, hemispheres, eastings, northings,
+                      datum=Datums.WGS84):
+    '''Convert many UTM coordinates to lat-/longitudes.
+
+       Uses the same formulae as method L{Utm.toLatLon}, but with the
+       Krüger Beta series set up once for all coordinates and summed
+       by Clenshaw's method for complex angles.  The Newton iteration
+       for the latitude runs over all coordinates at once, each pass
+       dropping the coordinates already converged.  Invalid zones,
+       hemispheres, eastings or northings do not raise an exception,
+       instead the ValueError is reported for that coordinate only.
+
+       @param zones: UTM zones (int[] or int 1..60 or '00B' string).
+       @param hemispheres: Hemispheres (string[] or string N or S).
+       @param eastings: Eastings (meter[] or scalar).
+       @param northings: Northings (meter[] or scalar).
+       @keyword datum: Datum of all coordinates (L{Datum}).
+
+       @return: 5-Tuple (latitudes, longitudes, convergences, scales,
+                errors) as (degrees90[], degrees180[], degrees[],
+                scalar[], dict).  For invalid coordinates all values
+                are None and the ValueError is in errors, keyed by
+                index.
+
+       @raise ValueError: Unequal number of zones, hemispheres,
+                          eastings and northings.
 
-    # convergence: Karney 2011 Eq 23, 24
-    p_ = A6.ps(1)
-    q_ = A6.qs(0)
-    c = degrees(atan(T_ / hypot1(T_) * tb) + atan2(q_, p_))
+       @example:
 
-    # scale: Karney 2011 Eq 25
-    k = E.e2s2(sin(a)) * T12 / H * (A0 / E.a * hypot(p_, q_))
+       >>> lats, lons, cs, ks, xs = utm_toLatLon_many(31, 'N',
+                       (448251.795, 448252.795), (5411932.678, 5411930))
+    '''
+    n, zhens = _broadcast(zones, hemispheres, eastings, northings)
+    as_, bs, cs, ks, xs = [None] * n, [None] * n, [None] * n, [None] * n, {}
+
+    Ps, Ts, Prs = {}, [None] * n, [None] * n
+    for i, (z, h, e, y) in enumerate(zhens):
+        try:
+            if z not in Ps:  # check each zone once
+                Ps[z] = _projector(_toZBL(z, '')[0], datum)
+
+            h = str(h)[:1]
+            if h not in 'NnSs':
+                raise ValueError('%s invalid: %r' % ('hemisphere', h))
+
+            e, x = float(e), e
+            if 120e3 > e or e > 880e3:
+                raise ValueError('%s invalid: %r' % ('easting', x))
+
+            y, x = float(y), y
+            if 0 > y or y > _FalseNorthing:
+                raise ValueError('%s invalid: %r' % ('northing', x))
+        except (TypeError, ValueError) as x:
+            xs[i] = x
+            continue
+
+        P = Ps[z]
+        r = P._zeta(e, y, h)
+        Prs[i] = P, r
+        Ts[i] = r[5]
+
+    # Newton steps for the latitude of all points at once, note
+    # the relative convergence test, see UtmProjector.reverse
+    js = [i for i in range(n) if i not in xs]
+    while js:
+        ds = []
+        for i in js:
+            P, r = Prs[i]
+            T = Ts[i]
+            d = P._dT(T, r[5])
+            Ts[i] = T + d
+            if abs(d) > EPS * max(1, abs(T)):
+                ds.append(i)
+        js = ds  # not converged
+
+    for i in range(n):
+        if i not in xs:
+            P, r = Prs[i]
+            as_[i], bs[i], cs[i], ks[i] = P._llck(r, Ts[i])
+
+    return as_, bs, cs, ks, xs
 
-    return Utm(z, h, x, y, band=B, datum=d, convergence=c, scale=k)
 
 # **) MIT License
 #
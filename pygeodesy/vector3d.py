@@ -18,7 +18,7 @@ from math import atan2, cos, hypot, sin
 
 # all public contants, classes and functions
 __all__ = ('Vector3d',  # classes
-           'sumOf')  # functions
+           'angle_many', 'cross_many', 'sumOf', 'triple_many')  # functions
 __version__ = '17.02.14'
 
 try:
@@ -44,12 +44,11 @@ class Vector3d(VectorBase):
         - etc.
     '''
 
-    _length = None  #: (INTERNAL) cached length.
-    _united = None  #: (INTERNAL) cached norm, unit.
-
-    _x = 0  #: (INTERNAL) X component.
-    _y = 0  #: (INTERNAL) Y component.
-    _z = 0  #: (INTERNAL) Z component.
+    __slots__ = ('_length',  # (INTERNAL) cached length.
+                 '_united',  # (INTERNAL) cached norm, unit.
+                 '_x',  # (INTERNAL) X component.
+                 '_y',  # (INTERNAL) Y component.
+                 '_z')  # (INTERNAL) Z component.
 
     def __init__(self, x, y, z):
         '''New 3-D vector.
@@ -65,6 +64,7 @@ class Vector3d(VectorBase):
         self._x = x
         self._y = y
         self._z = z
+        self._length = self._united = None
 
     def __add__(self, other):
         '''This plus an other vector (L{Vector3d}).
@@ -143,12 +143,11 @@ class Vector3d(VectorBase):
 
            @return: Angle (radians).
         '''
-        x = self.cross(other)
-        s = x.length()
-        # use vSign as reference to get sign of s
-        if vSign is not None and x.dot(vSign) < 0:
-            s = -s
-        return atan2(s, self.dot(other))
+        self.others(other)
+
+        if vSign is not None:
+            vSign = vSign.to3xyz()
+        return _angle(self.to3xyz(), other.to3xyz(), vSign)
 
     def copy(self):
         '''Copy this vector.
@@ -160,18 +159,21 @@ class Vector3d(VectorBase):
         v._united = self._united
         return v
 
-    def cross(self, other):
+    def cross(self, other, unit=False):
         '''Cross product of this and an other vector.
 
            @param other: The other vector (L{Vector3d}).
+           @keyword unit: Normalize the cross product, without
+                          creating an intermediate vector (bool).
 
            @return: Cross product (L{Vector3d}).
         '''
         self.others(other)
 
-        return self.topsub(self.y * other.z - self.z * other.y,
-                           self.z * other.x - self.x * other.z,
-                           self.x * other.y - self.y * other.x)
+        x = _cross(self.to3xyz(), other.to3xyz())
+        if unit:
+            x = _unit(*x)
+        return self.topsub(*x)
 
     def dividedBy(self, factor):
         '''Divide this vector by a scalar.
@@ -336,6 +338,21 @@ class Vector3d(VectorBase):
                            self.y * factor,
                            self.z * factor)
 
+    def triple(self, other1, other2):
+        '''Scalar triple product of this and two other vectors,
+           this . (other1 × other2), without creating the cross
+           product vector.
+
+           @param other1: The first other vector (L{Vector3d}).
+           @param other2: The second other vector (L{Vector3d}).
+
+           @return: Triple product (float).
+        '''
+        self.others(other1, name='other1')
+        self.others(other2, name='other2')
+
+        return _triple(self.to3xyz(), other1.to3xyz(), other2.to3xyz())
+
     def to2ll(self):
         '''Convert this vector to (geodetic) lat- and longitude.
 
@@ -402,6 +419,108 @@ class Vector3d(VectorBase):
         return self._z
 
 
+def _angle(a, b, s=None):
+    '''(INTERNAL) Angle between two x/y/z 3-tuples, signed if
+       s is an x/y/z 3-tuple, see L{Vector3d.angleTo}.
+    '''
+    cx, cy, cz = _cross(a, b)
+    t = hypot3(cx, cy, cz)
+    # use s as reference to get sign of t
+    if s is not None and (cx * s[0] + cy * s[1] + cz * s[2]) < 0:
+        t = -t
+    return atan2(t, a[0] * b[0] + a[1] * b[1] + a[2] * b[2])
+
+
+def _cross(a, b):
+    '''(INTERNAL) Cross product of two x/y/z 3-tuples.
+    '''
+    ax, ay, az = a
+    bx, by, bz = b
+    return ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+
+
+def _triple(a, b, c):
+    '''(INTERNAL) Triple product a . (b × c) of x/y/z 3-tuples.
+    '''
+    x, y, z = _cross(b, c)
+    return a[0] * x + a[1] * y + a[2] * z
+
+
+def _unit(x, y, z):
+    '''(INTERNAL) Normalize x, y and z, see L{Vector3d.unit}.
+    '''
+    n = hypot3(x, y, z)
+    if n > EPS and abs(n - 1) > EPS:
+        x, y, z = x / n, y / n, z / n
+    return x, y, z
+
+
+def _len3(*xyzs):
+    '''(INTERNAL) Length of equally long sequences.
+    '''
+    n = len(xyzs[0])
+    for xyz in xyzs[1:]:
+        if len(xyz) != n:
+            raise ValueError('unequal len: %s vs %s' % (n, len(xyz)))
+    return n
+
+
+def angle_many(xyz1, xyz2, vSign=None):
+    '''Angles between many pairs of vectors, like L{Vector3d.angleTo}
+       but without creating any L{Vector3d} instances.
+
+       @param xyz1: First vectors as x, y, z (sequence of 3-sequences).
+       @param xyz2: Second vectors as x, y, z (sequence of 3-sequences).
+       @keyword vSign: Vector to sign all angles with (L{Vector3d}
+                       or x, y, z 3-sequence), see L{Vector3d.angleTo}.
+
+       @return: Angles (radians[]).
+
+       @raise ValueError: Unequal number of vectors.
+    '''
+    _len3(xyz1, xyz2)
+    try:
+        vSign = vSign.to3xyz()
+    except AttributeError:  # None or 3-sequence
+        pass
+    return [_angle(a, b, vSign) for a, b in zip(xyz1, xyz2)]
+
+
+def cross_many(xyz1, xyz2, unit=False):
+    '''Cross products of many pairs of vectors, like L{Vector3d.cross}
+       but without creating any L{Vector3d} instances.
+
+       @param xyz1: First vectors as x, y, z (sequence of 3-sequences).
+       @param xyz2: Second vectors as x, y, z (sequence of 3-sequences).
+       @keyword unit: Normalize the cross products (bool).
+
+       @return: Cross products as 3-tuples (x, y, z) (list).
+
+       @raise ValueError: Unequal number of vectors.
+    '''
+    _len3(xyz1, xyz2)
+    if unit:
+        return [_unit(*_cross(a, b)) for a, b in zip(xyz1, xyz2)]
+    else:
+        return [_cross(a, b) for a, b in zip(xyz1, xyz2)]
+
+
+def triple_many(xyz1, xyz2, xyz3):
+    '''Scalar triple products of many vectors, like L{Vector3d.triple}
+       but without creating any L{Vector3d} instances.
+
+       @param xyz1: First vectors as x, y, z (sequence of 3-sequences).
+       @param xyz2: Second vectors as x, y, z (sequence of 3-sequences).
+       @param xyz3: Third vectors as x, y, z (sequence of 3-sequences).
+
+       @return: Triple products xyz1 . (xyz2 × xyz3) (float[]).
+
+       @raise ValueError: Unequal number of vectors.
+    '''
+    _len3(xyz1, xyz2, xyz3)
+    return [_triple(a, b, c) for a, b, c in zip(xyz1, xyz2, xyz3)]
+
+
 def sumOf(vectors, Vector=Vector3d, **kwds):
     '''Vectorially add a number of vectors.
 
@@ -8,7 +8,7 @@ __version__ = '17.04.07'
 
 from tests import Tests as _Tests
 
-from pygeodesy import F_D, F_DMS, precision
+from pygeodesy import F_D, F_DMS, fStr, precision
 
 
 class Tests(_Tests):
@@ -32,12 +32,70 @@ class Tests(_Tests):
         self.test('precision', precision(F_DMS), '0')
         self.test('toStr', p.toStr(), '''51°28'40"N, 000°00'06"W, +42.00m''')
 
+    def testSlots(self, LatLon, *Vectors):
+
+        p = LatLon(52.205, 0.119, 42)
+        q = p.copy()
+        self.test('slots', p.to2ab() is p._ab, 'True')
+        q.lat = 48.857
+        self.test('slots', q.toStr(F_D), '48.857°N, 000.119°E, +42.00m')
+        self.test('slots', p.toStr(F_D), '52.205°N, 000.119°E, +42.00m')
+
+        p.vw2 = 1  # other attributes, like attr= of simplifyVW
+        self.test('slots', p.vw2, '1')
+
+        for V in Vectors:
+            v = V(1, 2, 3)
+            self.test('slots', hasattr(v, '__dict__'), 'False')
+            self.test('slots', v.copy().length() == v.length(), 'True')
+            try:
+                v.vw2 = 1
+                t = None
+            except AttributeError:
+                t = 'AttributeError'
+            self.test('slots', t, 'AttributeError')
+
+    def testVector3d(self, Vector):
+
+        from pygeodesy.vector3d import angle_many, cross_many, triple_many
+
+        u, v, w = Vector(1, 0, 0), Vector(0, 2, 0), Vector(1, 1, 1)
+        self.test('cross', u.cross(v), '(0.0, 0.0, 2.0)')
+        self.test('cross', u.cross(v, unit=True), '(0.0, 0.0, 1.0)')
+        self.test('cross', u.cross(v, unit=True).length(), '1.0')
+        self.test('triple', w.triple(u, v), '2')
+        self.test('triple', v.triple(u, v), '0')
+        self.test('angleTo', fStr(u.angleTo(v), prec=6), '1.570796')
+        self.test('angleTo', fStr(v.angleTo(u, vSign=w), prec=6), '-1.570796')
+
+        us, vs, ws = [(1, 0, 0), (1, 1, 1)], [(0, 2, 0), (0, 0, 3)], [(1, 1, 1), (0, 2, 0)]
+        self.test('cross_many', cross_many(us, vs), '[(0, 0, 2), (3, -3, 0)]')
+        self.test('cross_many', fStr(cross_many(us, vs, unit=True)[1], prec=6), '0.707107, -0.707107, 0.0')
+        self.test('triple_many', triple_many(ws, us, vs), '[2, -6]')
+        self.test('angle_many', fStr(angle_many(us, vs, vSign=w), prec=6), '1.570796, 0.955317')
+        self.test('angle_many', fStr(angle_many(vs, us, vSign=(1, 1, 1)), prec=6), '-1.570796, 0.955317')
+        try:
+            t = triple_many(us, vs, ws[:1])
+        except ValueError as x:
+            t = x
+        self.test('triple_many', t, 'unequal len: 2 vs 1')
+
 
 if __name__ == '__main__':
 
-    from pygeodesy import bases  # private
+    from pygeodesy import bases, vector3d  # private
 
     t = Tests(__file__, __version__, bases)
     t.testBases(bases.LatLonHeightBase)
+
+    from pygeodesy import ellipsoidalNvector, ellipsoidalVincenty, \
+                          sphericalNvector, sphericalTrigonometry
+
+    t.testSlots(ellipsoidalNvector.LatLon, ellipsoidalNvector.Cartesian,
+                                           ellipsoidalNvector.Nvector)
+    t.testSlots(ellipsoidalVincenty.LatLon, ellipsoidalVincenty.Cartesian)
+    t.testSlots(sphericalNvector.LatLon, sphericalNvector.Nvector)
+    t.testSlots(sphericalTrigonometry.LatLon, vector3d.Vector3d)
+    t.testVector3d(vector3d.Vector3d)
     t.results()
     t.exit()
@@ -9,7 +9,8 @@ __version__ = '17.04.11'
 from tests import Tests as _Tests
 
 from pygeodesy import R_M, Datum, Datums, Ellipsoid, Ellipsoids, \
-                      fStr, Transform, Transforms
+                      convertDatum_many, fStr, to3llh_many, to3xyz_many, \
+                      Transform, Transforms
 
 
 class Tests(_Tests):
@@ -46,6 +47,61 @@ class Tests(_Tests):
         self.test('WGS84', t[2], "Alpha6=(0, 8.377318206245e-04, 7.608527773572e-07, 1.197645503329e-09, 2.429170607201e-12, 5.711757677866e-15, 1.491117731258e-17)")
         self.test('WGS84', t[3], "Beta6=(0, 8.377321640579e-04, 5.905870152220e-08, 1.673482665284e-1, 2.164798040063e-13, 3.787978046169e-16, 7.248748890694e-19)")
 
+    def testTransformMany(self):
+
+        T = Transforms.OSGB36
+        xyz = [[3980581.21, -111.159, 4966824.522], (4027893.924, 307041.993, 4919474.294)]
+        for inverse in (False, True):
+            t = T.transform_many(xyz, inverse=inverse)
+            for i in range(2):
+                self.test('transform_many', fStr(t[i], prec=6), fStr(T.transform(*xyz[i], inverse=inverse), prec=6))
+        t = T.transform_many(T.transform_many(xyz), inverse=True)
+        self.test('transform_many', fStr(t[0], prec=0), '3980581, -111, 4966825')
+
+        c = [list(p) for p in xyz]
+        t = T.transform_many(c, inplace=True)
+        self.test('transform_many', t is c, 'True')
+        self.test('transform_many', fStr(c[1], prec=6), fStr(T.transform(*xyz[1]), prec=6))
+
+    def testConvertDatumMany(self, LatLon):
+
+        lats, lons = (51.4778, 52.65798), (-0.0016, 1.71605)
+        for d1, d2 in ((Datums.WGS84, Datums.OSGB36),
+                       (Datums.OSGB36, Datums.WGS84),
+                       (Datums.OSGB36, Datums.ED50)):
+            as_, bs, hs = convertDatum_many(lats, lons, d2, datum=d1, heights=(0, 10))
+            for i in range(2):
+                p = LatLon(lats[i], lons[i], height=(0, 10)[i], datum=d1).convertDatum(d2)
+                self.test('convertDatum_many', fStr((as_[i], bs[i], hs[i]), prec=9),
+                                               fStr((p.lat, p.lon, p.height), prec=9))
+        as_, bs, hs = convertDatum_many(lats, lons, Datums.WGS84)
+        self.test('convertDatum_many', as_ == list(lats), 'True')
+
+        # composed OSGB36 to ED50 via WGS84 and back
+        p = LatLon(51.4778, -0.0016, datum=Datums.OSGB36)
+        q = p.convertDatum(Datums.ED50).convertDatum(Datums.OSGB36)
+        self.test('convertDatum', fStr((q.lat, q.lon), prec=6), '51.4778, -0.0016')
+        q = p.convertDatum(Datums.WGS84).convertDatum(Datums.ED50)
+        self.test('convertDatum', q.toStr(prec=6), p.convertDatum(Datums.ED50).toStr(prec=6))
+
+    def testTo3Many(self, LatLon, Cartesian):
+
+        lats, lons, hs = (51.4778, -33.8688, 90, -90, 0), (-0.0016, 151.2093, 0, 0, 45), (0, 100, 0, 10, 0)
+        for d in (Datums.WGS84, Datums.OSGB36):
+            xyz = to3xyz_many(lats, lons, datum=d, heights=hs)
+            for i in range(len(lats)):
+                t = LatLon(lats[i], lons[i], height=hs[i], datum=d).to3xyz()
+                self.test('to3xyz_many', fStr(xyz[i], prec=6), fStr(t, prec=6))
+            as_, bs, hs_ = to3llh_many(xyz, datum=d)
+            for i in range(len(lats)):
+                t = Cartesian(*xyz[i]).to3llh(datum=d)
+                self.test('to3llh_many', fStr((as_[i], bs[i], hs_[i]), prec=9), fStr(t, prec=9))
+            self.test('to3llh_many', fStr(as_ + bs, prec=6), fStr(lats + lons, prec=6))
+
+        as_, bs, hs_ = to3llh_many(((0, 0, 6356762.3), (0, 0, 0), (6378137, 0, 0)))
+        self.test('to3llh_many', fStr(as_ + bs, prec=1), '90.0, 90.0, 0.0, 0.0, 0.0, 0.0')
+        self.test('to3llh_many', fStr(hs_, prec=1), '10.0, -6356752.3, 0.0')
+
 
 if __name__ == '__main__':
 
@@ -53,5 +109,10 @@ if __name__ == '__main__':
 
     t = Tests(__file__, __version__, datum)
     t.testDatum()
+    t.testTransformMany()
+
+    from pygeodesy.ellipsoidalVincenty import Cartesian, LatLon
+    t.testConvertDatumMany(LatLon)
+    t.testTo3Many(LatLon, Cartesian)
     t.results()
     t.exit()
@@ -0,0 +1,79 @@
+
+# -*- coding: utf-8 -*-
+
+# Test the distanceMatrix function.
+
+__all__ = ('Tests',)
+__version__ = '17.04.15'
+
+from tests import Tests as _Tests
+
+from pygeodesy import distanceMatrix, fStr
+
+from array import array
+
+
+def _fStr(ds):
+    return ' | '.join(fStr(d, prec=3) for d in ds)
+
+
+class Tests(_Tests):
+
+    def testDistanceMatrix(self, LatLon, method, **kwds):
+
+        ps = [LatLon(52.205, 0.119), LatLon(48.857, 2.351),
+              LatLon(50.06632, -5.71475), LatLon(58.64402, -3.07009),
+              LatLon(-37.95103, 144.42487)]
+        n = len(ps)
+
+        ds = distanceMatrix(ps, method=method, chunk=2, **kwds)
+        e = max(abs(ds[i][j] - ps[i].distanceTo(ps[j]))
+                for i in range(n) for j in range(n) if i != j)
+        self.test(method, e < 1e-6, 'True')
+        self.test(method, fStr([ds[i][i] for i in range(n)], prec=1), '0.0, 0.0, 0.0, 0.0, 0.0')
+        self.test(method, ds[1][3] == ds[3][1], 'True')
+
+        qs = ps[1:3]
+        es = distanceMatrix(ps, qs, method=method, chunk=3, processes=2, **kwds)
+        self.test(method, len(es), str(n))
+        self.test(method, _fStr(es), _fStr(d[1:3] for d in ds))
+
+        out = [array('d', [0] * len(qs)) for _ in range(n)]
+        es = distanceMatrix(ps, qs, method=method, out=out, **kwds)
+        self.test(method, es is out, 'True')
+        self.test(method, _fStr(es), _fStr(d[1:3] for d in ds))
+
+        try:
+            distanceMatrix(ps, method='cosine')
+            t = None
+        except ValueError as x:
+            t = x
+        self.test(method, t, "method invalid: 'cosine'")
+
+    def testVincentyErrors(self, LatLon):
+
+        ps = [LatLon(0, 0), LatLon(0.5, 179.7), LatLon(0, 0), LatLon(1, 1)]
+        for p in (0, 2):
+            xs = {}
+            ds = distanceMatrix(ps, method='vincenty', chunk=2, processes=p, errors=xs)
+            self.test('vincenty', sorted(xs.keys()), '[(0, 1), (1, 0), (1, 2), (2, 1)]')
+            self.test('vincenty', ds[0][1] != ds[0][1], 'True')  # NaN
+            self.test('vincenty', ds[0][2], '0.0')  # coincident
+            self.test('vincenty', fStr(ds[0][3], prec=3), fStr(ps[0].distanceTo(ps[3]), prec=3))
+            self.test('vincenty', xs[1, 0], 'no convergence (0.5, 179.7) to (0.0, 0.0)')
+
+
+if __name__ == '__main__':
+
+    from pygeodesy import distmatrix, Datums
+    from pygeodesy.ellipsoidalVincenty import LatLon as vLatLon
+    from pygeodesy.sphericalNvector import LatLon as nLatLon
+    from pygeodesy.sphericalTrigonometry import LatLon as tLatLon
+
+    t = Tests(__file__, __version__, distmatrix)
+    t.testDistanceMatrix(tLatLon, 'haversine')
+    t.testDistanceMatrix(nLatLon, 'nvector')
+    t.testDistanceMatrix(vLatLon, 'vincenty', datum=Datums.WGS84)
+    t.testVincentyErrors(vLatLon)
+    t.results()
+    t.exit()
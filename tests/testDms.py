@@ -8,8 +8,14 @@ __version__ = '17.04.07'
 
 from tests import Tests as _Tests
 
-from pygeodesy import F_D, F_DM, F_DMS, \
-                      compassPoint, parse3llh, parseDMS, toDMS
+try:
+    from StringIO import StringIO
+except ImportError:  # Python 3+
+    from io import StringIO
+
+from pygeodesy import F_D, F_DM, F_DMS, F_RAD, \
+                      compassPoint, parse3llh, parse3llh_many, \
+                      parseDMS, parseDMS_many, latDMS, lonDMS, toDMS, toDMS_many
 
 
 class Tests(_Tests):
@@ -54,6 +60,37 @@ class Tests(_Tests):
                      ((237, 3), 'WSW')):
             self.test('compassPoint', compassPoint(*a), x)
 
+    def testDmsMany(self):
+
+        ds, xs = parseDMS_many(('51.4778', '''51°28'40.12"N''', '51 28 40.12 S',
+                                "-3° 37' 09\"", '3°37′09″W', '12.5E', 'N', '45°X'))
+        self.test('parseDMS_many', ', '.join('%.6f' % d for d in ds[:6]),
+                                   '51.477800, 51.477811, -51.477811, -3.619167, -3.619167, 12.500000')
+        self.test('parseDMS_many', ds[6:], '[None, None]')
+        self.test('parseDMS_many', sorted(xs.keys()), '[6, 7]')
+        self.test('parseDMS_many', xs[7], "parsing '45°X' failed")
+
+        ds, xs = parseDMS_many(('12.5E', '12.5N', None), suffix='NS')
+        self.test('parseDMS_many', ds, '[None, 12.5, None]')
+        self.test('parseDMS_many', xs[2], "parsing None failed")
+
+        as_, bs, hs, xs = parse3llh_many(('000° 00′ 05.31″W, 51° 28′ 40.12″ N',
+                                          '51.4778N, 0.0015W, 10m', '51.4778'))
+        self.test('parse3llh_many', '%.6f, %.6f, %s' % (as_[0], bs[0], hs[0]), '51.477811, -0.001475, 0')
+        self.test('parse3llh_many', '%.4f, %.4f, %s' % (as_[1], bs[1], hs[1]), '51.4778, -0.0015, 10.0')
+        self.test('parse3llh_many', as_[2:] + list(xs.keys()), '[None, 2]')
+        self.test('parse3llh_many', xs[2], "parsing '51.4778' failed")
+
+        ds = (45.7626, -0.0015, 0, -179.99999)
+        for a in ((), (F_D, None), (F_DM, -4), (F_DMS, 0), (F_RAD, 3), (F_D, 6, 3)):
+            self.test('toDMS_many', toDMS_many(ds, *a), str([toDMS(d, *a) for d in ds]))
+        self.test('toDMS_many', toDMS_many(ds, neg='', suffix='NS'), str([latDMS(d) for d in ds]))
+        self.test('toDMS_many', toDMS_many(ds, F_DM, 4, 3, neg='', suffix='EW'), str([lonDMS(d, F_DM, 4) for d in ds]))
+
+        f = StringIO()
+        self.test('toDMS_many', toDMS_many(ds[:2], F_D, neg='', suffix='NS', file=f, sep=';'), '2')
+        self.test('toDMS_many', f.getvalue(), '45.76°N;00.0°S;')
+
 
 if __name__ == '__main__':
 
@@ -61,5 +98,6 @@ if __name__ == '__main__':
 
     t = Tests(__file__, __version__, dms)
     t.testDms()
+    t.testDmsMany()
     t.results()
     t.exit()
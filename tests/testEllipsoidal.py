@@ -162,6 +162,32 @@ class Tests(_Tests):
         m = p.distanceTo(q)
         self.test('distanceToKW' + n, '%.3f' % m, '111319.491')
 
+    def testDistances(self, distances, LatLon):
+        # batch Vincenty inverse versus LatLon.distanceTo3
+        a1, b1 = (50.06632, 52.205, 37.95103, 41.49008), (-5.71475, 0.119, 144.42487, -71.312796)
+        a2, b2 = (58.64402, 48.857, 37.65280, 41.49008), (-3.07009, 2.351, 143.9265,  -71.312796)
+        ds, fs, rs, xs = distances(a1, b1, a2, b2)
+        for i in range(3):
+            t = LatLon(a1[i], b1[i]).distanceTo3(LatLon(a2[i], b2[i]))
+            self.test('distances[%s]' % (i,), fStr((ds[i], fs[i], rs[i]), prec=6), fStr(t, prec=6))
+        self.test('distances[3]', (ds[3], fs[3], rs[3]), '(None, None, None)')
+        self.test('distances[3]', xs.get(3), '3 coincident')
+
+        ds, _, _, xs = distances(0, 50, 0, (52, 49))  # broadcast
+        self.test('distances', fStr(ds, prec=3), '222638.982, 111319.491')
+        self.test('distances', len(xs), '0')
+
+    def testDestinations(self, destinations, LatLon):
+        # batch Vincenty direct versus LatLon.destination2
+        p = LatLon(-37.95103, 144.42487)
+        ds, bs = (54972.271, 1000, 0), (306.86816, 90, 45)
+        as_, bs_, rs, xs = destinations(p.lat, p.lon, ds, bs)
+        for i in range(3):
+            d, r = p.destination2(ds[i], bs[i])
+            self.test('destinations[%s]' % (i,), fStr((as_[i], bs_[i], rs[i]), prec=6),
+                                                 fStr((d.lat, d.lon, r), prec=6))
+        self.test('destinations', len(xs), '0')
+
     def testNOAA(self, LatLon):
         # <https://www.ngs.noaa.gov/PC_PROD/Inv_Fwd/readme.htm>
 
@@ -207,5 +233,7 @@ if __name__ == '__main__':
     for d in (Datums.WGS84, Datums.NAD83,):  # Datums.Sphere):
         t.testVincenty(V.LatLon, d)
     t.testNOAA(V.LatLon)
+    t.testDistances(V.distances, V.LatLon)
+    t.testDestinations(V.destinations, V.LatLon)
     t.results()
     t.exit()
@@ -8,7 +8,14 @@ __version__ = '17.04.07'
 
 from tests import Tests as _Tests
 
-from pygeodesy import F_D, F_DMS, Conic, Conics, Datums, Lcc, toLcc
+from pygeodesy import F_D, F_DMS, Conic, Conics, Datum, Datums, \
+                      Ellipsoids, Lcc, Transforms, fStr, \
+                      toLatLonGrid, toLcc
+
+import os
+import shutil
+import sys
+import tempfile
 
 
 class Tests(_Tests):
@@ -60,6 +67,62 @@ class Tests(_Tests):
                     self.test(n, ll, str(ll_))
                     self.test(n, ll.datum.name, ll_.datum.name)
 
+    def testConicMany(self, LatLon):
+
+        c = Conics.Fr93Lb
+        es, ns = c.forward((46.5, 48.8582, 43.6), 3)
+        self.test('forward', fStr(es[:1] + ns[:1], prec=3), '700000.0, 6600000.0')
+        for i, a in enumerate((48.8582, 43.6)):
+            lb = toLcc(LatLon(a, 3, datum=c.datum), conic=c)
+            self.test('forward', fStr((es[i + 1], ns[i + 1]), prec=3), fStr((lb.easting, lb.northing), prec=3))
+
+        lats, lons = c.reverse(es, ns)
+        self.test('reverse', fStr(lats, prec=9), '46.5, 48.8582, 43.6')
+        self.test('reverse', fStr(lons, prec=9), '3.0, 3.0, 3.0')
+
+        lats, lons = Snyder.reverse(1894410.9, 1564649.5)
+        ll = Lcc(1894410.9, 1564649.5, conic=Snyder).toLatLon(LatLon)
+        self.test('reverse', fStr(lats + lons, prec=12), fStr((ll.lat, ll.lon), prec=12))
+
+    def testLatLonGrid(self):
+
+        c = Conics.WRF_Lb
+        g = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (3, 4), conic=c)
+        self.test('toLatLonGrid', g, 'len=12, datum=WGS84')
+        lats, lons = c.reverse((-2700e3, -2664e3, -2688e3), (-1600e3, -1600e3, -1576e3))
+        self.test('toLatLonGrid', fStr((g.lats[0], g.lats[3], g.lats[9]), prec=9), fStr(lats, prec=9))
+        self.test('toLatLonGrid', fStr((g.lons[0], g.lons[3], g.lons[9]), prec=9), fStr(lons, prec=9))
+        g.lats[0] = 99  # cached grid unchanged
+        h = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (3, 4), conic=c)
+        self.test('toLatLonGrid', h is g, 'False')
+        self.test('toLatLonGrid', fStr(h.lats[0], prec=9), fStr(lats[0], prec=9))
+
+        # same ellipsoid, other datum
+        d = c.toDatum(Datum(Ellipsoids.WGS84, Transforms.WGS72, name='WGS84_72'))
+        h = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (3, 4), conic=d)
+        self.test('toLatLonGrid', h.datum is d.datum, 'True')
+
+        d = tempfile.mkdtemp()
+        try:
+            h = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (4, 3), conic=c, cache=d)
+            self.test('toLatLonGrid', len(os.listdir(d)), '1')
+            # clear the memory cache to force loading the file
+            del sys.modules[toLatLonGrid.__module__]._Grids[:]
+            g = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (4, 3), conic=c, cache=d)
+            self.test('toLatLonGrid', g is h, 'False')
+            self.test('toLatLonGrid', g.lats == h.lats and g.lons == h.lons, 'True')
+        finally:
+            shutil.rmtree(d)
+        # file cache errors ignored
+        g = toLatLonGrid((-2700e3, -1600e3), (12e3, 12e3), (2, 2), conic=c, cache=d)
+        self.test('toLatLonGrid', g, 'len=4, datum=WGS84')
+
+        try:
+            t = toLatLonGrid((0, 0), (1, 1), (0, 4))
+        except ValueError as x:
+            t = x
+        self.test('toLatLonGrid', t, 'shape invalid: (0, 4)')
+
 
 if __name__ == '__main__':
 
@@ -76,5 +139,7 @@ if __name__ == '__main__':
     t.testLcc(vLatLon)
     t.testConic(vLatLon, 1)
     t.testConic(nLatLon, 2)
+    t.testConicMany(vLatLon)
+    t.testLatLonGrid()
     t.results()
     t.exit()
@@ -8,7 +8,7 @@ __version__ = '17.04.07'
 
 from tests import Tests as _Tests
 
-from pygeodesy import mgrs
+from pygeodesy import fStr, mgrs
 
 
 class Tests(_Tests):
@@ -45,6 +45,68 @@ class Tests(_Tests):
             m = p.toUtm().toMgrs()
             self.test('toUtm(%s).toMgrs' % (p,), m, x)
 
+    def testMgrsMany(self, LatLon):
+
+        lats = (48.8582, 13.4125, -13.4125, 60.0, 85.0)
+        lons = (2.2945, 103.8667, -103.8667, 1.0, 0.0)
+        ms, xs = mgrs.toMgrs_many(lats, lons)
+        self.test('toMgrs_many', ms, "['31U DQ 48251 11932', '48P UV 77302 83034', '13L FF 22697 16965', '31V CG 88455 53097', None]")
+        self.test('toMgrs_many', xs[4], 'lat outside UTM: 85.0')
+        ms, xs = mgrs.toMgrs_many(lats[:2], lons[:2], prec=6, sep='')
+        self.test('toMgrs_many', ms, "['31UDQ482119', '48PUV773830']")
+        try:
+            t = mgrs.toMgrs_many(lats, lons, prec=12)
+        except ValueError as x:
+            t = x
+        self.test('toMgrs_many', t, 'prec invalid: 12')
+
+        ms = ('31U DQ 48251 11932', '31UDQ4825111932', '13L FF 22697 16965',
+              '31U IQ 48251 11932', '99U DQ 48251 11932', '31U')
+        as_, bs, xs = mgrs.parseMGRS_many(ms)
+        for i in range(3):
+            ll = mgrs.parseMGRS(ms[i]).toUtm().toLatLon(LatLon)
+            self.test('parseMGRS_many', fStr((as_[i], bs[i]), prec=9), fStr((ll.lat, ll.lon), prec=9))
+        self.test('parseMGRS_many', xs[3], "en100k invalid: 'IQ'")
+        self.test('parseMGRS_many', xs[4], "zone invalid: '99U'")
+        self.test('parseMGRS_many', xs[5], "strMGRS invalid: '31U'")
+        self.test('parseMGRS_many', as_[3:], '[None, None, None]')
+
+    def testMgrsCells(self):
+
+        m = mgrs.Mgrs('31U', 'DQ', 48251, 11932)
+        c = m.toCell(prec=6)
+        self.test('toCell', mgrs.cellStr(c), '31U DQ 482 119')
+        self.test('toCell', mgrs.cellStr(m.toCell(prec=0), sep=''), '31UDQ')
+        self.test('toCell', c.bit_length() < 58, 'True')
+        self.test('cellMgrs', mgrs.cellMgrs(c), '31U DQ 48200 11900')
+        self.test('cellParent', mgrs.cellStr(mgrs.cellParent(c)), '31U DQ 48 11')
+        cs = mgrs.cellChildren(c)
+        self.test('cellChildren', len(cs), '100')
+        self.test('cellChildren', mgrs.cellStr(cs[11]), '31U DQ 4821 1191')
+        self.test('cellChildren', mgrs.cellParent(cs[99]) == c, 'True')
+        cs = mgrs.cellNeighbours(c)
+        self.test('cellNeighbours', ', '.join(map(mgrs.cellStr, cs[:3])), '31U DQ 482 120, 31U DQ 483 120, 31U DQ 483 119')
+
+        # across the equator and the west edge of the grid
+        cs, xs = mgrs.toMgrsCells((0.0001, 48.8582, 85), (9.0, 2.2945, 0), prec=4)
+        self.test('toMgrsCells', mgrs.cellStr(cs[0]), '32N NF 00 00')
+        self.test('toMgrsCells', cs[1] == m.toCell(prec=4), 'True')
+        self.test('toMgrsCells', xs[2], 'lat outside UTM: 85')
+        self.test('cellNeighbours', mgrs.cellStr(mgrs.cellNeighbours(cs[0])[4]), '32M NE 00 99')
+        cs = mgrs.cellNeighbours(mgrs.Mgrs('31U', 'AQ', 100, 500).toCell(prec=4))
+        self.test('cellNeighbours', cs[5:], '[None, None, None]')
+
+        try:
+            t = mgrs.cellParent(m.toCell(prec=0))
+        except ValueError as x:
+            t = x
+        self.test('cellParent', str(t).split(':')[0], 'cell no parent')
+        try:
+            t = mgrs.cellStr(-1)
+        except ValueError as x:
+            t = x
+        self.test('cellStr', t, 'cell invalid: -1')
+
 
 if __name__ == '__main__':
 
@@ -52,5 +114,7 @@ if __name__ == '__main__':
 
     t = Tests(__file__, __version__, mgrs)
     t.testMgrs(ellipsoidalVincenty.LatLon)
+    t.testMgrsMany(ellipsoidalVincenty.LatLon)
+    t.testMgrsCells()
     t.results()
     t.exit()
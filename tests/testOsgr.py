@@ -8,7 +8,7 @@ __version__ = '17.04.07'
 
 from tests import Tests as _Tests
 
-from pygeodesy import F_DMS, Datums, osgr
+from pygeodesy import F_DMS, Datums, fStr, osgr
 
 
 class Tests(_Tests):
@@ -71,6 +71,39 @@ class Tests(_Tests):
         r = osgr.parseOSGR(g.toStr(prec=-3))
         self.test('OSGR6', r.toStr(prec=0), '651409,313177')
 
+    def testOsgrMany(self, LatLon):
+
+        lats = (52.65798, 51.4778, 58.6, 40.0)
+        lons = (1.71605, -0.0016, -3.07, 3.0)
+        es, ns, xs = osgr.toOsgr_many(lats, lons)
+        for i in range(3):
+            r = osgr.toOsgr(LatLon(lats[i], lons[i]))
+            self.test('toOsgr_many', fStr((es[i], ns[i]), prec=3), fStr((r.easting, r.northing), prec=3))
+        self.test('toOsgr_many', es[3], 'None')
+        self.test('toOsgr_many', str(xs[3]).split(':')[0], 'northing invalid')
+        es, ns, xs = osgr.toOsgr_many(52.65757, 1.71791, datum=Datums.OSGB36)
+        self.test('toOsgr_many', fStr(es + ns, prec=0), '651409, 313177')
+
+        as_, bs, xs = osgr.osgr_toLatLon_many((651409.903, 538876.213, -1), (313177.270, 177320.117, 1))
+        p = osgr.Osgr(538876.213, 177320.117).toLatLon(LatLon)
+        self.test('osgr_toLatLon_many', fStr((as_[1], bs[1]), prec=8), fStr((p.lat, p.lon), prec=8))
+        self.test('osgr_toLatLon_many', xs[2], 'easting invalid: -1')
+        as_, bs, xs = osgr.osgr_toLatLon_many(651409.903, 313177.270, datum=Datums.OSGB36)
+        self.test('osgr_toLatLon_many', fStr(as_ + bs, prec=6), '52.65757, 1.718713')
+
+        ts, xs = osgr.osgr_toStr_many((651409.903, 538876.213, 800e3), (313177.270, 177320.117, 1))
+        self.test('osgr_toStr_many', ts, "['TG 51409 13177', 'TQ 38876 77320', None]")
+        self.test('osgr_toStr_many', xs[2], 'grid invalid: (8, 0)')
+        ts, xs = osgr.osgr_toStr_many(651409.903, 313177.270, prec=4, sep='')
+        self.test('osgr_toStr_many', ts, "['TG5113']")
+
+        es, ns, xs = osgr.parseOSGR_many(('TG 51409 13177', 'TG5140913177', 'TQ 388 773',
+                                          '651409,313177', 'XX 1 1', 'TG 1 2 3'))
+        self.test('parseOSGR_many', fStr(es[:4], prec=0), '651409, 651409, 538800, 651409')
+        self.test('parseOSGR_many', fStr(ns[:4], prec=0), '313177, 313177, 177300, 313177')
+        self.test('parseOSGR_many', xs[4], "strOSGR invalid: 'XX 1 1'")
+        self.test('parseOSGR_many', xs[5], "strOSGR invalid: 'TG 1 2 3'")
+
 
 if __name__ == '__main__':
 
@@ -78,5 +111,6 @@ if __name__ == '__main__':
 
     t = Tests(__file__, __version__, osgr)
     t.testOSgr(ellipsoidalNvector.LatLon)
+    t.testOsgrMany(ellipsoidalNvector.LatLon)
     t.results()
     t.exit()
@@ -0,0 +1,63 @@
+
+# -*- coding: utf-8 -*-
+
+# Test the LatLonArray class.
+
+__all__ = ('Tests',)
+__version__ = '17.04.15'
+
+from tests import Tests as _Tests
+
+from pygeodesy import Datums, LatLon_, LatLonArray, \
+                      distanceMatrix, fStr, simplifyRDP
+
+from array import array
+
+
+class Tests(_Tests):
+
+    def testLatLonArray(self, LatLon, distances):
+
+        lats = array('d', (52.205, 48.857, 50.06632, 58.64402))
+        lons = array('d', (0.119, 2.351, -5.71475, -3.07009))
+        a = LatLonArray(lats, lons, datum=Datums.WGS84)
+        self.test('LatLonArray', a, 'len=4, datum=WGS84')
+        self.test('LatLonArray', repr(a), 'LatLonArray(len=4, datum=WGS84)')
+        self.test('len', len(a), '4')
+        self.test('lats', a.lats is lats, 'True')  # shared
+        self.test('heights', a.heights, 'None')
+        self.test('[1]', repr(a[1]), 'LatLon_(48.857°N, 002.351°E)')
+        self.test('[-1]', a[-1], '58.64402°N, 003.07009°W')
+        self.test('[1:3]', a[1:3], 'len=2, datum=WGS84')
+        self.test('[::2]', fStr(a[::2].lons, prec=3), '0.119, -5.715')
+        self.test('iter', ', '.join(str(p.lat) for p in a), '52.205, 48.857, 50.06632, 58.64402')
+        self.test('==', a[2] == LatLon_(50.06632, -5.71475), 'True')
+
+        b = LatLonArray((1, 2), [3, 4], heights=(5, 6))
+        self.test('heights', fStr(b.heights, prec=1), '5.0, 6.0')
+        self.test('height', b[1].height, '6.0')
+        try:
+            t = LatLonArray((1, 2), (3,))
+        except ValueError as x:
+            t = x
+        self.test('LatLonArray', t, 'unequal len: 2 vs 1')
+
+        # hand-off to other functions
+        ps = a.toLatLons(LatLon, datum=a.datum)
+        self.test('toLatLons', ps[3], '58.64402°N, 003.07009°W')
+        ds, _, _, _ = distances(a.lats[:-1], a.lons[:-1], a.lats[1:], a.lons[1:], datum=a.datum)
+        self.test('distances', fStr(ds, prec=3), fStr([ps[i].distanceTo(ps[i + 1]) for i in range(3)], prec=3))
+        ds = distanceMatrix(a, a[:2], method='vincenty', datum=a.datum)
+        self.test('distanceMatrix', fStr(ds[3], prec=3), fStr([ps[3].distanceTo(p) for p in ps[:2]], prec=3))
+        self.test('simplifyRDP', simplifyRDP(a, 1)[-1], '58.64402°N, 003.07009°W')
+
+
+if __name__ == '__main__':
+
+    from pygeodesy import points
+    from pygeodesy.ellipsoidalVincenty import LatLon, distances
+
+    t = Tests(__file__, __version__, points)
+    t.testLatLonArray(LatLon, distances)
+    t.results()
+    t.exit()
@@ -8,7 +8,8 @@ __version__ = '17.04.15'
 
 from tests import secs2str, Tests as _Tests
 
-from pygeodesy import simplify1, simplify2, \
+from pygeodesy import isimplify1, isimplify2, isimplifyRDP, \
+                      simplify1, simplify2, \
                       simplifyRDP, simplifyRDPm, \
                       simplifyVW, simplifyVWm
 
@@ -38,6 +39,18 @@ class Tests(_Tests):
 
         self.printf('')
 
+    def testStream(self, isimplify, simplify, points, m, **kwds):
+
+        if _Simplifys and simplify.__name__[8:] not in _Simplifys:
+            return  # skip this simplify function
+
+        n = len(points)
+        t = ', '.join('%s=%s' % t for t in sorted(kwds.items()))
+        t = '%s(%s, %dm, %s)' % (isimplify.__name__, n, m, t)
+        r = list(isimplify(iter(points), m, **kwds))
+        kwds.pop('window', None)
+        self.test(t, r == simplify(points, m, **kwds), 'True')
+
 
 if __name__ == '__main__':  # PYCHOK internal error?
 
@@ -78,6 +91,18 @@ if __name__ == '__main__':  # PYCHOK internal error?
     t.test2(simplifyRDP, Ptsn, _ms({320: 1605, 160: 1616, 80: 1630, 40: 1638, 20: 1647, 10: 1654, 1: 1660}), adjust=True, shortest=False)
     t.test2(simplifyRDP, Ptsn, _ms({320: 1605, 160: 1616, 80: 1631, 40: 1639, 20: 1649, 10: 1655, 1: 1661}), adjust=True, shortest=True)
 
+    # streaming versus list
+    t.testStream(isimplify1, simplify1, Pts, 10, adjust=True)
+    t.testStream(isimplify2, simplify2, Pts, 10, adjust=True, shortest=False)
+    t.testStream(isimplify2, simplify2, Pts, 10, adjust=True, shortest=True)
+    t.testStream(isimplifyRDP, simplifyRDP, Ptsn, 10, adjust=True, window=n + 1)
+    t.test('isimplifyRDP', len(list(isimplifyRDP(iter(Pts), 1000, window=500))), '13653')
+    t.printf('')
+
+    # too short paths
+    t.test2(simplifyVW,  Pts[:2], _ms({1: 2}), adjust=True)
+    t.test2(simplifyVWm, Pts[:1], _ms({1: 1}), adjust=True)
+
     # different points
     t.test2(simplifyVW,  PtsFFI, _ms({1678:  2, 1000:  3, 100: 18, 10: 63, 1: 69}), adjust=False)
     t.test2(simplifyRDP, PtsFFI, _ms({1678: 11, 1000: 31, 100: 61, 10: 67, 1: 68}), adjust=False, shortest=False)  # XXX len(RdpFFI) = 7
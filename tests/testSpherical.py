@@ -56,6 +56,44 @@ class Tests(_Tests):
         m = p.rhumbMidpointTo(q)
         self.test('rhumbMidpointo', m, '51.0455°N, 001.595727°E')  # 51.0455°N, 001.5957°E
 
+    def testPreparedPolygon(self, LatLon, PreparedPolygon):
+        b = LatLon(45, 1), LatLon(45, 2), LatLon(46, 2), LatLon(46, 1)
+        for pp in (PreparedPolygon(b), PreparedPolygon(reversed(b))):
+            self.test('PreparedPolygon', len(pp), '4')
+            self.test('contains', pp.contains(45.1, 1.1), 'True')
+            self.test('contains', pp.contains(44.9, 1.1), 'False')
+            self.test('contains', pp.contains(-45.5, -178.5), 'False')  # antipode
+            self.test('contains_many', pp.contains_many((45.5, 46.5, 45.5), (1.5, 1.5, 2.5)), '[True, False, False]')
+        self.test('isEnclosedBy', LatLon(45.5, 1.5).isEnclosedBy(pp), 'True')
+
+        pp = PreparedPolygon((LatLon(10, 170), LatLon(10, -170), LatLon(20, -175)))  # antimeridian
+        self.test('contains', pp.contains_many((12, 12, 12), (179.5, -179.5, 160)), '[True, True, False]')
+        pp = PreparedPolygon((LatLon(80, 0), LatLon(80, 120), LatLon(80, -120)))  # pole
+        self.test('contains', pp.contains_many((90, 85, 85, 79), (0, 60, -150, 0)), '[True, True, True, False]')
+
+        try:
+            t = PreparedPolygon((LatLon(0, 0), LatLon(0, 2), LatLon(1, 1), LatLon(2, 2), LatLon(2, 0)))
+        except ValueError as x:
+            t = str(x).split(':')[0]
+        self.test('PreparedPolygon', t, 'non-convex')
+
+    def testNvectorTree(self, LatLon, NvectorTree):
+        # grid incl poles and antimeridian versus brute force distanceTo
+        ps = [LatLon(a, b) for a in range(-90, 91, 15) for b in range(-180, 180, 20)]
+        t = NvectorTree(((p.lat, p.lon) for p in ps), leafsize=4)
+        self.test('NvectorTree', len(t), str(len(ps)))
+
+        for q in (LatLon(1, 179.5), LatLon(-2, -179.5), LatLon(89.5, 45), LatLon(-88, -100)):
+            ds = sorted((q.distanceTo(p), i) for i, p in enumerate(ps))
+            n = t.nearest(q, k=5)
+            self.test('nearest', [i for _, i in n], str([i for _, i in ds[:5]]))
+            self.test('nearest', max(abs(d - e) for (d, _), (e, _) in zip(n, ds)) < 1e-3, 'True')
+            w = t.within(q, 2500e3)
+            self.test('within', sorted(i for _, i in w), str(sorted(i for d, i in ds if d <= 2500e3)))
+
+        self.test('nearest', t.nearest(LatLon(0, 0), k=0), '[]')
+        self.test('within', len(t.within(LatLon(0, 0), 1e9)), str(len(ps)))
+
 
 if __name__ == '__main__':
 
@@ -64,11 +102,13 @@ if __name__ == '__main__':
     t.testLatLon(N.LatLon)
     t.testSpherical(N.LatLon)
     t.testVectorial(N.LatLon, N.Nvector, N.sumOf)
+    t.testNvectorTree(N.LatLon, N.NvectorTree)
     t.results()
 
     from pygeodesy import sphericalTrigonometry as T
     t = Tests(__file__, __version__, T)
     t.testLatLon(T.LatLon)
     t.testSpherical(T.LatLon)
+    t.testPreparedPolygon(T.LatLon, T.PreparedPolygon)
     t.results()
     t.exit()
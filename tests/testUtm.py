@@ -8,7 +8,7 @@ __version__ = '17.04.07'
 
 from tests import Tests as _Tests
 
-from pygeodesy import F_DMS, utm
+from pygeodesy import F_DMS, fStr, utm
 
 
 class Tests(_Tests):
@@ -25,6 +25,7 @@ class Tests(_Tests):
         ll = u.toLatLon(LatLon)  # 48.85820000°N, 002.29450000°E
         self.test('Utm.toLatLon1', ll, '48.8582°N, 002.2945°E')
         self.test('Utm.toLatLon1', ll.toStr(form=F_DMS),  '48°51′29.52″N, 002°17′40.2″E')
+        self.test('Utm.toLatLon1', type(ll) is LatLon, 'True')
 
         u = ll.toUtm()  # 31U N 448251.795205746 5411932.67761691
         self.test('toUtm1', u, '31 N 448252 5411933')
@@ -83,6 +84,64 @@ class Tests(_Tests):
                     x = u = str(e)
             self.test('toUtm(%s)' % (p,), u, x)
 
+    def testUtmMany(self, LatLon):
+        lats = (48.8582, 13.4125, -13.4125, 60.0, 76.0, 85.0)
+        lons = (2.2945, 103.8667, -103.8667, 3.0, 19.0, 0.0)
+        zs, hs, Bs, es, ns, cs, ks, xs = utm.toUtm_many(lats, lons)
+        self.test('toUtm_many', zs, '[31, 48, 13, 32, 33, None]')
+        self.test('toUtm_many', ''.join(hs[:5] + Bs[:5]), 'NNSNNUPLVX')
+        self.test('toUtm_many', xs[5], 'lat outside UTM: 85.0')
+        for i in range(5):
+            u = utm.toUtm(LatLon(lats[i], lons[i]))
+            self.test('toUtm_many', '%.6f %.6f %.8f %.8f' % (es[i], ns[i], cs[i], ks[i]),
+                                    '%.6f %.6f %.8f %.8f' % (u.easting, u.northing, u.convergence, u.scale))
+        us, xs = utm.toUtm_many(lats[:2], lons[:2], utms=True)
+        self.test('toUtm_many', us[1].toStr(prec=6, B=True, cs=True), '48P N 377302.354183 1483034.777084 -000.26291348° 0.99978623')
+        self.test('toUtm_many', xs, '{}')
+
+        # round trip, including a coordinate on which
+        # Utm.toLatLon used to loop forever
+        as_, bs, cs, ks, xs = utm.utm_toLatLon_many(zs[:5] + [53], hs[:5] + ['S'],
+                                                    es[:5] + [744904.8125121482], ns[:5] + [2949134.2139229923])
+        self.test('utm_toLatLon_many', fStr(as_[:5], prec=8), fStr(lats[:5], prec=8))
+        self.test('utm_toLatLon_many', fStr(bs[:5], prec=8), fStr(lons[:5], prec=8))
+        ll = utm.Utm(53, 'S', 744904.8125121482, 2949134.2139229923).toLatLon(LatLon)
+        self.test('utm_toLatLon_many', '%.8f %.8f %.8f %.8f' % (as_[5], bs[5], cs[5], ks[5]),
+                                       '%.8f %.8f %.8f %.8f' % (ll.lat, ll.lon, ll.convergence, ll.scale))
+        self.test('utm_toLatLon_many', xs, '{}')
+        ll = utm.Utm(21, 'N', 678106.0160183943, 5463731.576981496).toLatLon(LatLon)
+        self.test('Utm.toLatLon', '%.8f %.8f' % (ll.lat, ll.lon), '49.30033873 -54.55007095')
+
+        as_, bs, cs, ks, xs = utm.utm_toLatLon_many(31, 'N', (448251.795, 1), 5411932.678)
+        self.test('utm_toLatLon_many', fStr(as_[:1] + bs[:1], prec=4), '48.8582, 2.2945')
+        self.test('utm_toLatLon_many', xs[1], 'easting invalid: 1')
+        xs = utm.utm_toLatLon_many((31, 61), ('N', 'X'), 448251.795, 5411932.678)[-1]
+        self.test('utm_toLatLon_many', xs[1], "zone invalid: 61")
+
+    def testUtmProjector(self, LatLon):
+        P = utm.UtmProjector(31)
+        self.test('UtmProjector', P, 'zone=31, datum=WGS84')
+        e, n, c, k = P.forward(48.8582, 2.2945)
+        u = utm.toUtm(LatLon(48.8582, 2.2945))
+        self.test('forward', '%.6f %.6f %.8f %.8f' % (e, n, c, k),
+                             '%.6f %.6f %.8f %.8f' % (u.easting, u.northing, u.convergence, u.scale))
+        a, b, c, k = P.reverse(e, n, 'N')
+        ll = u.toLatLon(LatLon)
+        self.test('reverse', '%.8f %.8f %.8f %.8f' % (a, b, c, k),
+                             '%.8f %.8f %.8f %.8f' % (ll.lat, ll.lon, ll.convergence, ll.scale))
+        P = utm.UtmProjector('13L')
+        e, n, _, _ = P.forward(-13.4125, -103.8667)
+        self.test('forward', '%.3f %.3f' % (e, n), '622697.646 8516965.223')
+        a, b, _, _ = P.reverse(e, n, 'S')
+        self.test('reverse', fStr((a, b), prec=4), '-13.4125, -103.8667')
+
+        self.test('_projector', utm._projector(31, P.datum) is utm._projector(31, P.datum), 'True')
+        try:
+            t = utm.UtmProjector(0)
+        except ValueError as x:
+            t = x
+        self.test('UtmProjector', t, 'zone invalid: 0')
+
 
 if __name__ == '__main__':
 
@@ -90,5 +149,7 @@ if __name__ == '__main__':
 
     t = Tests(__file__, __version__, utm)
     t.testUtm(ellipsoidalVincenty.LatLon)
+    t.testUtmMany(ellipsoidalVincenty.LatLon)
+    t.testUtmProjector(ellipsoidalVincenty.LatLon)
     t.results()
     t.exit()
@@ -233,6 +233,46 @@ class Tests(object):
             c = ', '.join(str(c)[8:-2] for c in m.LatLon.mro()[:-1])
             self.test(m.__name__, c, c)  # passes always
 
+    def testLazyImport(self, pygeodesy):
+        # check the lazily imported against the public names
+        # and which sub-modules are imported, in a new process
+        self.title('lazy import', pygeodesy.__version__)
+        for m, ns in pygeodesy._lazy_lifted:
+            self.test('_lazy_lifted.' + m, ns == getattr(pygeodesy, m).__all__, 'True')
+
+        if sys.version_info[:2] < (3, 7):
+            return  # eager, see PEP 562
+
+        from ast import literal_eval
+        from os import environ, pathsep
+        from subprocess import PIPE, Popen
+
+        def _run(lazy, code):
+            e = dict(environ)
+            e.pop('PYGEODESY_LAZY_IMPORT', None)
+            if lazy:
+                e['PYGEODESY_LAZY_IMPORT'] = '1'
+            # import the same pygeodesy as this process
+            e['PYTHONPATH'] = pathsep.join([dirname(dirname(pygeodesy.__file__))] +
+                                           e.get('PYTHONPATH', '').split(pathsep)).rstrip(pathsep)
+            c = 'import sys; import pygeodesy as p; ' + code
+            p = Popen([sys.executable, '-c', c], env=e, stdout=PIPE, stderr=PIPE)
+            r, x = p.communicate()
+            if p.returncode:
+                return 'exit %s: %s' % (p.returncode, x.decode('utf-8').strip())
+            return literal_eval(r.decode('utf-8'))
+
+        c = 'print(repr(p.__all__))'
+        self.test('__all__', _run(True,  c) == pygeodesy.__all__, 'True')
+        self.test('__all__', _run(False, c) == pygeodesy.__all__, 'True')
+
+        m = "print(repr(sorted(set(('datum', 'lcc', 'mgrs', 'utm', " \
+            "'ellipsoidalVincenty')).intersection(sys.modules))))"
+        self.test('import', _run(True, m), '[]')
+        self.test('import', _run(True, 'p.toUtm; ' + m), "['datum', 'utm']")
+        self.test('import', _run(True, 'p.Conics; ' + m), "['datum', 'lcc']")
+        self.test('import', _run(True, 'p.ellipsoidalVincenty.LatLon; ' + m), "['datum', 'ellipsoidalVincenty']")
+
     def testModule(self, m, name=''):
         # check that __all__ names exist in module m
         self.title(m.__file__, m.__version__)
@@ -317,9 +357,9 @@ class Tests(object):
 
 if __name__ == '__main__':
 
-    from pygeodesy import datum, dms, \
+    from pygeodesy import datum, distmatrix, dms, \
                           ellipsoidalNvector, ellipsoidalVincenty, \
-                          lcc, mgrs, nvector, osgr, simplify, \
+                          lcc, mgrs, nvector, osgr, points, simplify, \
                           sphericalNvector, sphericalTrigonometry, \
                           vector3d, utm, utils  # PYCHOK expected
     import pygeodesy  # PYCHOK expected
@@ -327,13 +367,14 @@ if __name__ == '__main__':
     t = Tests(__file__, __version__)
     # check that __all__ names exist in each module
     t.testModule(pygeodesy, 'pygeodesy')
-    for m in (datum, dms,
+    for m in (datum, distmatrix, dms,
               ellipsoidalNvector, ellipsoidalVincenty,
-              lcc, mgrs, nvector, osgr, simplify,
+              lcc, mgrs, nvector, osgr, points, simplify,
               sphericalNvector, sphericalTrigonometry,
               vector3d, utm, utils):
         t.testModule(m)
     t.testLatLonAttr(ellipsoidalNvector, ellipsoidalVincenty,
                      sphericalNvector, sphericalTrigonometry)
+    t.testLazyImport(pygeodesy)
     t.results(nl=1)
     t.exit()